@@ -0,0 +1,89 @@
+# ======================================================
+# ANALYSIS RESULT - MEMOIZED PER-ANALYSIS BUNDLE
+# Keyed on (Resume Hash, JD Hash, Engine Version) | LRU
+# ======================================================
+
+import hashlib
+from collections import namedtuple
+from types import MappingProxyType
+
+from lru_store import LRUStore
+
+
+AnalysisResult = namedtuple("AnalysisResult", [
+    "key",
+    "resume_clean", "jd_clean",
+    "quality", "sections",
+    "resume_skills", "jd_skills",
+    "matched", "missing", "skill_score",
+])
+AnalysisResult.__doc__ = """
+Everything derived from one (resume, JD) pair that does not depend on
+the recruiter weights. Immutable: lists are tuples, dicts are read-only
+views, so a cached bundle can be shared by every session.
+"""
+
+
+def text_key(text):
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def analysis_key(engine, resume_text, jd_text):
+    return (text_key(resume_text), text_key(jd_text), engine.version)
+
+
+def compute_analysis(engine, resume_text, jd_text, sections=None, key=None):
+    """
+    Run the per-pair pipeline once: cleaning, quality, sections and skill
+    matching. `sections` may come from the document cache.
+    """
+    resume_clean = engine.clean_text(resume_text)
+    jd_clean = engine.clean_text(jd_text)
+    # Skills match on the raw text: cleaning drops short tokens ("ML")
+    # and lemmatizes aliases ("pandas" -> "panda")
+    resume_skills = engine.extract_skills(resume_text)
+    jd_skills = engine.extract_skills(jd_text)
+    matched = engine.matched_skills(resume_skills, jd_skills, resume_text)
+    # Same formula as engine.skill_match_score, without matching twice
+    skill_score = (min(len(matched) / len(set(jd_skills)) * 100, 100.0)
+                   if jd_skills else 0.0)
+    return AnalysisResult(
+        key=key or analysis_key(engine, resume_text, jd_text),
+        resume_clean=resume_clean,
+        jd_clean=jd_clean,
+        quality=MappingProxyType(dict(engine.analyze_quality(resume_text))),
+        sections=MappingProxyType(dict(
+            sections or engine.extract_sections(resume_text)
+        )),
+        resume_skills=tuple(resume_skills),
+        jd_skills=tuple(jd_skills),
+        matched=tuple(matched),
+        missing=tuple(sorted(set(jd_skills) - set(matched))),
+        skill_score=float(skill_score),
+    )
+
+
+class AnalysisCache(LRUStore):
+    """
+    Process-wide LRU of AnalysisResult bundles, shared across sessions
+    (the same resume analysed against the same JD is computed once).
+    """
+
+    def __init__(self, max_entries=64):
+        super().__init__(max_entries)
+
+    def put(self, result):
+        super().put(result.key, result)
+
+    def analyze(self, engine, resume_text, jd_text, sections=None, key=None):
+        """Cached AnalysisResult for the pair; computed only on a miss."""
+        key = key or analysis_key(engine, resume_text, jd_text)
+        result = self.get(key)
+        if result is None:
+            result = compute_analysis(engine, resume_text, jd_text,
+                                      sections=sections, key=key)
+            self.put(result)
+        return result
+
+    def clear(self):
+        self.clear_memory()
@@ -99,6 +99,79 @@ def skill_gap_chart(matched_count, missing_count):
     return fig
 
 
+# ------------------------------------------------------
+# COHORT CHARTS (bulk intake)
+# ------------------------------------------------------
+
+def cohort_gap_chart(gap_table, top_n=15):
+    """Most-missing JD skills across the cohort (from SkillMatrix.gap_table)."""
+    top = gap_table.head(top_n).iloc[::-1]
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        y=top["skill"], x=top["covered"], orientation="h", name="Have",
+        marker=dict(color="#16a34a", line=dict(color=_BG, width=1)),
+    ))
+    fig.add_trace(go.Bar(
+        y=top["skill"], x=top["missing"], orientation="h", name="Missing",
+        marker=dict(color="#c8401a", line=dict(color=_BG, width=1)),
+        text=[f"{100 - c:.0f}%" for c in top["coverage"]],
+        textposition="inside",
+        textfont=dict(family="Plus Jakarta Sans", size=11, color="#fff"),
+    ))
+    fig.update_layout(
+        barmode="stack",
+        paper_bgcolor=_BG, plot_bgcolor=_PLOT, font=_FONT, margin=_MARGIN,
+        hoverlabel=_HOVER,
+        title=dict(text="Cohort Skill Gaps", font=_TITLE_FONT, x=0),
+        xaxis=dict(showgrid=True, gridcolor=_GRID, zeroline=False,
+                   title="Candidates", tickfont=dict(color="#7a7065")),
+        yaxis=dict(showgrid=False, tickfont=dict(family="Plus Jakarta Sans",
+                   size=12, color="#3c3631", weight=700)),
+        height=max(320, 28 * len(top) + 120),
+        legend=dict(orientation="h", x=0.5, xanchor="center", y=-0.12,
+                    font=dict(family="Plus Jakarta Sans", size=12, color="#5a4a40")),
+    )
+    return fig
+
+
+def cohort_cooccurrence_chart(skills, counts):
+    """Heatmap of how often pairs of skills appear on the same resume."""
+    fig = go.Figure(data=[go.Heatmap(
+        z=counts, x=skills, y=skills,
+        colorscale=[[0, _PLOT], [0.5, "#f3b49f"], [1, "#c8401a"]],
+        hovertemplate="%{y} + %{x}: %{z} candidates<extra></extra>",
+        showscale=False,
+    )])
+    fig.update_layout(
+        paper_bgcolor=_BG, plot_bgcolor=_PLOT, font=_FONT, margin=_MARGIN,
+        hoverlabel=_HOVER,
+        title=dict(text="Skill Co-occurrence", font=_TITLE_FONT, x=0),
+        xaxis=dict(tickangle=-40, tickfont=dict(size=10, color="#5a4a40")),
+        yaxis=dict(autorange="reversed", tickfont=dict(size=10, color="#5a4a40")),
+        height=max(360, 22 * len(skills) + 160),
+    )
+    return fig
+
+
+def cohort_coverage_chart(coverage):
+    """Distribution of per-candidate JD skill coverage (0..1 values)."""
+    fig = go.Figure(data=[go.Histogram(
+        x=[c * 100 for c in coverage], xbins=dict(start=0, end=100, size=10),
+        marker=dict(color="#1a4fc8", line=dict(color=_BG, width=2)),
+    )])
+    fig.update_layout(
+        paper_bgcolor=_BG, plot_bgcolor=_PLOT, font=_FONT, margin=_MARGIN,
+        hoverlabel=_HOVER,
+        title=dict(text="JD Skill Coverage per Candidate", font=_TITLE_FONT, x=0),
+        xaxis=dict(range=[0, 100], ticksuffix="%", showgrid=False,
+                   tickfont=dict(color="#7a7065"), linecolor=_GRID),
+        yaxis=dict(showgrid=True, gridcolor=_GRID, zeroline=False,
+                   title="Candidates", tickfont=dict(color="#7a7065")),
+        height=340, bargap=0.08,
+    )
+    return fig
+
+
 def recruiter_readiness(semantic, keyword, skill_score, quality_score, weights):
     composite = (
         weights["semantic"] * semantic +
@@ -9,18 +9,24 @@ import time
 from header import load_header
 from footer import load_footer
 from upload import render_upload_page
-from dashboard import render_dashboard
+from dashboard import render_dashboard, render_score_counter
 from skills import render_skills_page
 from diagnostics import render_diagnostics
 
-from ats_engine import clean_text
+from ats_engine import ScoringEngine
+from document_cache import DocumentCache
+from analysis_result import AnalysisCache, analysis_key
+from lazy_tabs import LazyTabs, tab_payload
+from config import (
+    DOCUMENT_CACHE_SIZE, DOCUMENT_CACHE_DIR, DOCUMENT_CACHE_DISK_ENTRIES,
+    ANALYSIS_CACHE_SIZE,
+    RECRUITER_WEIGHTS
+)
 from analytics import (
     score_breakdown_chart, radar_chart,
     skill_gap_chart, recruiter_readiness
 )
 from report_generator import generate_pdf_report
-from section_analyzer import extract_sections
-from quality_analyzer import analyze_quality
 
 
 def generate_executive_summary(semantic, keyword, skill, quality, readiness):
@@ -57,6 +63,27 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
+# ── Shared scoring engine (one per server process) ───
+@st.cache_resource
+def load_engine():
+    return ScoringEngine().warmup()
+
+
+@st.cache_resource
+def load_document_cache():
+    return DocumentCache(DOCUMENT_CACHE_SIZE, DOCUMENT_CACHE_DIR,
+                         DOCUMENT_CACHE_DISK_ENTRIES)
+
+
+@st.cache_resource
+def load_analysis_cache():
+    return AnalysisCache(ANALYSIS_CACHE_SIZE)
+
+
+engine = load_engine()
+documents = load_document_cache()
+analyses = load_analysis_cache()
+
 # ── Session state ──────────────────────────────────────
 for k, v in [("initialized", False), ("generated_pdf", None),
              ("show_export_modal", False), ("download_complete", False)]:
@@ -250,12 +277,14 @@ if not st.session_state.initialized:
 
 
 # ── Tabs ───────────────────────────────────────────────
-tab_upload, tab_dashboard, tab_skills, tab_analytics, tab_diagnostics, tab_export = st.tabs([
+# Only the open tab executes on a rerun (see lazy_tabs.py)
+TAB_UPLOAD, TAB_DASHBOARD, TAB_SKILLS, TAB_ANALYTICS, TAB_DIAGNOSTICS, TAB_EXPORT = (
     "📤 Upload", "📊 Dashboard", "🎯 Skills",
     "📈 Analytics", "🔍 Diagnostics", "📄 Export"
-])
-with tab_upload:
-    render_upload_page()
+)
+tabs = LazyTabs([TAB_UPLOAD, TAB_DASHBOARD, TAB_SKILLS,
+                 TAB_ANALYTICS, TAB_DIAGNOSTICS, TAB_EXPORT])
+tabs.render(TAB_UPLOAD, render_upload_page, engine, documents)
 
 
 def render_locked():
@@ -314,9 +343,8 @@ def accent_label(text, color="#1a4fc8"):
 # ══════════════════════════════════════════════════════
 
 if not st.session_state.initialized:
-    for _t in [tab_dashboard, tab_skills, tab_analytics, tab_diagnostics, tab_export]:
-        with _t:
-            render_locked()
+    for _t in [TAB_DASHBOARD, TAB_SKILLS, TAB_ANALYTICS, TAB_DIAGNOSTICS, TAB_EXPORT]:
+        tabs.render(_t, render_locked)
 
 else:
     semantic, keyword, final = map(float, st.session_state.scores)
@@ -324,204 +352,227 @@ else:
     keyword  = max(0.0, min(keyword,  100.0))
     final    = max(0.0, min(final,    100.0))
 
-    resume_text  = st.session_state.resume_text
-    jd_text      = st.session_state.jd_text
-    resume_clean = clean_text(resume_text)
-    jd_clean     = clean_text(jd_text)
-
-    quality_data = analyze_quality(resume_text)
-    sections     = extract_sections(resume_text)
-
-    from skills import extract_skills, skill_match_score
-    resume_skills = extract_skills(resume_clean)
-    jd_skills     = extract_skills(jd_clean)
-    skill_score   = skill_match_score(resume_skills, jd_skills)
-
-    # ── DASHBOARD ──────────────────────────────────────
-    with tab_dashboard:
-        section_head("Overview", "Executive", "Dashboard",
-                     "Comprehensive ATS performance overview")
-        ph = st.empty()
-        for i in range(int(final) + 1):
-            ph.metric("Final ATS Score", f"{i}%",
-                      delta=f"+{i-50}%" if i > 50 else None)
-            time.sleep(0.002)
-        st.markdown("<br>", unsafe_allow_html=True)
-        render_dashboard(semantic, keyword, final,
-                         skill_score=skill_score,
-                         quality_score=quality_data["quality_score"],
-                         sections=sections)
-
-    # ── SKILLS ─────────────────────────────────────────
-    with tab_skills:
-        section_head("Skills Intelligence", "Skills", "Analysis",
-                     "Detailed skill matching and gap analysis")
-        render_skills_page(resume_clean, jd_clean)
-
-    # ── ANALYTICS ──────────────────────────────────────
-    with tab_analytics:
-        section_head("Deep Analysis", "Advanced", "Analytics",
-                     "Interactive recruiter simulation and performance insights")
-
-        accent_label("Recruiter Weight Simulation", "#1a4fc8")
-        col1, col2, col3, col4 = st.columns(4)
-        weights = {
-            "semantic": col1.slider("Semantic", 0.0, 1.0, 0.35, key="sem_s"),
-            "keyword":  col2.slider("Keyword",  0.0, 1.0, 0.30, key="key_s"),
-            "skill":    col3.slider("Skill",    0.0, 1.0, 0.20, key="ski_s"),
-            "quality":  col4.slider("Quality",  0.0, 1.0, 0.15, key="qua_s"),
-        }
+    # Weight-independent analysis: computed once per (resume, JD, engine),
+    # so slider reruns only pay for recruiter_readiness
+    resume_text = st.session_state.resume_text
+    jd_text     = st.session_state.jd_text
+    key         = analysis_key(engine, resume_text, jd_text)
+    analysis    = st.session_state.get("analysis")
+    if analysis is None or analysis.key != key:
+        analysis = analyses.analyze(
+            engine, resume_text, jd_text,
+            sections=st.session_state.get("resume_sections"), key=key)
+        st.session_state.analysis = analysis
+
+    resume_clean  = analysis.resume_clean
+    jd_clean      = analysis.jd_clean
+    quality_data  = analysis.quality
+    sections      = analysis.sections
+    matched       = list(analysis.matched)
+    missing       = list(analysis.missing)
+    skill_score   = analysis.skill_score
+
+    if "recruiter_weights" not in st.session_state:
+        st.session_state.recruiter_weights = dict(RECRUITER_WEIGHTS)
+
+    def simulated_readiness():
+        weights = dict(st.session_state.recruiter_weights)
         total = sum(weights.values())
         if total > 0:
             for k in weights: weights[k] /= total
-
-        readiness = float(max(0, min(
+        return float(max(0, min(
             recruiter_readiness(semantic, keyword, skill_score,
                                 quality_data["quality_score"], weights), 100)))
 
-        st.markdown("<br>", unsafe_allow_html=True)
-        ca, cb = st.columns([2, 1])
-        with ca: st.metric("Simulated Recruiter Score", f"{readiness:.1f}%")
-        with cb: st.progress(readiness / 100)
-
-        st.divider()
-        c1, c2 = st.columns(2)
-        with c1: st.plotly_chart(score_breakdown_chart(semantic, keyword, final),
-                                 use_container_width=True)
-        with c2: st.plotly_chart(radar_chart({
-            "Semantic": semantic, "Keyword": keyword,
-            "Skill": skill_score, "Quality": quality_data["quality_score"]
-        }), use_container_width=True)
-
-        st.divider()
-        st.plotly_chart(skill_gap_chart(
-            len(set(resume_skills) & set(jd_skills)),
-            len(set(jd_skills) - set(resume_skills))
-        ), use_container_width=True)
-        st.divider()
-
-        accent_label("AI Executive Summary", "#c8401a")
-        s = generate_executive_summary(semantic, keyword, skill_score,
-                                       quality_data["quality_score"], readiness)
-        components.html(f"""<!DOCTYPE html><html><head>
-        <link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@700;900&family=Plus+Jakarta+Sans:wght@400;500;700;800&display=swap" rel="stylesheet">
-        <style>
-        *,*::before,*::after{{box-sizing:border-box;margin:0;padding:0;}}
-        body{{background:transparent;font-family:'Plus Jakarta Sans',sans-serif;}}
-        .card{{background:{s['bg']};border:1px solid {s['border']};
-               border-left:5px solid {s['color']};padding:1.5rem 1.75rem;}}
-        .tier{{font-size:0.62rem;font-weight:800;letter-spacing:0.18em;
-               text-transform:uppercase;color:{s['color']};margin-bottom:0.6rem;}}
-        .verdict{{font-family:'Playfair Display',serif;font-size:1.45rem;font-weight:700;
-                  color:#1e1a16;margin-bottom:0.65rem;line-height:1.2;}}
-        .stats{{font-size:0.83rem;color:#5a5248;line-height:1.8;}}
-        .stats strong{{color:#1e1a16;font-weight:700;}}
-        .sl{{margin-top:0.5rem;font-size:0.9rem;font-weight:800;color:{s['color']};}}
-        </style></head><body>
-        <div class="card">
-            <div class="tier">{s['tier']}</div>
-            <div class="verdict">{s['verdict']}</div>
-            <div class="stats">
-                Semantic: <strong>{s['semantic']:.1f}%</strong> &nbsp;&bull;&nbsp;
-                Keyword: <strong>{s['keyword']:.1f}%</strong> &nbsp;&bull;&nbsp;
-                Skills: <strong>{s['skill']:.1f}%</strong> &nbsp;&bull;&nbsp;
-                Quality: <strong>{s['quality']:.1f}%</strong>
-                <div class="sl">Recruiter Score: {s['readiness']:.1f}%</div>
-            </div>
-        </div></body></html>""", height=190, scrolling=False)
+    # ── DASHBOARD ──────────────────────────────────────
+    if tabs.is_open(TAB_DASHBOARD):
+        with tabs[TAB_DASHBOARD]:
+            section_head("Overview", "Executive", "Dashboard",
+                         "Comprehensive ATS performance overview")
+            render_score_counter(final)
+            st.markdown("<br>", unsafe_allow_html=True)
+            render_dashboard(semantic, keyword, final,
+                             skill_score=skill_score,
+                             quality_score=quality_data["quality_score"],
+                             sections=sections)
+
+    # ── SKILLS ─────────────────────────────────────────
+    if tabs.is_open(TAB_SKILLS):
+        with tabs[TAB_SKILLS]:
+            section_head("Skills Intelligence", "Skills", "Analysis",
+                         "Detailed skill matching and gap analysis")
+            render_skills_page(resume_text, jd_text,
+                               matched=matched, skill_score=skill_score,
+                               resume_skills=analysis.resume_skills,
+                               jd_skills=analysis.jd_skills)
+
+    # ── ANALYTICS ──────────────────────────────────────
+    if tabs.is_open(TAB_ANALYTICS):
+        with tabs[TAB_ANALYTICS]:
+            section_head("Deep Analysis", "Advanced", "Analytics",
+                         "Interactive recruiter simulation and performance insights")
+
+            accent_label("Recruiter Weight Simulation", "#1a4fc8")
+            # Slider state is dropped while the tab is hidden; restore it
+            saved = st.session_state.recruiter_weights
+            col1, col2, col3, col4 = st.columns(4)
+            st.session_state.recruiter_weights = {
+                "semantic": col1.slider("Semantic", 0.0, 1.0, saved["semantic"], key="sem_s"),
+                "keyword":  col2.slider("Keyword",  0.0, 1.0, saved["keyword"],  key="key_s"),
+                "skill":    col3.slider("Skill",    0.0, 1.0, saved["skill"],    key="ski_s"),
+                "quality":  col4.slider("Quality",  0.0, 1.0, saved["quality"],  key="qua_s"),
+            }
+            readiness = simulated_readiness()
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            ca, cb = st.columns([2, 1])
+            with ca: st.metric("Simulated Recruiter Score", f"{readiness:.1f}%")
+            with cb: st.progress(readiness / 100)
+
+            # Figures depend only on the analysis, not on the weights
+            inputs = (analysis.key, semantic, keyword, final)
+            st.divider()
+            c1, c2 = st.columns(2)
+            with c1: st.plotly_chart(tab_payload(
+                "score_breakdown", inputs,
+                lambda: score_breakdown_chart(semantic, keyword, final)
+            ), use_container_width=True)
+            with c2: st.plotly_chart(tab_payload("radar", inputs, lambda: radar_chart({
+                "Semantic": semantic, "Keyword": keyword,
+                "Skill": skill_score, "Quality": quality_data["quality_score"]
+            })), use_container_width=True)
+
+            st.divider()
+            st.plotly_chart(tab_payload("skill_gap", inputs, lambda: skill_gap_chart(
+                len(matched),
+                len(missing)
+            )), use_container_width=True)
+            st.divider()
+
+            accent_label("AI Executive Summary", "#c8401a")
+            s = generate_executive_summary(semantic, keyword, skill_score,
+                                           quality_data["quality_score"], readiness)
+            components.html(f"""<!DOCTYPE html><html><head>
+            <link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@700;900&family=Plus+Jakarta+Sans:wght@400;500;700;800&display=swap" rel="stylesheet">
+            <style>
+            *,*::before,*::after{{box-sizing:border-box;margin:0;padding:0;}}
+            body{{background:transparent;font-family:'Plus Jakarta Sans',sans-serif;}}
+            .card{{background:{s['bg']};border:1px solid {s['border']};
+                   border-left:5px solid {s['color']};padding:1.5rem 1.75rem;}}
+            .tier{{font-size:0.62rem;font-weight:800;letter-spacing:0.18em;
+                   text-transform:uppercase;color:{s['color']};margin-bottom:0.6rem;}}
+            .verdict{{font-family:'Playfair Display',serif;font-size:1.45rem;font-weight:700;
+                      color:#1e1a16;margin-bottom:0.65rem;line-height:1.2;}}
+            .stats{{font-size:0.83rem;color:#5a5248;line-height:1.8;}}
+            .stats strong{{color:#1e1a16;font-weight:700;}}
+            .sl{{margin-top:0.5rem;font-size:0.9rem;font-weight:800;color:{s['color']};}}
+            </style></head><body>
+            <div class="card">
+                <div class="tier">{s['tier']}</div>
+                <div class="verdict">{s['verdict']}</div>
+                <div class="stats">
+                    Semantic: <strong>{s['semantic']:.1f}%</strong> &nbsp;&bull;&nbsp;
+                    Keyword: <strong>{s['keyword']:.1f}%</strong> &nbsp;&bull;&nbsp;
+                    Skills: <strong>{s['skill']:.1f}%</strong> &nbsp;&bull;&nbsp;
+                    Quality: <strong>{s['quality']:.1f}%</strong>
+                    <div class="sl">Recruiter Score: {s['readiness']:.1f}%</div>
+                </div>
+            </div></body></html>""", height=190, scrolling=False)
 
     # ── DIAGNOSTICS ────────────────────────────────────
-    with tab_diagnostics:
-        section_head("Structural Audit", "Deep", "Diagnostics",
-                     "Comprehensive resume structure and quality analysis")
-        render_diagnostics(sections=sections, quality_data=quality_data,
-                           keyword_score=keyword)
+    if tabs.is_open(TAB_DIAGNOSTICS):
+        with tabs[TAB_DIAGNOSTICS]:
+            section_head("Structural Audit", "Deep", "Diagnostics",
+                         "Comprehensive resume structure and quality analysis")
+            render_diagnostics(sections=sections, quality_data=quality_data,
+                               keyword_score=keyword)
 
     # ── EXPORT ─────────────────────────────────────────
-    with tab_export:
-        section_head("Report Generator", "Professional", "Export",
-                     "Generate and download your comprehensive ATS intelligence report")
-
-        components.html(f"""<!DOCTYPE html><html><head>
-        <link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@700;900&family=Plus+Jakarta+Sans:wght@400;600;700;800&display=swap" rel="stylesheet">
-        <style>
-        *,*::before,*::after{{box-sizing:border-box;margin:0;padding:0;}}
-        body{{background:transparent;font-family:'Plus Jakarta Sans',sans-serif;}}
-        .ec{{background:#fdfcf7;border:1px solid rgba(30,26,22,0.10);
-             border-left:5px solid #1a4fc8;padding:1.4rem 1.6rem;
-             display:flex;justify-content:space-between;align-items:center;
-             flex-wrap:wrap;gap:1.25rem;margin-bottom:1rem;}}
-        .et{{font-family:'Playfair Display',serif;font-size:1.15rem;font-weight:900;
-             color:#1e1a16;letter-spacing:-0.01em;margin-bottom:4px;}}
-        .es{{font-size:0.78rem;color:#7a7065;font-weight:500;}}
-        .sr{{display:flex;gap:1rem;flex-wrap:wrap;}}
-        .st{{text-align:center;padding:0.6rem 1rem;background:#f5f2ea;
-             border:1px solid rgba(30,26,22,0.09);}}
-        .sv{{font-family:'Playfair Display',serif;font-size:1.4rem;font-weight:900;color:#1e1a16;}}
-        .sl{{font-size:0.56rem;font-weight:800;letter-spacing:0.14em;
-             text-transform:uppercase;color:#9a8e84;}}
-        </style></head><body>
-        <div class="ec">
-            <div>
-                <div class="et">ATS Intelligence Report</div>
-                <div class="es">Comprehensive PDF — scores, skill analysis, diagnostics &amp; recommendations.</div>
-            </div>
-            <div class="sr">
-                <div class="st"><div class="sv">{final:.0f}%</div><div class="sl">ATS Score</div></div>
-                <div class="st"><div class="sv">{skill_score:.0f}%</div><div class="sl">Skill Match</div></div>
-                <div class="st"><div class="sv">{quality_data["quality_score"]:.0f}%</div><div class="sl">Quality</div></div>
-            </div>
-        </div></body></html>""", height=140, scrolling=False)
-
-        _, cc, _ = st.columns([1, 2, 1])
-        with cc:
-            if st.button("Generate Professional PDF Report",
-                         use_container_width=True, type="primary"):
-                with st.spinner("Generating your professional report…"):
-                    pdf_bytes = generate_pdf_report({
-                        "semantic":       semantic,
-                        "keyword":        keyword,
-                        "final":          final,
-                        "skill_score":    skill_score,
-                        "quality_score":  quality_data["quality_score"],
-                        "word_count":     quality_data["word_count"],
-                        "matched_skills": list(set(resume_skills) & set(jd_skills)),
-                        "missing_skills": list(set(jd_skills) - set(resume_skills)),
-                        "sections":       sections,
-                        "readiness":      readiness,
-                    })
-                    if pdf_bytes:
-                        st.session_state.generated_pdf     = pdf_bytes
-                        st.session_state.show_export_modal = True
+    if tabs.is_open(TAB_EXPORT):
+        with tabs[TAB_EXPORT]:
+            section_head("Report Generator", "Professional", "Export",
+                         "Generate and download your comprehensive ATS intelligence report")
+
+            components.html(f"""<!DOCTYPE html><html><head>
+            <link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@700;900&family=Plus+Jakarta+Sans:wght@400;600;700;800&display=swap" rel="stylesheet">
+            <style>
+            *,*::before,*::after{{box-sizing:border-box;margin:0;padding:0;}}
+            body{{background:transparent;font-family:'Plus Jakarta Sans',sans-serif;}}
+            .ec{{background:#fdfcf7;border:1px solid rgba(30,26,22,0.10);
+                 border-left:5px solid #1a4fc8;padding:1.4rem 1.6rem;
+                 display:flex;justify-content:space-between;align-items:center;
+                 flex-wrap:wrap;gap:1.25rem;margin-bottom:1rem;}}
+            .et{{font-family:'Playfair Display',serif;font-size:1.15rem;font-weight:900;
+                 color:#1e1a16;letter-spacing:-0.01em;margin-bottom:4px;}}
+            .es{{font-size:0.78rem;color:#7a7065;font-weight:500;}}
+            .sr{{display:flex;gap:1rem;flex-wrap:wrap;}}
+            .st{{text-align:center;padding:0.6rem 1rem;background:#f5f2ea;
+                 border:1px solid rgba(30,26,22,0.09);}}
+            .sv{{font-family:'Playfair Display',serif;font-size:1.4rem;font-weight:900;color:#1e1a16;}}
+            .sl{{font-size:0.56rem;font-weight:800;letter-spacing:0.14em;
+                 text-transform:uppercase;color:#9a8e84;}}
+            </style></head><body>
+            <div class="ec">
+                <div>
+                    <div class="et">ATS Intelligence Report</div>
+                    <div class="es">Comprehensive PDF — scores, skill analysis, diagnostics &amp; recommendations.</div>
+                </div>
+                <div class="sr">
+                    <div class="st"><div class="sv">{final:.0f}%</div><div class="sl">ATS Score</div></div>
+                    <div class="st"><div class="sv">{skill_score:.0f}%</div><div class="sl">Skill Match</div></div>
+                    <div class="st"><div class="sv">{quality_data["quality_score"]:.0f}%</div><div class="sl">Quality</div></div>
+                </div>
+            </div></body></html>""", height=140, scrolling=False)
+
+            _, cc, _ = st.columns([1, 2, 1])
+            with cc:
+                if st.button("Generate Professional PDF Report",
+                             use_container_width=True, type="primary"):
+                    with st.spinner("Generating your professional report…"):
+                        pdf_bytes = generate_pdf_report({
+                            "semantic":       semantic,
+                            "keyword":        keyword,
+                            "final":          final,
+                            "skill_score":    skill_score,
+                            "quality_score":  quality_data["quality_score"],
+                            "word_count":     quality_data["word_count"],
+                            "matched_skills": matched,
+                            "missing_skills": missing,
+                            "sections":       sections,
+                            "readiness":      simulated_readiness(),
+                        })
+                        if pdf_bytes:
+                            st.session_state.generated_pdf     = pdf_bytes
+                            st.session_state.show_export_modal = True
+                            st.session_state.download_complete = False
+
+            if st.session_state.show_export_modal:
+                @st.dialog("Report Generated Successfully", width="large")
+                def export_modal():
+                    ph2 = st.empty()
+                    for i in range(101):
+                        ph2.progress(i / 100, text=f"Processing… {i}%")
+                        time.sleep(0.01)
+                    st.success("Your professional ATS intelligence report is ready!")
+                    st.download_button(
+                        label="Download PDF Report",
+                        data=st.session_state.generated_pdf,
+                        file_name="Sree_ATS_Professional_Report.pdf",
+                        mime="application/pdf",
+                        use_container_width=True, type="primary",
+                        on_click=lambda: st.session_state.update(download_complete=True)
+                    )
+                    if st.session_state.download_complete:
+                        st.balloons()
+                        st.info("Download initiated successfully!")
+                        time.sleep(2)
+                        st.session_state.show_export_modal = False
                         st.session_state.download_complete = False
-
-        if st.session_state.show_export_modal:
-            @st.dialog("Report Generated Successfully", width="large")
-            def export_modal():
-                ph2 = st.empty()
-                for i in range(101):
-                    ph2.progress(i / 100, text=f"Processing… {i}%")
-                    time.sleep(0.01)
-                st.success("Your professional ATS intelligence report is ready!")
-                st.download_button(
-                    label="Download PDF Report",
-                    data=st.session_state.generated_pdf,
-                    file_name="Sree_ATS_Professional_Report.pdf",
-                    mime="application/pdf",
-                    use_container_width=True, type="primary",
-                    on_click=lambda: st.session_state.update(download_complete=True)
-                )
-                if st.session_state.download_complete:
-                    st.balloons()
-                    st.info("Download initiated successfully!")
-                    time.sleep(2)
-                    st.session_state.show_export_modal = False
-                    st.session_state.download_complete = False
-                    st.rerun()
-                if st.button("Close", use_container_width=True):
-                    st.session_state.show_export_modal = False
-                    st.rerun()
-            export_modal()
+                        st.rerun()
+                    if st.button("Close", use_container_width=True):
+                        st.session_state.show_export_modal = False
+                        st.rerun()
+                export_modal()
 
 
 # ── Footer ─────────────────────────────────────────────
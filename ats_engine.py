@@ -1,122 +1,586 @@
 # ======================================================
 # ATS ENGINE - ENTERPRISE SAFE VERSION
 # Stable | Normalized | Crash-Proof | Optimized
+# Headless: no Streamlit dependency, usable from workers / CLI
 # ======================================================
 
-import re
-import nltk
-import streamlit as st
-
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from sentence_transformers import SentenceTransformer
-from config import SEMANTIC_WEIGHT, KEYWORD_WEIGHT
+import os
+import threading
+import warnings
+
+import numpy as np
+
+from config import (
+    SEMANTIC_WEIGHT, KEYWORD_WEIGHT, MODEL_NAME, ENCODE_BATCH_SIZE,
+    EMBEDDING_CACHE_SIZE, EMBEDDING_CACHE_DIR, EMBEDDING_CACHE_DISK_ROWS,
+    MODEL_MAX_WORDS,
+    SEMANTIC_CHUNKING, CHUNK_POOLING, CHUNK_MAX_WORDS, CHUNK_MAX_WINDOWS,
+    LEMMA_MEMO_SIZE, KEYWORD_INDEX_DIR, KEYWORD_ENGINE,
+    BM25_K1, BM25_B, BM25_DELTA,
+    SEMANTIC_INDEX_DIR, ANN_N_LISTS, ANN_SUBVECTORS, ANN_N_PROBE,
+    INFERENCE_BACKEND, ONNX_MODEL_FILE,
+    SKILL_MATCH_MODE, SEMANTIC_SKILL_THRESHOLD, SKILL_PHRASE_MAX_WORDS,
+    SKILL_VECTORS_DIR
+)
+from embedding_cache import EmbeddingCache
+from text_normalizer import TextNormalizer
+from keyword_index import create_keyword_index, load_keyword_index
+from semantic_index import IVFPQIndex
+from inference_backend import load_sentence_model, backend_cache_tag
+from nltk_resources import (
+    LazyLemmatizer, load_stopwords, timed, startup_timings
+)
+from chunking import clip_words, split_into_windows, pool_similarity
+from skill_analyzer import extract_skills, matched_skills, default_ontology
+from semantic_skills import resume_phrases, load_skill_vectors
+from quality_analyzer import analyze_quality
+from section_analyzer import extract_sections
+
+
+# Bump when a change alters analysis output for the same inputs
+ANALYSIS_VERSION = 5
 
 
 # ------------------------------------------------------
-# SAFE NLTK INITIALIZATION
+# SAFE SCORE NORMALIZER
 # ------------------------------------------------------
 
-@st.cache_resource
-def load_nltk_resources():
-    nltk.download("stopwords", quiet=True)
-    nltk.download("wordnet", quiet=True)
-    nltk.download("omw-1.4", quiet=True)
-    return set(stopwords.words("english")), WordNetLemmatizer()
-
-
-stop_words, lemmatizer = load_nltk_resources()
+def normalize_score(score):
+    """
+    Ensures score is between 0 and 100
+    """
+    return max(0.0, min(score, 100.0))
 
 
 # ------------------------------------------------------
-# CACHE SENTENCE TRANSFORMER MODEL
+# SCORING ENGINE
 # ------------------------------------------------------
 
-@st.cache_resource
-def load_model():
-    return SentenceTransformer("all-MiniLM-L6-v2")
-
+class ScoringEngine:
+    """
+    Owns every heavyweight scoring resource: stopword set, lemmatizer,
+    SentenceTransformer model (on the configured CPU backend) and the
+    TF-IDF vectorizer template.
 
-model = load_model()
+    Resources load lazily on first use, or eagerly via warmup().
+    close() releases them; the engine can be warmed up again afterwards.
+    """
 
+    def __init__(self, model_name=MODEL_NAME,
+                 semantic_weight=SEMANTIC_WEIGHT,
+                 keyword_weight=KEYWORD_WEIGHT,
+                 embedding_cache=None,
+                 chunking=SEMANTIC_CHUNKING,
+                 pooling=CHUNK_POOLING,
+                 keyword_index=None,
+                 keyword_engine=KEYWORD_ENGINE,
+                 semantic_index=None,
+                 backend=INFERENCE_BACKEND,
+                 skill_mode=SKILL_MATCH_MODE):
+        self.model_name = model_name
+        self.backend = backend
+        self.semantic_weight = semantic_weight
+        self.keyword_weight = keyword_weight
+        self.chunking = chunking
+        self.pooling = pooling
+        self.keyword_index = keyword_index
+        self.keyword_engine = keyword_engine
+        self.semantic_index = semantic_index
+        self.skill_mode = skill_mode
+        self.active_backend = None     # backend actually loaded
+        self._owns_embedding_cache = embedding_cache is None
+        self.embedding_cache = (embedding_cache if embedding_cache is not None
+                                else self._new_embedding_cache(backend))
+
+        self._lock = threading.Lock()
+        self._stop_words = None
+        self._lemmatizer = None
+        self._normalizer = None
+        self._model = None
+        self._vectorizer = None
+        self._skill_vectors = None
+
+    # ---------------- LIFECYCLE ----------------
+
+    def warmup(self):
+        """
+        Load the stopwords, the vectorizer template and the model, plus
+        the persisted keyword and semantic indexes when they exist.
+        WordNet stays lazy: it loads on the first lemmatize().
+        """
+        try:
+            self._load_nltk_resources()
+        except LookupError as exc:
+            warnings.warn(f"NLTK stopwords unavailable: {exc}")
+        self._load_vectorizer()
+        self._load_model()
+        if self.keyword_index is None and KEYWORD_INDEX_DIR \
+                and os.path.isdir(KEYWORD_INDEX_DIR):
+            self.keyword_index = load_keyword_index(KEYWORD_INDEX_DIR)
+        if self.semantic_index is None and SEMANTIC_INDEX_DIR \
+                and os.path.isdir(SEMANTIC_INDEX_DIR):
+            self.semantic_index = IVFPQIndex.load(SEMANTIC_INDEX_DIR)
+        if self.skill_mode == "semantic":
+            self.skill_vectors
+        return self
+
+    def close(self):
+        """Release the model and NLP resources."""
+        with self._lock:
+            self._stop_words = None
+            self._lemmatizer = None
+            self._normalizer = None
+            self._model = None
+            self._vectorizer = None
+            self._skill_vectors = None
+        self.embedding_cache.close()
+
+    def __enter__(self):
+        return self.warmup()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def version(self):
+        """Identifies everything that shapes analysis output (cache key)."""
+        backend = self.active_backend or self.backend
+        return (f"{ANALYSIS_VERSION}:{backend_cache_tag(self.model_name, backend)}"
+                f":{self.skill_mode}")
+
+    def startup_timings(self):
+        """Per-stage load times (seconds): import, stopwords, wordnet, model."""
+        return startup_timings()
+
+    # ---------------- RESOURCE LOADERS ----------------
+
+    def _load_nltk_resources(self):
+        with self._lock:
+            if self._stop_words is None:
+                # Local data only; WordNet loads on the first lemmatize()
+                self._stop_words = load_stopwords()
+                self._lemmatizer = LazyLemmatizer()
+                self._normalizer = TextNormalizer(
+                    self._stop_words, self._lemmatizer,
+                    memo_size=LEMMA_MEMO_SIZE
+                )
+        return self._stop_words, self._lemmatizer
+
+    def _new_embedding_cache(self, backend):
+        return EmbeddingCache(
+            backend_cache_tag(self.model_name, backend),
+            max_entries=EMBEDDING_CACHE_SIZE,
+            directory=EMBEDDING_CACHE_DIR,
+            max_disk_rows=EMBEDDING_CACHE_DISK_ROWS,
+        )
+
+    def _load_model(self):
+        with self._lock:
+            if self._model is None:
+                with timed("model"):
+                    self._model, self.active_backend = load_sentence_model(
+                        self.model_name, self.backend, ONNX_MODEL_FILE
+                    )
+                # A fallback (onnx -> torch) must not file its vectors
+                # under the requested backend's namespace
+                tag = backend_cache_tag(self.model_name, self.active_backend)
+                if self.embedding_cache.model_name != tag:
+                    if self._owns_embedding_cache:
+                        self.embedding_cache.close()
+                        self.embedding_cache = self._new_embedding_cache(
+                            self.active_backend
+                        )
+                    else:
+                        warnings.warn(
+                            f"Model loaded on {self.active_backend!r}, but the "
+                            f"embedding cache is tagged "
+                            f"{self.embedding_cache.model_name!r}"
+                        )
+        return self._model
+
+    def _load_vectorizer(self):
+        with self._lock:
+            if self._vectorizer is None:
+                from sklearn.feature_extraction.text import TfidfVectorizer
+                self._vectorizer = TfidfVectorizer()
+        return self._vectorizer
+
+    @property
+    def stop_words(self):
+        return self._load_nltk_resources()[0]
+
+    @property
+    def lemmatizer(self):
+        return self._load_nltk_resources()[1]
+
+    @property
+    def normalizer(self):
+        self._load_nltk_resources()
+        return self._normalizer
+
+    @property
+    def model(self):
+        return self._load_model()
+
+    @property
+    def skill_vectors(self):
+        """Embedding matrix of every ontology skill (built once, then cached on disk)."""
+        if self._skill_vectors is None:
+            model = self.model
+            vectors = load_skill_vectors(
+                default_ontology(), self.embedding_cache.model_name,
+                lambda texts: model.encode(texts, batch_size=ENCODE_BATCH_SIZE),
+                SKILL_VECTORS_DIR
+            )
+            with self._lock:
+                if self._skill_vectors is None:
+                    self._skill_vectors = vectors
+        return self._skill_vectors
+
+    def new_keyword_index(self):
+        """Empty keyword index for the configured engine (tfidf | bm25)."""
+        if self.keyword_engine == "bm25":
+            return create_keyword_index(
+                "bm25", k1=BM25_K1, b=BM25_B, delta=BM25_DELTA
+            )
+        return create_keyword_index(self.keyword_engine)
+
+    def new_vectorizer(self):
+        """Unfitted copy of the vectorizer template (safe across threads)."""
+        from sklearn.base import clone
+        return clone(self._load_vectorizer())
+
+    def encode(self, texts, normalize=False):
+        """Embed texts through the content-addressed embedding cache."""
+        model = self.model             # may re-tag the cache on fallback
+        return self.embedding_cache.encode(
+            model, texts,
+            batch_size=ENCODE_BATCH_SIZE, normalize=normalize
+        )
+
+    def semantic_similarities(self, jd_text, texts):
+        """
+        Cosine similarity (-1..1) of each text to the job description.
+
+        With chunking enabled, every text is split into sentence-aligned
+        windows, all windows of all texts (plus the JD) are embedded in a
+        single batched call and pooled per text. Otherwise each text is
+        clipped to the model window before tokenization.
+        """
+        texts = [t or "" for t in texts]
+        jd_input = clip_words(jd_text, MODEL_MAX_WORDS)
+
+        if not self.chunking:
+            inputs = [jd_input] + [clip_words(t, MODEL_MAX_WORDS) for t in texts]
+            vecs = self.encode(inputs, normalize=True)
+            return vecs[1:] @ vecs[0]
+
+        windows, spans = [], []
+        for t in texts:
+            parts = split_into_windows(t, CHUNK_MAX_WORDS, CHUNK_MAX_WINDOWS)
+            spans.append((len(windows), len(windows) + len(parts)))
+            windows.extend(parts)
+
+        vecs = self.encode([jd_input] + windows, normalize=True)
+        jd_vec, window_vecs = vecs[0], vecs[1:]
+        return np.array([
+            pool_similarity(window_vecs[start:end], jd_vec, self.pooling)
+            for start, end in spans
+        ])
+
+    # ---------------- TEXT CLEANING ----------------
+
+    def clean_text(self, text):
+        return self.normalizer.clean(text)
+
+    def clean_texts(self, texts):
+        """Batch entry point: normalize many documents in one call."""
+        return self.normalizer.clean_batch(texts)
+
+    # ---------------- COMPUTE ATS SCORES ----------------
+
+    def compute_scores(self, resume_text, jd_text):
+
+        if not resume_text or not jd_text:
+            return 0.0, 0.0, 0.0
+
+        clean_resume = self.clean_text(resume_text)
+        clean_jd = self.clean_text(jd_text)
+
+        # ---------------- KEYWORD SCORE ----------------
+        try:
+            keyword_score = float(self.keyword_scores(clean_jd, [clean_resume])[0])
+        except Exception:
+            keyword_score = 0.0
+
+        # ---------------- SEMANTIC SCORE ----------------
+        try:
+            semantic_score = float(
+                self.semantic_similarities(jd_text, [resume_text])[0]
+            ) * 100
+        except Exception:
+            semantic_score = 0.0
+
+        # Normalize individual scores
+        semantic_score = normalize_score(semantic_score)
+        keyword_score = normalize_score(keyword_score)
+
+        # ---------------- FINAL HYBRID SCORE ----------------
+        final_score = (
+            self.semantic_weight * semantic_score +
+            self.keyword_weight * keyword_score
+        )
+
+        final_score = normalize_score(final_score)
+
+        return semantic_score, keyword_score, final_score
+
+    def keyword_scores(self, clean_jd, clean_resumes):
+        """
+        Keyword score (0-100) of each cleaned resume against the cleaned JD.
+
+        With a corpus keyword index attached, IDF (and BM25 length
+        statistics) come from that corpus, so a resume scores the same
+        alone or in any batch. Without one, a batch is indexed on its
+        own, and a single resume gets a two-document TF-IDF fit with the
+        JD under either engine: BM25 over a one-document corpus would
+        give every matched term the lowest IDF.
+        """
+        clean_resumes = list(clean_resumes)
+        if self.keyword_index:
+            scores = self.keyword_index.score_texts(clean_resumes, clean_jd)
+        elif len(clean_resumes) == 1:
+            from sklearn.metrics.pairwise import cosine_similarity
+            matrix = self.new_vectorizer().fit_transform(
+                [clean_resumes[0], clean_jd]
+            )
+            scores = cosine_similarity(matrix[0:1], matrix[1:2])[0]
+        else:
+            scores = (self.new_keyword_index()
+                      .add_documents(clean_resumes).score(clean_jd))
+        return np.clip(np.asarray(scores, dtype=np.float64) * 100, 0.0, 100.0)
+
+    # ---------------- BATCH RANKING ----------------
+
+    def rank_resumes(self, jd_text, resumes, top_k=None):
+        """
+        Score many resumes against one job description in a single pass.
+
+        `resumes` is a list of texts or a {candidate_id: text} mapping.
+        Keyword scores come from one sparse pass (see keyword_scores: the
+        attached corpus index when there is one, so a resume scores the
+        same here as alone), the JD is embedded once and all semantic
+        similarities come from one matrix product.
+        Returns a DataFrame sorted by final score (best first).
+        """
+        import pandas as pd
+
+        ids, texts = _split_resumes(resumes)
+
+        columns = ["candidate", "semantic", "keyword", "skill",
+                   "quality", "final"]
+        if not texts or not jd_text:
+            return pd.DataFrame(columns=["rank"] + columns)
+
+        texts = [t or "" for t in texts]
+        has_text = np.array([bool(t) for t in texts])
+
+        clean_jd = self.clean_text(jd_text)
+        clean_resumes = self.clean_texts(texts)
+
+        # ---------------- KEYWORD SCORES ----------------
+        try:
+            keyword = self.keyword_scores(clean_jd, clean_resumes)
+        except Exception:
+            keyword = np.zeros(len(texts))
+
+        # ---------------- SEMANTIC SCORES ----------------
+        try:
+            semantic = self.semantic_similarities(jd_text, texts) * 100
+        except Exception:
+            semantic = np.zeros(len(texts))
+
+        semantic = np.clip(np.where(has_text, semantic, 0.0), 0.0, 100.0)
+        keyword = np.clip(np.where(has_text, keyword, 0.0), 0.0, 100.0)
+        final = np.clip(
+            self.semantic_weight * semantic + self.keyword_weight * keyword,
+            0.0, 100.0
+        )
+
+        # ---------------- SKILL & QUALITY ----------------
+        jd_skills = self.extract_skills(jd_text)
+        skill = [
+            self.skill_match_score(self.extract_skills(t), jd_skills, t)
+            for t in texts
+        ]
+        quality = [self.analyze_quality(t)["quality_score"] for t in texts]
+
+        table = pd.DataFrame({
+            "candidate": ids,
+            "semantic": semantic,
+            "keyword": keyword,
+            "skill": skill,
+            "quality": quality,
+            "final": final,
+        })
+        table = table.sort_values("final", ascending=False, kind="stable")
+        if top_k is not None:
+            table = table.head(top_k)
+        table = table.reset_index(drop=True)
+        table.insert(0, "rank", np.arange(1, len(table) + 1))
+        return table
+
+    # ---------------- CORPUS KEYWORD INDEX ----------------
+
+    def build_keyword_index(self, resumes, save=False):
+        """
+        Fit a corpus-level keyword index (TF-IDF or BM25, per
+        keyword_engine) over `resumes` (list or {candidate_id: text})
+        and attach it to the engine.
+        """
+        ids, texts = _split_resumes(resumes)
+        self.keyword_index = self.new_keyword_index().add_documents(
+            self.clean_texts(texts), ids
+        )
+        if save:
+            self.keyword_index.save(KEYWORD_INDEX_DIR)
+        return self.keyword_index
+
+    def add_to_keyword_index(self, resumes, save=False):
+        """Incrementally index more resumes."""
+        if self.keyword_index is None:
+            return self.build_keyword_index(resumes, save=save)
+        ids, texts = _split_resumes(resumes)
+        if not isinstance(resumes, dict):
+            ids = None
+        self.keyword_index.add_documents(self.clean_texts(texts), ids)
+        if save:
+            self.keyword_index.save(KEYWORD_INDEX_DIR)
+        return self.keyword_index
+
+    def index_keyword_scores(self, jd_text):
+        """
+        Keyword score (0-100) of every indexed resume against the JD,
+        aligned with keyword_index.doc_ids.
+        """
+        if not self.keyword_index:
+            return np.zeros(0)
+        scores = self.keyword_index.score(self.clean_text(jd_text)) * 100
+        return np.clip(scores, 0.0, 100.0)
+
+    # ---------------- SEMANTIC ANN INDEX ----------------
+
+    def build_semantic_index(self, resumes, save=False):
+        """
+        Embed `resumes` (list or {candidate_id: text}) and build an
+        IVF-PQ index over them for sub-linear "best past applicants"
+        search. Persisted indexes are memory-mapped on load.
+        """
+        ids, texts = _split_resumes(resumes)
+        vectors = self.encode(
+            [clip_words(t, MODEL_MAX_WORDS) for t in texts], normalize=True
+        )
+        n_lists = min(ANN_N_LISTS, max(1, int(np.sqrt(len(texts)))))
+        self.semantic_index = IVFPQIndex(
+            n_lists=n_lists, n_subvectors=ANN_SUBVECTORS, n_probe=ANN_N_PROBE
+        ).add(vectors, ids)
+        if save:
+            self.semantic_index.save(SEMANTIC_INDEX_DIR)
+        return self.semantic_index
+
+    def search_semantic(self, jd_text, k=10):
+        """Top-k (candidate_id, semantic score 0-100) for a JD."""
+        if not self.semantic_index:
+            return []
+        jd_vec = self.encode([clip_words(jd_text, MODEL_MAX_WORDS)],
+                             normalize=True)[0]
+        return [(cid, normalize_score(score * 100))
+                for cid, score in self.semantic_index.search(jd_vec, k)]
+
+    # ---------------- ANALYZERS ----------------
+
+    def extract_skills(self, text):
+        """Canonical skills in raw (uncleaned) text."""
+        return extract_skills(text)
+
+    def semantic_skill_matches(self, resume_text, jd_skills,
+                               threshold=SEMANTIC_SKILL_THRESHOLD):
+        """
+        {jd skill: (cosine, resume phrase)} for JD skills the resume
+        describes without naming ("Plotly dashboards" -> data
+        visualization). Resume phrases are embedded in one batch and
+        scored against the precomputed skill matrix in one product.
+        """
+        phrases = resume_phrases(resume_text, SKILL_PHRASE_MAX_WORDS)
+        if not phrases or not jd_skills:
+            return {}
+        vectors = self.encode(phrases, normalize=True)
+        return self.skill_vectors.match(vectors, phrases, jd_skills, threshold)
+
+    def matched_skills(self, resume_skills, jd_skills, resume_text=None):
+        """
+        JD skills the resume covers. In "semantic" mode, and when the
+        resume text is given, skills still missing are also matched by
+        embedding similarity.
+        """
+        matched = matched_skills(resume_skills, jd_skills)
+        if self.skill_mode == "semantic" and resume_text:
+            missing = [s for s in jd_skills if s not in set(matched)]
+            try:
+                matched = sorted(set(matched) | set(
+                    self.semantic_skill_matches(resume_text, missing)
+                ))
+            except Exception:
+                pass
+        return matched
 
-# ------------------------------------------------------
-# TEXT CLEANING
-# ------------------------------------------------------
+    def skill_match_score(self, resume_skills, jd_skills, resume_text=None):
+        if not jd_skills:
+            return 0.0
+        matched = self.matched_skills(resume_skills, jd_skills, resume_text)
+        return normalize_score(len(matched) / len(set(jd_skills)) * 100)
 
-def clean_text(text):
-    if not text:
-        return ""
+    def analyze_quality(self, text):
+        return analyze_quality(text)
 
-    text = re.sub(r"[^a-zA-Z\s]", " ", text).lower()
-    words = text.split()
+    def extract_sections(self, text):
+        return extract_sections(text)
 
-    cleaned_words = []
-    for w in words:
-        if w not in stop_words and len(w) > 2:
-            try:
-                cleaned_words.append(lemmatizer.lemmatize(w))
-            except Exception:
-                cleaned_words.append(w)
 
-    return " ".join(cleaned_words)
+def _split_resumes(resumes):
+    """(ids, texts) from a list of texts or a {candidate_id: text} mapping."""
+    if isinstance(resumes, dict):
+        return list(resumes.keys()), list(resumes.values())
+    texts = list(resumes)
+    return list(range(len(texts))), texts
 
 
 # ------------------------------------------------------
-# SAFE SCORE NORMALIZER
+# DEFAULT ENGINE (module-level convenience API)
 # ------------------------------------------------------
 
-def normalize_score(score):
+_default_engine = None
+_default_engine_lock = threading.Lock()
+
+
+def get_engine():
     """
-    Ensures score is between 0 and 100
+    Process-wide default engine, created lazily on first use.
     """
-    return max(0.0, min(score, 100.0))
+    global _default_engine
+    with _default_engine_lock:
+        if _default_engine is None:
+            _default_engine = ScoringEngine()
+        return _default_engine
 
 
-# ------------------------------------------------------
-# COMPUTE ATS SCORES
-# ------------------------------------------------------
+def clean_text(text):
+    return get_engine().clean_text(text)
+
 
 def compute_scores(resume_text, jd_text):
+    return get_engine().compute_scores(resume_text, jd_text)
+
 
-    if not resume_text or not jd_text:
-        return 0.0, 0.0, 0.0
-
-    clean_resume = clean_text(resume_text)
-    clean_jd = clean_text(jd_text)
-
-    # ---------------- TF-IDF KEYWORD SCORE ----------------
-    try:
-        vectorizer = TfidfVectorizer()
-        matrix = vectorizer.fit_transform([clean_resume, clean_jd])
-        keyword_score = cosine_similarity(
-            matrix[0:1], matrix[1:2]
-        )[0][0] * 100
-    except Exception:
-        keyword_score = 0.0
-
-    # ---------------- SEMANTIC SCORE ----------------
-    try:
-        embeddings = model.encode([resume_text, jd_text])
-        semantic_score = cosine_similarity(
-            [embeddings[0]],
-            [embeddings[1]]
-        )[0][0] * 100
-    except Exception:
-        semantic_score = 0.0
-
-    # Normalize individual scores
-    semantic_score = normalize_score(semantic_score)
-    keyword_score = normalize_score(keyword_score)
-
-    # ---------------- FINAL HYBRID SCORE ----------------
-    final_score = (
-        SEMANTIC_WEIGHT * semantic_score +
-        KEYWORD_WEIGHT * keyword_score
-    )
-
-    final_score = normalize_score(final_score)
-
-    return semantic_score, keyword_score, final_score
+def rank_resumes(jd_text, resumes, top_k=None):
+    return get_engine().rank_resumes(jd_text, resumes, top_k=top_k)
@@ -0,0 +1,793 @@
+# ======================================================
+# BENCHMARKS - PERFORMANCE HARNESS
+# Synthetic Resume Corpus + Timed Before/After Comparisons
+# Usage: python benchmarks.py [name ...]
+# ======================================================
+
+import argparse
+import random
+import re
+import time
+
+import numpy as np
+
+
+# ------------------------------------------------------
+# SYNTHETIC CORPUS
+# ------------------------------------------------------
+
+_BASE_VOCAB = (
+    "python sql machine learning deep learning power bi tableau pandas "
+    "numpy excel aws azure statistics data analysis visualization "
+    "developed designed implemented managed led built delivered improved "
+    "reduced increased optimized automated migrated deployed analyzed "
+    "dashboards pipelines models reports systems services applications "
+    "customers stakeholders teams engineers analysts projects products "
+    "requirements processes workflows databases queries metrics insights "
+    "experience education skills projects certifications summary "
+    "university bachelor master degree science engineering computer "
+    "the and with for from into across using over under within "
+    "responsible collaborated communicated presented trained mentored "
+    "revenue costs accuracy latency throughput performance quality"
+).split()
+
+
+def synthetic_vocabulary(size=5000, seed=7):
+    rng = random.Random(seed)
+    vocab = list(_BASE_VOCAB)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    while len(vocab) < size:
+        word = "".join(rng.choice(letters) for _ in range(rng.randint(3, 10)))
+        vocab.append(word + rng.choice(["", "s", "ing", "ed"]))
+    return vocab
+
+
+def synthetic_resume(rng, vocab, weights, words=600):
+    tokens = rng.choices(vocab, weights=weights, k=words)
+    lines, i = [], 0
+    for header in ("Summary", "Skills", "Experience", "Projects", "Education"):
+        lines.append(header.upper())
+        chunk = tokens[i:i + words // 5]
+        i += words // 5
+        for j in range(0, len(chunk), 12):
+            lines.append("- " + " ".join(chunk[j:j + 12]).capitalize()
+                         + f" by {rng.randint(5, 95)}%.")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def synthetic_corpus(n_docs=500, words=600, seed=7):
+    """Zipf-distributed resume-like documents (deterministic)."""
+    rng = random.Random(seed)
+    vocab = synthetic_vocabulary(seed=seed)
+    weights = [1.0 / (rank + 1) for rank in range(len(vocab))]
+    return [synthetic_resume(rng, vocab, weights, words) for _ in range(n_docs)]
+
+
+def _best_of(fn, repeat=3):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _report(name, rows):
+    print(f"\n== {name} ==")
+    for label, value in rows:
+        print(f"  {label:<34} {value}")
+
+
+# ------------------------------------------------------
+# TEXT NORMALIZATION
+# ------------------------------------------------------
+
+def _legacy_clean_text(text, stop_words, lemmatizer):
+    """The original per-word ats_engine.clean_text loop (baseline)."""
+    if not text:
+        return ""
+    text = re.sub(r"[^a-zA-Z\s]", " ", text).lower()
+    cleaned_words = []
+    for w in text.split():
+        if w not in stop_words and len(w) > 2:
+            try:
+                cleaned_words.append(lemmatizer.lemmatize(w))
+            except Exception:
+                cleaned_words.append(w)
+    return " ".join(cleaned_words)
+
+
+def bench_normalize(n_docs=500):
+    from ats_engine import ScoringEngine
+    from text_normalizer import TextNormalizer
+
+    stop_words, lemmatizer = ScoringEngine()._load_nltk_resources()
+    corpus = synthetic_corpus(n_docs)
+
+    legacy_time, legacy = _best_of(
+        lambda: [_legacy_clean_text(t, stop_words, lemmatizer) for t in corpus]
+    )
+
+    def run_pipeline():
+        normalizer = TextNormalizer(stop_words, lemmatizer)  # cold memo
+        return normalizer.clean_batch(corpus)
+
+    new_time, new = _best_of(run_pipeline)
+    assert new == legacy, "normalizer output differs from legacy clean_text"
+
+    _report("normalize", [
+        ("documents", n_docs),
+        ("legacy per-word loop (s)", f"{legacy_time:.3f}"),
+        ("memoized pipeline (s)", f"{new_time:.3f}"),
+        ("speedup", f"{legacy_time / new_time:.1f}x"),
+        ("output identical", True),
+    ])
+    return {"legacy": legacy_time, "pipeline": new_time}
+
+
+# ------------------------------------------------------
+# BM25 KEYWORD ENGINE
+# ------------------------------------------------------
+
+def bench_bm25(n_docs=20000, n_queries=20):
+    from rank_bm25 import BM25Okapi
+    from keyword_index import BM25Index, tokenize
+
+    corpus = synthetic_corpus(n_docs, words=300)
+    queries = synthetic_corpus(n_queries, words=80, seed=11)
+
+    build_time, index = _best_of(
+        lambda: BM25Index().add_documents(corpus), repeat=1
+    )
+    index.postings  # materialise the inverted index outside the timing
+    tokenized = [tokenize(t) for t in corpus]
+    baseline = BM25Okapi(tokenized)
+    # rank-bm25 floors common-term IDF differently; share ours for parity
+    baseline.idf = {
+        term: index._idf(index._df[col])
+        for term, col in index.vocabulary.items()
+    }
+
+    ours_time, ours = _best_of(lambda: [index.raw_score(q) for q in queries])
+    base_time, base = _best_of(
+        lambda: [baseline.get_scores(tokenize(q)) for q in queries], repeat=1
+    )
+    max_diff = max(float(np.abs(a - b).max()) for a, b in zip(ours, base))
+
+    _report("bm25", [
+        ("documents", n_docs),
+        ("index build (s)", f"{build_time:.2f}"),
+        ("inverted index ms / query", f"{ours_time / n_queries * 1000:.2f}"),
+        ("rank-bm25 scan ms / query", f"{base_time / n_queries * 1000:.2f}"),
+        ("max |score diff| vs rank-bm25", f"{max_diff:.2e}"),
+    ])
+    return {"inverted": ours_time, "rank_bm25": base_time}
+
+
+# ------------------------------------------------------
+# SEMANTIC ANN INDEX
+# ------------------------------------------------------
+
+def synthetic_embeddings(n, dim=384, n_clusters=200, seed=7):
+    """Clustered unit vectors shaped like MiniLM resume embeddings."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(n_clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, n_clusters, size=n)
+    X = centers[labels] + 0.4 * rng.normal(size=(n, dim)).astype(np.float32)
+    return X / np.linalg.norm(X, axis=1, keepdims=True)
+
+
+def bench_ann(n_docs=50000, n_queries=200, k=10):
+    from semantic_index import FlatIndex, IVFPQIndex, recall_latency_table
+
+    X = synthetic_embeddings(n_docs + n_queries)
+    corpus, queries = X[:n_docs], X[n_docs:]
+
+    build_time, index = _best_of(
+        lambda: IVFPQIndex(n_lists=int(np.sqrt(n_docs))).add(corpus),
+        repeat=1
+    )
+    rows = recall_latency_table(index, FlatIndex(corpus), queries, k=k)
+
+    _report("ann", [("documents", n_docs), ("build (s)", f"{build_time:.1f}")]
+            + [(f"n_probe={r['n_probe']:<3} recall@{k}",
+                f"{r['recall']:.3f}  {r['ms_per_query']:.2f} ms "
+                f"(exact {r['exact_ms_per_query']:.2f} ms)")
+               for r in rows])
+    return rows
+
+
+# ------------------------------------------------------
+# INFERENCE BACKENDS
+# ------------------------------------------------------
+
+def bench_backends(n_docs=256, backends=None):
+    """
+    Throughput, load RSS and semantic drift per CPU backend. A backend
+    that falls back to torch is reported as skipped, not measured.
+    Parity is enforced by tests/test_inference_backend.py.
+    """
+    from config import MODEL_NAME, ONNX_MODEL_FILE
+    from inference_backend import (
+        BACKENDS, PARITY_TOLERANCE, load_sentence_model, semantic_parity,
+        encode_throughput, rss_mb
+    )
+
+    import sentence_transformers  # noqa: F401  keep import cost out of RSS
+    import torch  # noqa: F401
+
+    docs = [" ".join(t.split()[:256]) for t in synthetic_corpus(n_docs)]
+    jds = synthetic_corpus(n_docs, words=120, seed=11)
+    pairs = list(zip(docs[:64], jds[:64]))
+
+    rows, reference = [], None
+    for backend in backends or BACKENDS:
+        before = rss_mb()
+        model, used = load_sentence_model(MODEL_NAME, backend, ONNX_MODEL_FILE)
+        if used != backend:
+            rows.append((backend, f"skipped (unavailable, fell back to {used})"))
+            continue
+        loaded = rss_mb() - before
+        throughput = encode_throughput(model, docs)
+        if reference is None:
+            reference, drift = model, 0.0
+        else:
+            drift = semantic_parity(reference, model, pairs)
+        flag = "  OVER TOLERANCE" if drift > PARITY_TOLERANCE else ""
+        rows.append((backend, f"{throughput:7.1f} docs/s  "
+                              f"+{loaded:6.1f} MB RSS  "
+                              f"max drift {drift:.2f} pts{flag}"))
+
+    _report("backends", rows)
+    return rows
+
+
+# ------------------------------------------------------
+# COLD START
+# ------------------------------------------------------
+
+def bench_startup(include_model=False):
+    import os
+    import subprocess
+    import sys
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    probe = ("import time; t = time.perf_counter(); import ats_engine; "
+             "print(time.perf_counter() - t)")
+    import_time = min(
+        float(subprocess.run([sys.executable, "-c", probe], cwd=here,
+                             capture_output=True, text=True,
+                             check=True).stdout)
+        for _ in range(3)
+    )
+
+    from ats_engine import ScoringEngine
+    engine = ScoringEngine()
+    engine.clean_text("Warm the normalizer with one sentence.")
+    if include_model:
+        engine.warmup()
+
+    _report("startup", [("import ats_engine (s)", f"{import_time:.3f}")]
+            + [(f"{stage} (s)", f"{seconds:.3f}")
+               for stage, seconds in engine.startup_timings().items()])
+    return import_time
+
+
+# ------------------------------------------------------
+# SKILL MATCHING
+# ------------------------------------------------------
+
+def synthetic_taxonomy(size=20000, seed=11):
+    """Skill names of 1-3 words drawn from the synthetic vocabulary."""
+    rng = random.Random(seed)
+    vocab = synthetic_vocabulary()
+    skills = set(_BASE_VOCAB[:40])
+    while len(skills) < size:
+        skills.add(" ".join(rng.choice(vocab) for _ in range(rng.randint(1, 3))))
+    return sorted(skills)
+
+
+def _legacy_extract_skills(text, skills):
+    """The original per-skill re.search loop (baseline)."""
+    text = text.lower()
+    found = []
+    for skill in skills:
+        pattern = r"\b" + re.escape(skill.lower()) + r"\b"
+        if re.search(pattern, text):
+            found.append(skill)
+    return sorted(set(found))
+
+
+def _bench_ontology_artifact(skills):
+    """Seconds to compile an ontology JSON vs load its cached artifact."""
+    import json
+    import os
+    import tempfile
+    from skill_ontology import load_ontology
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "ontology.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"skills": [{"id": s, "aliases": [s.replace(" ", "")]}
+                                  for s in skills]}, f)
+        cache = os.path.join(directory, "ontology.pkl")
+        start = time.perf_counter()
+        load_ontology(path, cache)
+        compile_s = time.perf_counter() - start
+        cached_s, _ = _best_of(lambda: load_ontology(path, cache))
+    return compile_s, cached_s
+
+
+def bench_skills(n_docs=50, taxonomy_size=20000):
+    """Regex loop vs token Aho-Corasick on a large taxonomy."""
+    from skill_matcher import SkillMatcher
+
+    skills = synthetic_taxonomy(taxonomy_size)
+    corpus = [text.lower() for text in synthetic_corpus(n_docs)]
+
+    start = time.perf_counter()
+    matcher = SkillMatcher(skills)
+    build = time.perf_counter() - start
+
+    legacy_docs = corpus[:5]
+    legacy, expected = _best_of(
+        lambda: [_legacy_extract_skills(t, skills) for t in legacy_docs], repeat=1
+    )
+    fast, found = _best_of(lambda: [matcher.extract(t) for t in corpus])
+    assert found[:len(legacy_docs)] == expected, "automaton disagrees with regex"
+
+    legacy_ms = legacy / len(legacy_docs) * 1000
+    fast_ms = fast / len(corpus) * 1000
+    compile_s, cached_s = _bench_ontology_artifact(skills)
+    _report(f"skills ({len(skills)} skills)", [
+        ("automaton build (s)", f"{build:.3f}"),
+        ("ontology compile (s)", f"{compile_s:.3f}"),
+        ("ontology cached load (s)", f"{cached_s:.3f}"),
+        ("regex loop (ms/resume)", f"{legacy_ms:.1f}"),
+        ("automaton (ms/resume)", f"{fast_ms:.3f}"),
+        ("speedup", f"{legacy_ms / fast_ms:.0f}x"),
+        ("skills found (mean)", f"{np.mean([len(f) for f in found]):.1f}"),
+    ])
+    return legacy_ms, fast_ms
+
+
+def _typo(word, rng):
+    i = rng.randrange(len(word) - 1)
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+def bench_fuzzy_skills(n_docs=20, taxonomy_size=20000):
+    """N-gram-blocked fuzzy matching vs brute-force rapidfuzz over the taxonomy."""
+    from rapidfuzz import process, fuzz
+    from fuzzy_skills import FuzzySkillMatcher
+
+    rng = random.Random(5)
+    skills = synthetic_taxonomy(taxonomy_size)
+    corpus = []
+    for text in synthetic_corpus(n_docs, words=400):
+        typos = [_typo(s.replace(" ", ""), rng) for s in rng.sample(skills, 10)
+                 if len(s) >= 6]
+        corpus.append(text.lower() + "\n" + " ".join(typos))
+
+    start = time.perf_counter()
+    matcher = FuzzySkillMatcher({s: s for s in skills})
+    build = time.perf_counter() - start
+
+    fast, found = _best_of(lambda: [set(matcher.extract(t)) for t in corpus])
+
+    def brute(text):
+        out = set()
+        for window in matcher._windows(text):
+            hit = process.extractOne(window, matcher._keys, scorer=fuzz.ratio,
+                                     score_cutoff=matcher.threshold)
+            if hit:
+                out.add(matcher._ids[hit[2]])
+        return out
+
+    brute_docs = corpus[:3]
+    slow, expected = _best_of(lambda: [brute(t) for t in brute_docs], repeat=1)
+    recall = np.mean([len(f & e) / len(e) if e else 1.0
+                      for f, e in zip(found, expected)])
+
+    fast_ms = fast / len(corpus) * 1000
+    slow_ms = slow / len(brute_docs) * 1000
+    _report(f"fuzzy skills ({len(matcher)} aliases)", [
+        ("blocking index build (s)", f"{build:.3f}"),
+        ("brute force (ms/resume)", f"{slow_ms:.1f}"),
+        ("blocked (ms/resume)", f"{fast_ms:.1f}"),
+        ("speedup", f"{slow_ms / fast_ms:.0f}x"),
+        ("recall vs brute force", f"{recall:.3f}"),
+    ])
+    return slow_ms, fast_ms, recall
+
+
+def bench_semantic_skills(n_docs=20, taxonomy_size=20000, jd_skills=15,
+                          model_name=None):
+    """Precomputed skill matrix vs embedding JD skills per request."""
+    import tempfile
+    from config import MODEL_NAME, ENCODE_BATCH_SIZE
+    from inference_backend import load_sentence_model
+    from semantic_skills import SkillVectors, load_skill_vectors, resume_phrases
+    from skill_ontology import SkillOntology
+
+    model, _ = load_sentence_model(model_name or MODEL_NAME)
+
+    def encode(texts):
+        return model.encode(texts, batch_size=ENCODE_BATCH_SIZE,
+                            normalize_embeddings=True)
+
+    rng = random.Random(3)
+    ontology = SkillOntology.from_keywords(synthetic_taxonomy(taxonomy_size))
+    corpus = synthetic_corpus(n_docs, words=400)
+    wanted = [rng.sample(sorted(ontology.parents), jd_skills) for _ in corpus]
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        vectors = load_skill_vectors(ontology, "bench", encode, directory)
+        build = time.perf_counter() - start
+        cached, vectors = _best_of(
+            lambda: load_skill_vectors(ontology, "bench", encode, directory)
+        )
+
+        def precomputed(text, skills):
+            phrases = resume_phrases(text)
+            return vectors.match(encode(phrases), phrases, skills, 0.6)
+
+        def per_request(text, skills):
+            phrases = resume_phrases(text)
+            phrase_vecs = encode(phrases)
+            skill_vecs = encode(skills)           # re-embedded every request
+            return {s: max(float(p @ v) for p in phrase_vecs)
+                    for s, v in zip(skills, skill_vecs)}
+
+        pairs = list(zip(corpus, wanted))
+        fast, _ = _best_of(lambda: [precomputed(t, s) for t, s in pairs], repeat=2)
+        slow, _ = _best_of(lambda: [per_request(t, s) for t, s in pairs], repeat=2)
+
+    assert isinstance(vectors, SkillVectors)
+    _report(f"semantic skills ({len(vectors)} skills)", [
+        ("skill matrix build (s)", f"{build:.2f}"),
+        ("skill matrix cached load (s)", f"{cached:.4f}"),
+        ("per-request skill embedding (ms)", f"{slow / n_docs * 1000:.1f}"),
+        ("precomputed matrix (ms)", f"{fast / n_docs * 1000:.1f}"),
+    ])
+    return build, cached, fast, slow
+
+
+def bench_cohort(n_docs=3000, taxonomy_size=2000, jd_size=30):
+    """Sparse skill-matrix cohort stats vs per-candidate Python loops."""
+    from cohort_skills import SkillMatrix
+    from skill_matcher import SkillMatcher
+
+    rng = random.Random(9)
+    skills = synthetic_taxonomy(taxonomy_size)
+    matcher = SkillMatcher(skills)
+    found = [matcher.extract(t.lower()) for t in synthetic_corpus(n_docs, words=300)]
+    seen = sorted(set().union(*map(set, found)))
+    jd = rng.sample(seen, min(jd_size, len(seen)))
+
+    def loops():
+        sets = [set(f) for f in found]
+        covered = {s: sum(s in f for f in sets) for s in jd}
+        per_candidate = [len(f.intersection(jd)) / len(jd) for f in sets]
+        pairs = {(a, b): sum(a in f and b in f for f in sets)
+                 for a in jd for b in jd}
+        return covered, per_candidate, pairs
+
+    build, cohort = _best_of(
+        lambda: SkillMatrix.from_skill_lists(range(n_docs), found)
+    )
+
+    def vectorized():
+        return (cohort.gap_table(jd), cohort.candidate_coverage(jd),
+                cohort.co_occurrence(jd))
+
+    slow, (covered, per_candidate, pairs) = _best_of(loops, repeat=1)
+    fast, (table, coverage, (names, counts)) = _best_of(vectorized)
+
+    assert all(covered[s] == c for s, c in zip(table["skill"], table["covered"]))
+    assert np.allclose(per_candidate, coverage)
+    assert all(pairs[(a, b)] == counts[i, j]
+               for i, a in enumerate(names) for j, b in enumerate(names))
+
+    _report(f"cohort ({n_docs} resumes x {len(seen)} skills)", [
+        ("matrix build (ms)", f"{build * 1000:.1f}"),
+        ("python loops (ms)", f"{slow * 1000:.1f}"),
+        ("sparse column sums (ms)", f"{fast * 1000:.1f}"),
+        ("speedup", f"{slow / fast:.0f}x"),
+    ])
+    return slow, fast
+
+
+# ------------------------------------------------------
+# EXTRACTION BACKENDS
+# ------------------------------------------------------
+
+def synthetic_pdf(text, lines_per_page=45):
+    """Render resume text to an in-memory PDF (reportlab)."""
+    import io
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+
+    buf = io.BytesIO()
+    pdf = canvas.Canvas(buf, pagesize=A4)
+    for i, line in enumerate(text.splitlines()):
+        if i and i % lines_per_page == 0:
+            pdf.showPage()
+        pdf.drawString(40, 800 - (i % lines_per_page) * 17, line[:110])
+    pdf.save()
+    return buf.getvalue()
+
+
+def synthetic_docx(text):
+    import io
+    import docx
+
+    document = docx.Document()
+    for line in text.splitlines():
+        document.add_paragraph(line)
+    buf = io.BytesIO()
+    document.save(buf)
+    return buf.getvalue()
+
+
+def bench_extraction(n_docs=20):
+    """Per-backend time and yield for PDF (fast path vs forced fallback) and DOCX."""
+    from extraction import (extract_document, extraction_metrics,
+                            reset_extraction_metrics)
+
+    corpus = synthetic_corpus(n_docs, words=900)
+    pdfs = [synthetic_pdf(text) for text in corpus]
+    docs = [synthetic_docx(text) for text in corpus]
+
+    reset_extraction_metrics()
+    for data in pdfs:
+        extract_document(data, "resume.pdf")
+    for data in pdfs:
+        # an impossible yield target forces the pdfminer fallback
+        extract_document(data, "resume.pdf", min_chars_per_page=10**9)
+    for data in docs:
+        extract_document(data, "resume.docx")
+
+    rows = []
+    for name, m in extraction_metrics().items():
+        rows.append((f"{name} pages/s", f"{m['pages_per_second']:.1f}"))
+        rows.append((f"{name} chars/page", f"{m['chars_per_page']:.0f}"))
+        rows.append((f"{name} calls/fallbacks/failed",
+                     f"{m['calls']} / {m['fallbacks']} / {m['failures']}"))
+    _report("extraction", rows)
+    return extraction_metrics()
+
+
+def bench_document_cache(n_docs=20):
+    """Cold extraction vs re-analysis of already-seen uploads."""
+    import tempfile
+    from document_cache import DocumentCache
+
+    pdfs = [synthetic_pdf(text) for text in synthetic_corpus(n_docs, words=900)]
+    with tempfile.TemporaryDirectory() as directory:
+        cache = DocumentCache(max_entries=n_docs, directory=directory)
+        start = time.perf_counter()
+        for data in pdfs:
+            cache.extract(data, "resume.pdf")
+        cold = time.perf_counter() - start
+
+        warm, _ = _best_of(lambda: [cache.extract(d, "resume.pdf") for d in pdfs])
+        cache.clear_memory()
+        disk, _ = _best_of(lambda: [cache.extract(d, "resume.pdf") for d in pdfs],
+                           repeat=1)
+
+    _report("document cache", [
+        ("cold extract (ms/doc)", f"{cold / n_docs * 1000:.2f}"),
+        ("memory hit (ms/doc)", f"{warm / n_docs * 1000:.3f}"),
+        ("disk hit (ms/doc)", f"{disk / n_docs * 1000:.3f}"),
+        ("speedup (memory)", f"{cold / warm:.0f}x"),
+    ])
+    return cold, warm, disk
+
+
+def _legacy_extract_sections(text):
+    """The original one-search-per-section scan (baseline)."""
+    from section_analyzer import SECTION_PATTERNS
+
+    sections = {}
+    text_lower = text.lower()
+    for key, pattern in SECTION_PATTERNS.items():
+        match = re.search(pattern + r"(.*?)(?=\n[A-Z][^\n]+\n|\Z)",
+                          text_lower, re.DOTALL)
+        sections[key] = match.group(0) if match else ""
+    return sections
+
+
+def bench_sections(n_docs=50, pages=10):
+    """Per-section regex scans vs the one-pass segmenter on long resumes."""
+    from section_analyzer import extract_sections
+
+    # ~500 words per page
+    corpus = synthetic_corpus(n_docs, words=500 * pages)
+
+    legacy, _ = _best_of(lambda: [_legacy_extract_sections(t) for t in corpus],
+                         repeat=1)
+    fast, found = _best_of(lambda: [extract_sections(t) for t in corpus])
+    present = sum(bool(v) for sections in found for v in sections.values())
+
+    _report("sections", [
+        ("resume length (chars)", f"{sum(map(len, corpus)) // n_docs}"),
+        ("per-section regex (ms/doc)", f"{legacy / n_docs * 1000:.3f}"),
+        ("one-pass segmenter (ms/doc)", f"{fast / n_docs * 1000:.3f}"),
+        ("sections found", f"{present}/{n_docs * 4}"),
+        ("speedup", f"{legacy / fast:.1f}x"),
+    ])
+    return legacy, fast
+
+
+def _legacy_analyze_quality(text):
+    """The original three-walk quality counts (baseline)."""
+    return (len(text.split()), sum(c.isdigit() for c in text),
+            text.count("%"))
+
+
+def bench_quality(n_docs=2000, words=1000):
+    """Legacy per-character counting vs the single-pass quality scanner."""
+    from quality_analyzer import analyze_quality, analyze_quality_batch
+
+    corpus = synthetic_corpus(n_docs, words=words)
+    legacy, expected = _best_of(lambda: [_legacy_analyze_quality(t)
+                                         for t in corpus])
+    batch, found = _best_of(lambda: analyze_quality_batch(corpus))
+    assert expected == [(q["word_count"], q["numbers_count"],
+                         q["percentage_mentions"]) for q in found]
+    single, _ = _best_of(lambda: analyze_quality(corpus[0]), repeat=20)
+
+    _report("quality", [
+        ("resumes", f"{n_docs} x ~{words} words"),
+        ("legacy counts (ms/doc)", f"{legacy / n_docs * 1000:.3f}"),
+        ("single-pass, all metrics (ms/doc)", f"{batch / n_docs * 1000:.3f}"),
+        ("batch throughput (docs/s)", f"{n_docs / batch:,.0f}"),
+        ("one resume (ms)", f"{single * 1000:.3f}"),
+    ])
+    return legacy, batch
+
+
+def bench_report(n_reports=5):
+    """
+    PDF export: charts re-rasterized at 300 dpi for every report (the old
+    behaviour) vs the cached chart images vs native vector charts.
+    """
+    import report_generator as rg
+
+    data = {"semantic": 78.5, "keyword": 82.3, "final": 80.4,
+            "skill_score": 75.0, "quality_score": 90.0, "readiness": 81.45,
+            "matched_skills": ["python", "sql"], "missing_skills": ["aws"]}
+
+    def clear():
+        rg._radar_chart_png.cache_clear()
+        rg._score_gauge_png.cache_clear()
+
+    def run(cached=True, **options):
+        clear()
+        start = time.perf_counter()
+        for _ in range(n_reports):
+            if not cached:
+                clear()
+            pdf = rg.generate_pdf_report(dict(data, **options))
+        return (time.perf_counter() - start) / n_reports, len(pdf) // 1024
+
+    legacy_s, legacy_kb = run(cached=False, chart_format="png", chart_dpi=300)
+    cached_s, cached_kb = run(chart_format="png")
+    vector_s, vector_kb = run(chart_format="vector")
+
+    _report("report", [
+        ("300 dpi, uncached (ms/report)", f"{legacy_s * 1000:.0f}"),
+        ("cached png (ms/report)", f"{cached_s * 1000:.0f}"),
+        ("vector charts (ms/report)", f"{vector_s * 1000:.0f}"),
+        ("pdf size 300 dpi / png / vector (KB)",
+         f"{legacy_kb} / {cached_kb} / {vector_kb}"),
+    ])
+    return legacy_s, cached_s, vector_s
+
+
+def _legacy_score_counter(final):
+    """The original server-side count-up loop (baseline)."""
+    import time
+    import streamlit as st
+
+    ph = st.empty()
+    for i in range(int(final) + 1):
+        ph.metric("Final ATS Score", f"{i}%",
+                  delta=f"+{i-50}%" if i > 50 else None)
+        time.sleep(0.002)
+
+
+def _client_score_counter(final):
+    from dashboard import render_score_counter
+    render_score_counter(final)
+
+
+def bench_rerun(final=87.0, runs=5):
+    """
+    Server time and ForwardMsgs per rerun of the dashboard score widget:
+    server-side count-up loop vs client-side animation.
+    """
+    from streamlit.testing.v1 import AppTest
+    from streamlit.runtime.scriptrunner_utils.script_run_context import (
+        ScriptRunContext
+    )
+
+    sent = [0]
+    enqueue = ScriptRunContext.enqueue
+
+    def counting_enqueue(self, msg):
+        sent[0] += 1
+        return enqueue(self, msg)
+
+    def measure(fn):
+        app = AppTest.from_function(fn, args=(final,), default_timeout=30)
+        app.run()                             # warm imports
+        ScriptRunContext.enqueue = counting_enqueue
+        try:
+            sent[0] = 0
+            start = time.perf_counter()
+            for _ in range(runs):
+                app.run()
+            elapsed = (time.perf_counter() - start) / runs
+        finally:
+            ScriptRunContext.enqueue = enqueue
+        return elapsed, sent[0] / runs
+
+    legacy_s, legacy_msgs = measure(_legacy_score_counter)
+    client_s, client_msgs = measure(_client_score_counter)
+
+    _report("rerun (score counter)", [
+        ("server loop (ms/rerun)", f"{legacy_s * 1000:.1f}"),
+        ("server loop (msgs/rerun)", f"{legacy_msgs:.0f}"),
+        ("client-side (ms/rerun)", f"{client_s * 1000:.1f}"),
+        ("client-side (msgs/rerun)", f"{client_msgs:.0f}"),
+        ("speedup", f"{legacy_s / client_s:.0f}x"),
+    ])
+    return (legacy_s, legacy_msgs), (client_s, client_msgs)
+
+
+# ------------------------------------------------------
+# ENTRY POINT
+# ------------------------------------------------------
+
+BENCHMARKS = {
+    "normalize": bench_normalize,
+    "bm25": bench_bm25,
+    "ann": bench_ann,
+    "backends": bench_backends,
+    "startup": bench_startup,
+    "skills": bench_skills,
+    "fuzzy_skills": bench_fuzzy_skills,
+    "semantic_skills": bench_semantic_skills,
+    "cohort": bench_cohort,
+    "extraction": bench_extraction,
+    "document_cache": bench_document_cache,
+    "sections": bench_sections,
+    "quality": bench_quality,
+    "report": bench_report,
+    "rerun": bench_rerun,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Enterprise AI ATS benchmarks")
+    parser.add_argument("names", nargs="*",
+                        help=f"benchmarks to run: {', '.join(BENCHMARKS)} "
+                             "(default: all)")
+    args = parser.parse_args(argv)
+    unknown = [n for n in args.names if n not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+    for name in args.names or list(BENCHMARKS):
+        try:
+            BENCHMARKS[name]()
+        except LookupError as exc:        # NLTK data not provisioned
+            _report(name, [("skipped", f"NLTK data unavailable ({exc})")])
+
+
+if __name__ == "__main__":
+    main()
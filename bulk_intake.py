@@ -0,0 +1,210 @@
+# ======================================================
+# BULK INTAKE - ZIP ARCHIVES & SERVER FOLDERS
+# Lazy Member Reads | Bounded Worker Pool | Batch Ranking
+# ======================================================
+
+import os
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from cohort_skills import build_skill_matrix
+from config import (
+    BULK_WORKERS, BULK_MAX_MEMBER_MB, BULK_INTAKE_ROOT, PDF_TIMEOUT
+)
+from document_cache import document_key, document_entry
+from extraction import FILE_TYPES, extract_document, spawn_pool
+from skill_analyzer import default_ontology
+
+
+SUPPORTED_EXTENSIONS = tuple(f".{ext}" for ext in FILE_TYPES)
+
+
+def _supported(name):
+    base = os.path.basename(name)
+    return (name.lower().endswith(SUPPORTED_EXTENSIONS)
+            and not base.startswith((".", "~$"))
+            and "__MACOSX" not in name)
+
+
+# ------------------------------------------------------
+# SOURCES
+# ------------------------------------------------------
+# A source is listed up front (names and sizes only, so progress has a
+# total) and each member's bytes are read only when it is processed.
+
+def zip_members(archive, max_bytes=BULK_MAX_MEMBER_MB * 2**20):
+    """
+    [(name, size, reader)] for resumes inside a ZIP (path or file-like).
+    Oversized members are listed with reader=None and reported as skipped.
+    """
+    zf = zipfile.ZipFile(archive)
+    members = []
+    for info in zf.infolist():
+        if info.is_dir() or not _supported(info.filename):
+            continue
+        reader = None
+        if info.file_size <= max_bytes:
+            reader = (lambda info=info: zf.read(info))
+        members.append((info.filename, info.file_size, reader))
+    return members
+
+
+def folder_members(directory, root=BULK_INTAKE_ROOT,
+                   max_bytes=BULK_MAX_MEMBER_MB * 2**20):
+    """[(relative path, size, reader)] for resumes under a server folder."""
+    if not root:
+        raise PermissionError("Server folder intake is disabled (BULK_INTAKE_ROOT)")
+    root = os.path.realpath(root)
+    directory = os.path.realpath(directory)
+    if os.path.commonpath([root, directory]) != root:
+        raise PermissionError(f"{directory} is outside {root}")
+
+    members = []
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            if not _supported(path):
+                continue
+            size = os.path.getsize(path)
+            reader = None
+            if size <= max_bytes:
+                reader = (lambda path=path: _read_file(path))
+            members.append((os.path.relpath(path, directory), size, reader))
+    return members
+
+
+def _read_file(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+# ------------------------------------------------------
+# EXTRACTION
+# ------------------------------------------------------
+
+def _extract_member(args):
+    """Worker: run the extractor chain on one member's bytes, in-process
+    (the worker is already isolated; no nested pool)."""
+    data, name = args
+    return extract_document(data, name, timeout=None)
+
+
+def extract_members(members, documents=None, workers=BULK_WORKERS,
+                    on_progress=None, timeout=PDF_TIMEOUT):
+    """
+    Yield (name, entry, error) for each member as it finishes.
+
+    Member bytes are read one at a time and at most 2 * workers documents
+    are in flight, so memory stays bounded however large the archive is.
+    Cache hits never reach the pool. workers=0 extracts one document at
+    a time. Each document gets `timeout` seconds (None: no limit).
+    `on_progress(done, total)` is called after every member.
+    """
+    total, done = len(members), 0
+
+    def finished(name, entry=None, error=None):
+        nonlocal done
+        done += 1
+        if on_progress:
+            on_progress(done, total)
+        return name, entry, error
+
+    def prepare(name, size, reader):
+        """(key, data) for a miss, or a finished tuple."""
+        if reader is None:
+            reason = (f"skipped: {size / 2**20:.1f} MB exceeds "
+                      f"{BULK_MAX_MEMBER_MB} MB")
+            return None, finished(name, error=reason)
+        try:
+            data = reader()
+        except Exception as exc:
+            return None, finished(name, error=f"unreadable: {exc}")
+        key = document_key(data)
+        entry = documents.get(key) if documents is not None else None
+        if entry is not None:
+            return None, finished(name, entry)
+        return (key, data), None
+
+    def store(key, result):
+        entry = document_entry(result)
+        if documents is not None:
+            documents.put(key, entry)
+        return entry
+
+    if not workers:
+        for name, size, reader in members:
+            miss, out = prepare(name, size, reader)
+            if out is None:
+                key, data = miss
+                try:
+                    out = finished(name, store(key, extract_document(
+                        data, name, timeout=timeout)))
+                except Exception as exc:
+                    out = finished(name, error=str(exc))
+            yield out
+        return
+
+    if timeout:
+        # Threads hand each document to a killable extraction worker, so
+        # there is one process per document in flight, killed when it
+        # overruns; a process pool here would nest a worker in each
+        pool = ThreadPoolExecutor(workers)
+        submit = lambda data, name: pool.submit(extract_document, data, name,
+                                                timeout=timeout)
+    else:
+        pool = spawn_pool(workers, executor=True)
+        submit = lambda data, name: pool.submit(_extract_member, (data, name))
+
+    with pool:
+        pending = {}
+        queue = iter(members)
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < 2 * workers:
+                try:
+                    name, size, reader = next(queue)
+                except StopIteration:
+                    exhausted = True
+                    break
+                miss, out = prepare(name, size, reader)
+                if out is not None:
+                    yield out
+                    continue
+                key, data = miss
+                pending[submit(data, name)] = (name, key)
+            if not pending:
+                continue
+            ready, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in ready:
+                name, key = pending.pop(future)
+                try:
+                    yield finished(name, store(key, future.result()))
+                except Exception as exc:
+                    yield finished(name, error=str(exc))
+
+
+# ------------------------------------------------------
+# END-TO-END
+# ------------------------------------------------------
+
+def run_bulk_intake(engine, jd_text, members, documents=None,
+                    workers=BULK_WORKERS, on_progress=None, top_k=None):
+    """
+    Extract every member, then rank all extracted resumes against the JD
+    in one batched engine pass. Returns (ranking DataFrame, failures,
+    cohort SkillMatrix) where failures is a list of (name, reason).
+    """
+    texts, failures = {}, []
+    for name, entry, error in extract_members(members, documents, workers,
+                                              on_progress):
+        if error is not None:
+            failures.append((name, error))
+        elif not entry["text"].strip():
+            failures.append((name, "no extractable text"))
+        else:
+            texts[name] = entry["text"]
+
+    ranking = engine.rank_resumes(jd_text, texts, top_k=top_k)
+    cohort = build_skill_matrix(engine, texts, default_ontology())
+    return ranking, failures, cohort
@@ -0,0 +1,102 @@
+# ======================================================
+# CHUNKING - LONG DOCUMENT EMBEDDING
+# Section/Sentence Windows + Pooled Similarity
+# ======================================================
+
+import re
+
+import numpy as np
+
+
+# Section breaks (blank lines) and sentence ends both start a new unit
+_UNIT_SPLIT = re.compile(r"\n\s*\n|(?<=[.!?;•])\s+|\n(?=\s*[-•*▪●])")
+
+POOLING_MODES = ("max", "mean", "attention")
+
+
+def clip_words(text, max_words):
+    """
+    Keep at most `max_words` whitespace-separated words.
+
+    Every word yields at least one word piece, so clipping at the model's
+    sequence length never changes the embedding - it only stops the
+    tokenizer from walking the whole document before truncating.
+    """
+    if not text:
+        return ""
+    words = text.split(None, max_words)
+    return " ".join(words[:max_words])
+
+
+def split_into_windows(text, max_words=160, max_windows=32):
+    """
+    Split text into section/sentence-aligned windows of <= max_words.
+
+    Units (paragraphs, bullets, sentences) are packed greedily so no
+    window crosses a unit boundary unless the unit itself is too long.
+    At most `max_windows` windows are produced, which bounds the total
+    tokenization cost of very long inputs.
+    """
+    if not text:
+        return []
+
+    windows, current, size = [], [], 0
+    budget = max_words * max_windows
+
+    for unit in _UNIT_SPLIT.split(text):
+        words = unit.split()
+        if not words:
+            continue
+        words = words[:budget]
+        budget -= len(words)
+
+        while words:
+            room = max_words - size
+            if len(words) > room and current:
+                windows.append(" ".join(current))
+                current, size = [], 0
+                continue
+            take = words[:max_words]
+            words = words[max_words:]
+            current.extend(take)
+            size += len(take)
+            if size >= max_words:
+                windows.append(" ".join(current))
+                current, size = [], 0
+
+        if budget <= 0:
+            break
+
+    if current:
+        windows.append(" ".join(current))
+    return windows[:max_windows]
+
+
+def pool_similarity(window_vecs, jd_vec, mode="attention", temperature=0.1):
+    """
+    Pool L2-normalised window embeddings against a normalised JD vector.
+
+    max        best-matching window
+    mean       cosine of the mean window vector
+    attention  JD-attention weighted window vector (softmax over sims)
+    """
+    window_vecs = np.asarray(window_vecs, dtype=np.float32)
+    if window_vecs.size == 0:
+        return 0.0
+
+    sims = window_vecs @ jd_vec
+    if mode == "max":
+        return float(sims.max())
+
+    if mode == "mean":
+        weights = np.full(len(sims), 1.0 / len(sims), dtype=np.float32)
+    elif mode == "attention":
+        logits = (sims - sims.max()) / temperature
+        weights = np.exp(logits)
+        weights /= weights.sum()
+    else:
+        raise ValueError(f"Unknown pooling mode: {mode!r}")
+
+    pooled = weights @ window_vecs
+    norm = np.linalg.norm(pooled)
+    return float(pooled @ jd_vec / norm) if norm else 0.0
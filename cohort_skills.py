@@ -0,0 +1,156 @@
+# ======================================================
+# COHORT SKILLS - RESUME x SKILL MATRIX
+# Sparse Binary Matrix | Coverage, Gaps & Co-occurrence by Column Sums
+# ======================================================
+
+import numpy as np
+import scipy.sparse as sp
+
+from ats_engine import _split_resumes
+
+
+class SkillMatrix:
+    """
+    Binary CSR matrix, one row per candidate and one column per skill.
+
+    Every cohort statistic is a sparse column sum or product: coverage is
+    X.sum(axis=0), co-occurrence is X.T @ X, and hierarchy expansion
+    (a "deep learning" resume also covers "machine learning") is one
+    product with a skill -> ancestor matrix.
+    """
+
+    def __init__(self, candidates, skills, matrix):
+        self.candidates = list(candidates)
+        self.skills = list(skills)
+        self.matrix = sp.csr_matrix(matrix, dtype=np.float32)
+        self._col = {skill: j for j, skill in enumerate(self.skills)}
+
+    def __len__(self):
+        return len(self.candidates)
+
+    @property
+    def shape(self):
+        return self.matrix.shape
+
+    # ---------------- BUILD ----------------
+
+    @classmethod
+    def from_skill_lists(cls, candidates, skill_lists, skills=None):
+        """
+        Matrix from per-candidate skill lists. Columns are `skills` when
+        given (others are dropped), else every skill seen, sorted.
+        """
+        skill_lists = [set(s) for s in skill_lists]
+        if skills is None:
+            skills = sorted(set().union(*skill_lists)) if skill_lists else []
+        col = {skill: j for j, skill in enumerate(skills)}
+
+        indptr, indices = [0], []
+        for found in skill_lists:
+            indices.extend(sorted(col[s] for s in found if s in col))
+            indptr.append(len(indices))
+        matrix = sp.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32),
+             np.asarray(indices, dtype=np.int32),
+             np.asarray(indptr, dtype=np.int64)),
+            shape=(len(skill_lists), len(skills))
+        )
+        return cls(candidates, skills, matrix)
+
+    def expand(self, ontology):
+        """
+        Copy where each candidate also holds every ancestor of their
+        skills (columns are added for ancestors not yet present).
+        """
+        skills = list(self.skills)
+        col = dict(self._col)
+        rows, cols = [], []
+        for j, skill in enumerate(self.skills):
+            for parent in ontology.ancestors(skill):
+                if parent not in col:
+                    col[parent] = len(skills)
+                    skills.append(parent)
+                rows.append(j)
+                cols.append(col[parent])
+        n = len(skills)
+        rows.extend(range(len(self.skills)))
+        cols.extend(range(len(self.skills)))
+        lift = sp.csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, cols)),
+                             shape=(len(self.skills), n))
+        covered = self.matrix @ lift
+        covered.data[:] = 1.0
+        return SkillMatrix(self.candidates, skills, covered)
+
+    # ---------------- COHORT STATISTICS ----------------
+
+    def _columns(self, skills):
+        return np.asarray([self._col.get(s, -1) for s in skills], dtype=np.int64)
+
+    def counts(self, skills=None):
+        """Candidates holding each skill (all columns, or `skills`)."""
+        totals = np.asarray(self.matrix.sum(axis=0)).ravel()
+        if skills is None:
+            return totals
+        cols = self._columns(skills)
+        out = np.zeros(len(cols))
+        out[cols >= 0] = totals[cols[cols >= 0]]
+        return out
+
+    def coverage(self, skills=None):
+        """Share of candidates (0..1) holding each skill."""
+        return self.counts(skills) / max(len(self.candidates), 1)
+
+    def gap_table(self, jd_skills):
+        """
+        DataFrame of JD skills with how many candidates have / lack each,
+        most-missing first.
+        """
+        import pandas as pd
+
+        jd_skills = list(dict.fromkeys(jd_skills))
+        have = self.counts(jd_skills)
+        n = len(self.candidates)
+        table = pd.DataFrame({
+            "skill": jd_skills,
+            "covered": have.astype(int),
+            "missing": (n - have).astype(int),
+            "coverage": have / max(n, 1) * 100,
+        })
+        return table.sort_values(["missing", "skill"], ascending=[False, True],
+                                 ignore_index=True)
+
+    def candidate_coverage(self, jd_skills):
+        """Per-candidate share (0..1) of the JD skills they hold."""
+        cols = self._columns(dict.fromkeys(jd_skills))
+        cols = cols[cols >= 0]
+        n_jd = len(dict.fromkeys(jd_skills))
+        if not n_jd:
+            return np.zeros(len(self.candidates))
+        held = np.asarray(self.matrix[:, cols].sum(axis=1)).ravel()
+        return held / n_jd
+
+    def co_occurrence(self, skills=None):
+        """
+        (skills, dense count matrix) of how many candidates hold each
+        pair; the diagonal is the per-skill count.
+        """
+        matrix = self.matrix
+        if skills is not None:
+            cols = self._columns(skills)
+            skills = [s for s, c in zip(skills, cols) if c >= 0]
+            matrix = matrix[:, cols[cols >= 0]]
+        else:
+            skills = self.skills
+        return skills, (matrix.T @ matrix).toarray()
+
+
+def build_skill_matrix(engine, resumes, ontology=None):
+    """
+    SkillMatrix for {candidate: resume text} (or a list), extracting skills
+    from the raw texts exactly as single-resume analysis does.
+    """
+    candidates, texts = _split_resumes(resumes)
+    matrix = SkillMatrix.from_skill_lists(
+        candidates, [engine.extract_skills(t) for t in texts]
+    )
+    return matrix.expand(ontology) if ontology is not None else matrix
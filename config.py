@@ -9,3 +9,86 @@ SKILL_KEYWORDS = [
 
 SEMANTIC_WEIGHT = 0.6
 KEYWORD_WEIGHT = 0.4
+
+# Default recruiter simulation sliders (Analytics tab)
+RECRUITER_WEIGHTS = {"semantic": 0.35, "keyword": 0.30, "skill": 0.20, "quality": 0.15}
+
+MODEL_NAME = "all-MiniLM-L6-v2"
+ENCODE_BATCH_SIZE = 32
+
+CACHE_DIR = ".ats_cache"
+EMBEDDING_CACHE_SIZE = 4096
+EMBEDDING_CACHE_DIR = CACHE_DIR + "/embeddings"
+EMBEDDING_CACHE_DISK_ROWS = 200000   # ~300 MB of 384-d vectors; oldest half dropped past this
+
+# Canonical skills, aliases and parents; SKILL_KEYWORDS is the fallback
+SKILL_ONTOLOGY_FILE = "skill_ontology.json"
+SKILL_ONTOLOGY_CACHE = CACHE_DIR + "/skill_ontology.pkl"
+
+# Typo-tolerant skill matching (rapidfuzz on n-gram-blocked shortlists)
+FUZZY_SKILL_MATCHING = False
+FUZZY_SKILL_THRESHOLD = 85       # rapidfuzz ratio, 0-100
+
+# Skill coverage: "exact" (ontology + hierarchy) | "semantic" (+ embeddings)
+SKILL_MATCH_MODE = "exact"
+SEMANTIC_SKILL_THRESHOLD = 0.6   # cosine of best resume phrase to JD skill
+SKILL_PHRASE_MAX_WORDS = 6
+SKILL_VECTORS_DIR = CACHE_DIR + "/skill_vectors"
+
+# Semantic encoding: the model truncates at 256 word pieces
+MODEL_MAX_WORDS = 256
+SEMANTIC_CHUNKING = False        # split long resumes into pooled windows
+CHUNK_POOLING = "attention"      # "max" | "mean" | "attention"
+CHUNK_MAX_WORDS = 160
+CHUNK_MAX_WINDOWS = 32
+
+LEMMA_MEMO_SIZE = 50000
+KEYWORD_INDEX_DIR = CACHE_DIR + "/keyword_index"
+
+# Keyword scoring backend: "tfidf" (cosine) or "bm25" (BM25 / BM25+)
+KEYWORD_ENGINE = "tfidf"
+BM25_K1 = 1.5
+BM25_B = 0.75
+BM25_DELTA = 0.0                 # > 0 enables BM25+
+
+# Approximate nearest-neighbour index over resume embeddings (IVF-PQ)
+SEMANTIC_INDEX_DIR = CACHE_DIR + "/semantic_index"
+ANN_N_LISTS = 256
+ANN_SUBVECTORS = 8               # 384-d MiniLM -> 48-d subvectors
+ANN_N_PROBE = 16
+
+# Sentence-transformer CPU runtime: "torch" | "torch-int8" | "onnx"
+INFERENCE_BACKEND = "torch"
+ONNX_MODEL_FILE = None           # e.g. "onnx/model_qint8_avx512_vnni.onnx"
+
+# NLTK data: provisioned locally (python nltk_resources.py), loaded lazily
+NLTK_DATA_DIR = "nltk_data"
+NLTK_AUTO_DOWNLOAD = True        # set False on air-gapped nodes
+
+# Resume extraction
+PDF_MAX_PAGES = 50
+PDF_TIMEOUT = 30                 # seconds per document
+PDF_WORKERS = 0                  # > 0: process pool for large PDFs
+PDF_PARALLEL_MIN_PAGES = 8
+PDF_EXTRACTORS = ["pypdf2", "pdfminer"]   # fastest first, layout-aware fallback
+PDF_MIN_CHARS_PER_PAGE = 200     # below this yield, try the next extractor
+
+# Extracted-text cache keyed on SHA-256 of the uploaded bytes
+DOCUMENT_CACHE_SIZE = 256
+# The disk tier persists resume text: opt in with e.g. CACHE_DIR + "/documents"
+DOCUMENT_CACHE_DIR = None                  # None: memory only
+DOCUMENT_CACHE_DISK_ENTRIES = 1000         # least recently used files deleted past this
+
+# Per-(resume, JD) analysis bundles kept in memory across sessions
+ANALYSIS_CACHE_SIZE = 64
+
+# Bulk intake (ZIP archive or server-side folder)
+BULK_WORKERS = 0                 # > 0: documents extracted concurrently (large/scanned PDFs)
+BULK_MAX_MEMBER_MB = 20          # skip larger archive members
+BULK_INTAKE_ROOT = None          # server folder intake allowed only below this
+
+# PDF report charts: "png" (matplotlib, cached by rounded scores) or
+# "vector" (native ReportLab drawings, no matplotlib)
+REPORT_CHART_FORMAT = "png"
+REPORT_CHART_DPI = 150
+REPORT_CHART_CACHE_SIZE = 128
@@ -18,6 +18,53 @@ def hiring_classification(score):
         return "High Rejection Risk", "#c8401a", "rgba(200,64,26,0.08)", "#fca5a5"
 
 
+def render_score_counter(final, label="Final ATS Score", duration_ms=600):
+    """
+    Metric-style score that counts up in the browser. The server sends one
+    element with the final value; the animation runs client-side.
+    """
+    target = int(max(0.0, min(float(final), 100.0)))
+    delta  = f"+{target - 50}%" if target > 50 else ""
+
+    components.html(f"""<!DOCTYPE html><html><head>
+    <link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@900&family=Plus+Jakarta+Sans:wght@700&display=swap" rel="stylesheet">
+    <style>
+    *,*::before,*::after{{box-sizing:border-box;margin:0;padding:0;}}
+    body{{background:transparent;font-family:'Plus Jakarta Sans',sans-serif;}}
+    .m{{background:#fdfcf7;border:1px solid rgba(30,26,22,0.10);
+        border-left:4px solid #1a4fc8;padding:1.1rem 1.2rem;}}
+    .l{{color:#7a7065;font-size:0.70rem;font-weight:700;letter-spacing:0.08em;
+        text-transform:uppercase;margin-bottom:0.3rem;}}
+    .v{{font-family:'Playfair Display',serif;font-size:2.25rem;font-weight:900;
+        color:#1e1a16;line-height:1.15;}}
+    .d{{color:#16a34a;font-size:0.85rem;font-weight:700;opacity:0;
+        transition:opacity 0.3s;}}
+    </style></head><body>
+    <div class="m">
+        <div class="l">{label}</div>
+        <div class="v"><span id="v">{target}</span>%</div>
+        <div class="d" id="d">{"&#8593; " + delta if delta else ""}</div>
+    </div>
+    <script>
+    (function() {{
+        var el = document.getElementById("v"), d = document.getElementById("d");
+        var target = {target}, ms = {int(duration_ms)};
+        var still = window.matchMedia &&
+                    window.matchMedia("(prefers-reduced-motion: reduce)").matches;
+        if (still || ms <= 0) {{ d.style.opacity = 1; return; }}
+        var t0 = null;
+        function step(t) {{
+            if (t0 === null) t0 = t;
+            var p = Math.min((t - t0) / ms, 1);
+            el.textContent = Math.round(target * (1 - Math.pow(1 - p, 3)));
+            if (p < 1) requestAnimationFrame(step); else d.style.opacity = 1;
+        }}
+        el.textContent = 0;
+        requestAnimationFrame(step);
+    }})();
+    </script></body></html>""", height=125, scrolling=False)
+
+
 def render_dashboard(semantic, keyword, final, skill_score=None, quality_score=None, sections=None):
 
     semantic    = float(semantic)
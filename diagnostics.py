@@ -19,6 +19,9 @@ def render_diagnostics(sections, quality_data, keyword_score):
     quality_score    = float(quality_data.get("quality_score", 0))
     word_count       = quality_data.get("word_count", 0)
     numbers_count    = quality_data.get("numbers_count", 0)
+    quantified       = quality_data.get("quantified_achievements", 0)
+    action_verbs     = quality_data.get("action_verbs", 0)
+    contact          = quality_data.get("contact") or {}
 
     # Colour for structure progress
     if structure_score >= 75: sp_col = "#16a34a"
@@ -30,6 +33,8 @@ def render_diagnostics(sections, quality_data, keyword_score):
     if structure_score < 75: issues.append(("warn", "Resume is missing important structural sections."))
     if quality_score   < 60: issues.append(("warn", "Resume lacks strong quantification and measurable impact."))
     if keyword_score   < 60: issues.append(("warn", "Keyword optimization for ATS systems is below recommended level."))
+    if contact and not (contact.get("email") or contact.get("phone")):
+        issues.append(("warn", "No email address or phone number detected."))
     if not issues:            issues.append(("ok",   "Resume structure and formatting meet professional standards."))
 
     obs_html = "".join(f"""
@@ -55,6 +60,8 @@ def render_diagnostics(sections, quality_data, keyword_score):
         {mc(f"{keyword_score:.1f}%",   "Keyword Density",  "#c8401a")}
         {mc(str(word_count),            "Word Count",       "#d97706")}
         {mc(str(numbers_count),         "Numbers Used",     "#16a34a")}
+        {mc(str(quantified),            "Quantified Wins",  "#c8401a")}
+        {mc(str(action_verbs),          "Action Verbs",     "#d97706")}
         {mc(f"{quality_score:.0f}%",    "Quality Score",    "#1a4fc8")}
     </div>"""
 
@@ -0,0 +1,145 @@
+# ======================================================
+# DOCUMENT CACHE - EXTRACTED RESUME TEXT
+# Keyed on SHA-256 of File Bytes | LRU + Optional Bounded JSON on Disk
+# ======================================================
+
+import hashlib
+import json
+import os
+import re
+
+from extraction import extract_document
+from lru_store import LRUStore
+from section_analyzer import extract_sections
+
+
+_HSPACE = re.compile(r"[ \t\f\v\xa0]+")
+
+# Bump when extraction, normalisation or section detection changes what
+# an entry holds for the same bytes: older entries then never match.
+DOCUMENT_CACHE_VERSION = 2
+
+
+def document_key(data):
+    """SHA-256 of the file bytes, tagged with the entry format version."""
+    return f"{hashlib.sha256(data).hexdigest()}-v{DOCUMENT_CACHE_VERSION}"
+
+
+def normalize_extracted(text):
+    """
+    Canonical extracted text: unified newlines, no NULs, horizontal
+    whitespace runs collapsed. Line breaks are kept for section detection.
+    """
+    text = (text or "").replace("\r\n", "\n").replace("\r", "\n")
+    text = text.replace("\x00", "")
+    return "\n".join(_HSPACE.sub(" ", line).strip() for line in text.split("\n"))
+
+
+def document_entry(result):
+    """Cache entry for an ExtractionResult."""
+    text = normalize_extracted(result.text)
+    return {
+        "text": text,
+        "sections": extract_sections(text),
+        "file_type": result.file_type,
+        "backend": result.backend,
+    }
+
+
+class DocumentCache(LRUStore):
+    """
+    Extracted text and section map per uploaded file, keyed by the
+    SHA-256 of its bytes, so a re-uploaded resume is never parsed again.
+
+    A bounded in-memory LRU sits in front of an optional directory of
+    JSON entries (one file per document, written atomically). The disk
+    tier holds resume text, so it is off unless a directory is given,
+    and it keeps at most `max_disk_entries` files: the least recently
+    used (by mtime, refreshed on every hit) are deleted first.
+    """
+
+    def __init__(self, max_entries=256, directory=None, max_disk_entries=1000):
+        super().__init__(max_entries)
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+        self._disk_entries = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._disk_entries = len(self._disk_files())
+
+    # ---------------- DISK TIER ----------------
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def _disk_files(self):
+        paths = []
+        for root, _, files in os.walk(self.directory):
+            paths.extend(os.path.join(root, f) for f in files
+                         if f.endswith(".json"))
+        return paths
+
+    def _load(self, key):
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)            # recency for disk eviction
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, key, entry):
+        if not self.directory:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            existed = os.path.exists(path)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+            self._disk_entries += not existed
+        except OSError:
+            return                    # the cache is best-effort
+        if self.max_disk_entries and self._disk_entries > self.max_disk_entries:
+            self._evict_disk()
+
+    def _evict_disk(self):
+        """Drop the least recently used files down to 90% of the cap."""
+        stamped = []
+        for path in self._disk_files():
+            try:
+                stamped.append((os.path.getmtime(path), path))
+            except OSError:
+                pass
+        stamped.sort()
+        excess = len(stamped) - int(self.max_disk_entries * 0.9)
+        for _, path in stamped[:max(excess, 0)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._disk_entries = len(stamped) - max(excess, 0)
+
+    # ---------------- ACCESS ----------------
+
+    def extract(self, data, filename=None, **kwargs):
+        """
+        {"text", "sections", "file_type", "backend"} for an uploaded
+        file. Only a cache miss runs the extractor chain.
+        """
+        key = document_key(data)
+        entry = self.get(key)
+        if entry is None:
+            entry = document_entry(extract_document(data, filename, **kwargs))
+            self.put(key, entry)
+        return entry
+
+    def stats(self):
+        stats = super().stats()
+        stats["disk_entries"] = self._disk_entries
+        return stats
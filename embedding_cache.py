@@ -0,0 +1,361 @@
+# ======================================================
+# EMBEDDING CACHE - CONTENT ADDRESSED
+# In-memory LRU + memory-mapped on-disk tier
+# ======================================================
+
+import hashlib
+import os
+import warnings
+from contextlib import contextmanager
+
+import numpy as np
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:              # Windows
+    fcntl = None
+    import msvcrt
+
+from lru_store import LRUStore
+
+
+def normalize_for_key(text):
+    """
+    Whitespace-insensitive form of the text used for cache keys.
+    """
+    return " ".join((text or "").split())
+
+
+def embedding_key(text, model_name):
+    payload = f"{model_name}\0{normalize_for_key(text)}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+# ------------------------------------------------------
+# ON-DISK TIER
+# ------------------------------------------------------
+
+@contextmanager
+def _exclusive(path):
+    """Cross-process exclusive lock on `path` (flock, or msvcrt on Windows)."""
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class DiskEmbeddingStore:
+    """
+    Append-only float32 matrix (vectors.f32) plus a key -> row index
+    (index.tsv). Reads go through a read-only np.memmap, so lookups never
+    load the whole store into RAM.
+
+    Writers take an exclusive file lock and first catch up with rows
+    other processes appended, so bulk-intake workers and app replicas
+    can share one directory. Past `max_rows`, the newest half is copied
+    into a fresh generation (named in CURRENT) and the old one deleted.
+    """
+
+    def __init__(self, directory, max_rows=None):
+        self.directory = directory
+        self.max_rows = max_rows
+        self.lock_path = os.path.join(directory, ".lock")
+        self.current_path = os.path.join(directory, "CURRENT")
+        self.dim = None
+        self._generation = None
+        self._index = {}
+        self._index_pos = 0            # bytes of index.tsv already parsed
+        self._rows = 0
+        self._mmap = None
+        os.makedirs(directory, exist_ok=True)
+        self._refresh()
+
+    # ---------------- LAYOUT ----------------
+
+    def _paths(self, generation):
+        base = (self.directory if generation == 0
+                else os.path.join(self.directory, f"gen-{generation}"))
+        return os.path.join(base, "vectors.f32"), os.path.join(base, "index.tsv")
+
+    @property
+    def vectors_path(self):
+        return self._paths(self._generation)[0]
+
+    @property
+    def index_path(self):
+        return self._paths(self._generation)[1]
+
+    def _current_generation(self):
+        try:
+            with open(self.current_path, "r", encoding="utf-8") as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def _refresh(self):
+        """Catch up with rows (or a new generation) written by others."""
+        generation = self._current_generation()
+        if generation != self._generation:
+            self._generation = generation
+            self._index, self._index_pos, self._rows = {}, 0, 0
+            self._mmap = None
+        try:
+            with open(self.index_path, "rb") as f:
+                f.seek(self._index_pos)
+                chunk = f.read()
+        except OSError:
+            return
+        complete = chunk.rfind(b"\n") + 1
+        fresh = {}
+        for line in chunk[:complete].decode("utf-8").splitlines():
+            parts = line.split("\t")
+            if len(parts) != 3:
+                continue
+            fresh[parts[0]] = int(parts[1])
+            self.dim = int(parts[2])
+        self._index_pos += complete
+        if self.dim:
+            try:
+                self._rows = os.path.getsize(self.vectors_path) // (4 * self.dim)
+            except OSError:
+                self._rows = 0
+            # Ignore index rows whose vector write never completed
+            self._index.update((k, r) for k, r in fresh.items() if r < self._rows)
+
+    def _vectors(self):
+        if self._mmap is None or len(self._mmap) < self._rows:
+            self._mmap = np.memmap(self.vectors_path, dtype=np.float32,
+                                   mode="r", shape=(self._rows, self.dim))
+        return self._mmap
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    # ---------------- ACCESS ----------------
+
+    def get(self, key):
+        row = self._index.get(key)
+        if row is None:
+            return None
+        try:
+            return np.array(self._vectors()[row])
+        except (OSError, ValueError):
+            # Generation replaced by another process: reload, count a miss
+            self._refresh()
+            return None
+
+    def put_many(self, keys, vectors):
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        with _exclusive(self.lock_path):
+            self._refresh()
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+            if vectors.shape[1] != self.dim:
+                raise ValueError(
+                    f"Embedding dim {vectors.shape[1]} != store dim {self.dim}"
+                )
+            new = {}
+            for k, v in zip(keys, vectors):
+                if k not in self._index:
+                    new.setdefault(k, v)
+            if not new:
+                return
+            if self.max_rows:
+                new = dict(list(new.items())[-self.max_rows:])
+                if self._rows + len(new) > self.max_rows:
+                    self._compact(max(self.max_rows // 2 - len(new), 0))
+
+            vectors_path, index_path = self._paths(self._generation)
+            os.makedirs(os.path.dirname(vectors_path), exist_ok=True)
+            with open(vectors_path, "ab") as f:
+                f.truncate(self._rows * 4 * self.dim)   # drop a torn last row
+                f.write(b"".join(v.tobytes() for v in new.values()))
+            with open(index_path, "a", encoding="utf-8") as f:
+                f.write("".join(f"{k}\t{self._rows + offset}\t{self.dim}\n"
+                                for offset, k in enumerate(new)))
+            self._refresh()
+
+    def _compact(self, keep):
+        """Copy the newest `keep` rows into the next generation (lock held)."""
+        old = self._generation
+        generation = old + 1
+        vectors_path, index_path = self._paths(generation)
+        os.makedirs(os.path.dirname(vectors_path), exist_ok=True)
+
+        newest = sorted(self._index.items(), key=lambda item: item[1])
+        newest = newest[len(newest) - keep:] if keep else []
+        with open(vectors_path, "wb") as f:
+            if newest:
+                rows = self._vectors()
+                f.write(b"".join(rows[r].tobytes() for _, r in newest))
+        with open(index_path, "w", encoding="utf-8") as f:
+            f.write("".join(f"{k}\t{row}\t{self.dim}\n"
+                            for row, (k, _) in enumerate(newest)))
+
+        tmp = f"{self.current_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(str(generation))
+        os.replace(tmp, self.current_path)
+
+        self._mmap = None
+        for path in self._paths(old):
+            try:
+                os.remove(path)
+            except OSError:
+                pass                  # still mapped elsewhere (Windows)
+        if old:
+            try:
+                os.rmdir(os.path.dirname(self._paths(old)[0]))
+            except OSError:
+                pass
+        self._refresh()
+
+    def close(self):
+        self._mmap = None
+
+
+# ------------------------------------------------------
+# TWO-TIER CACHE
+# ------------------------------------------------------
+
+class EmbeddingCache(LRUStore):
+    """
+    Embedding cache keyed by sha256(model name + normalized text).
+
+    Lookups try the bounded in-memory LRU first, then the on-disk store
+    (when a directory is configured). Only misses reach the model.
+
+    The disk tier lives under <directory>/<model>/dim-<width> and opens
+    once the vector width is known, so a directory written by a model of
+    another width is never read. A failing disk write is reported and
+    the cache carries on in memory.
+    """
+
+    def __init__(self, model_name, max_entries=4096, directory=None,
+                 max_disk_rows=None):
+        super().__init__(max_entries)
+        self.model_name = model_name
+        self.dim = None
+        self._disk = None
+        self._disk_root = None
+        self._max_disk_rows = max_disk_rows
+        if directory:
+            self._disk_root = os.path.join(directory,
+                                           model_name.replace("/", "__"))
+
+    def _set_dim(self, dim):
+        """Fix the vector width and open the matching disk tier."""
+        with self._lock:
+            if self.dim is None:
+                self.dim = int(dim)
+                if self._disk_root:
+                    self._disk = DiskEmbeddingStore(
+                        os.path.join(self._disk_root, f"dim-{self.dim}"),
+                        max_rows=self._max_disk_rows
+                    )
+            elif int(dim) != self.dim:
+                raise ValueError(
+                    f"Embedding dim {dim} != cache dim {self.dim} "
+                    f"({self.model_name})"
+                )
+
+    def _model_dim(self, model):
+        dim = getattr(model, "get_sentence_embedding_dimension", None)
+        dim = dim() if dim is not None else None
+        if not dim:                   # undeclared: probe once
+            dim = np.asarray(model.encode([""], batch_size=1)).shape[-1]
+        return dim
+
+    # ---------------- LOW-LEVEL ACCESS ----------------
+
+    def _load(self, key):
+        return self._disk.get(key) if self._disk is not None else None
+
+    def _write_disk(self, keys, vectors):
+        if self._disk is None:
+            return
+        try:
+            self._disk.put_many(keys, vectors)
+        except (OSError, ValueError) as exc:
+            warnings.warn(f"Embedding disk cache write failed ({exc}); "
+                          "keeping vectors in memory only")
+
+    def put(self, key, vector):
+        self.put_many([key], [vector])
+
+    def put_many(self, keys, vectors):
+        keys = list(keys)
+        if not keys:
+            return
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self._lock:
+            self._set_dim(vectors.shape[1])
+            self._write_disk(keys, vectors)
+            for k, v in zip(keys, vectors):
+                self._remember(k, v)
+
+    # ---------------- ENCODE THROUGH CACHE ----------------
+
+    def encode(self, model, texts, batch_size=32, normalize=False):
+        """
+        Embed `texts`, running the model only on cache misses.
+        Returns a float32 matrix with one row per input text.
+        """
+        texts = list(texts)
+        if texts and self.dim is None:
+            self._set_dim(self._model_dim(model))
+        keys = [embedding_key(t, self.model_name) for t in texts]
+        found = {}
+        missing = []
+        for k, t in zip(keys, texts):
+            if k in found:
+                continue
+            vector = self.get(k)
+            if vector is None:
+                found[k] = None
+                missing.append((k, t))
+            else:
+                found[k] = vector
+
+        if missing:
+            vectors = np.asarray(model.encode(
+                [normalize_for_key(t) for _, t in missing],
+                batch_size=batch_size
+            ), dtype=np.float32)
+            self.put_many([k for k, _ in missing], vectors)
+            for (k, _), v in zip(missing, vectors):
+                found[k] = v
+
+        if not keys:
+            return np.zeros((0, 0), dtype=np.float32)
+        out = np.vstack([found[k] for k in keys]).astype(np.float32)
+        if normalize:
+            norms = np.linalg.norm(out, axis=1, keepdims=True)
+            out = out / np.where(norms == 0, 1.0, norms)
+        return out
+
+    # ---------------- STATS / LIFECYCLE ----------------
+
+    def stats(self):
+        stats = super().stats()
+        stats["disk_entries"] = len(self._disk) if self._disk is not None else 0
+        return stats
+
+    def close(self):
+        self.clear_memory()
+        if self._disk is not None:
+            self._disk.close()
@@ -0,0 +1,360 @@
+# ======================================================
+# EXTRACTION - RESUME TEXT FROM UPLOADED FILES
+# Extractor Registry | Yield-Based Fallback | Per-Backend Metrics
+# ======================================================
+
+import io
+import multiprocessing
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from config import (
+    PDF_MAX_PAGES, PDF_TIMEOUT, PDF_WORKERS, PDF_PARALLEL_MIN_PAGES,
+    PDF_EXTRACTORS, PDF_MIN_CHARS_PER_PAGE, BULK_WORKERS
+)
+
+
+class ExtractionError(Exception):
+    """The document could not be read."""
+
+
+class ExtractionTimeout(ExtractionError):
+    """Extraction exceeded its time budget."""
+
+
+def _as_bytes(source):
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    if hasattr(source, "getvalue"):
+        return source.getvalue()
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source.read()
+
+
+def _remaining(deadline):
+    return max(deadline - time.monotonic(), 0.001) if deadline else None
+
+
+def _open_pdf(data):
+    import PyPDF2
+    try:
+        return PyPDF2.PdfReader(io.BytesIO(data))
+    except Exception as exc:
+        raise ExtractionError(f"Invalid or corrupted PDF: {exc}") from exc
+
+
+def _read_pages(reader, start, stop):
+    out = []
+    for i in range(start, stop):
+        try:
+            out.append(reader.pages[i].extract_text() or "")
+        except Exception:
+            out.append("")
+    return out
+
+
+def _extract_page_range(args):
+    """Worker: parse the PDF once and extract a contiguous page range
+    (stop=None: up to the last page)."""
+    data, start, stop = args
+    reader = _open_pdf(data)
+    n_pages = len(reader.pages)
+    return _read_pages(reader, start, min(stop or n_pages, n_pages))
+
+
+# ------------------------------------------------------
+# WORKER PROCESSES
+# ------------------------------------------------------
+
+def spawn_pool(workers, executor=False):
+    """
+    Process pool on the "spawn" start method: never fork a process that
+    holds torch / Streamlit threads. A multiprocessing.Pool (terminable
+    on timeout), or a concurrent.futures executor when `executor`.
+    Every process pool in the app comes from here.
+    """
+    context = multiprocessing.get_context("spawn")
+    if executor:
+        return ProcessPoolExecutor(workers, mp_context=context)
+    return context.Pool(workers)
+
+
+# A stuck parser cannot be interrupted from another thread, so timed
+# extraction runs in a worker process that is killed on timeout. Warm
+# single-process pools are reused between calls to skip spawn cost
+# (enough of them for a bulk intake's concurrent documents).
+
+_MAX_IDLE_WORKERS = max(4, BULK_WORKERS)
+_idle_workers = []
+_workers_lock = threading.Lock()
+
+
+def _run_killable(fn, args, timeout, what="PDF extraction"):
+    """fn(args) in a warm worker process; killed if it overruns `timeout`."""
+    with _workers_lock:
+        pool = _idle_workers.pop() if _idle_workers else None
+    if pool is None:
+        pool = spawn_pool(1)
+    try:
+        result = pool.apply_async(fn, (args,)).get(timeout)
+    except multiprocessing.TimeoutError:
+        pool.terminate()
+        raise ExtractionTimeout(f"{what} exceeded {timeout:.3g}s") from None
+    except Exception:
+        _release_worker(pool)          # the task failed, the worker is fine
+        raise
+    except BaseException:
+        pool.terminate()
+        raise
+    _release_worker(pool)
+    return result
+
+
+def _release_worker(pool):
+    with _workers_lock:
+        if len(_idle_workers) < _MAX_IDLE_WORKERS:
+            _idle_workers.append(pool)
+            return
+    pool.terminate()
+
+
+# ------------------------------------------------------
+# PYPDF2 (FAST PATH)
+# ------------------------------------------------------
+
+def extract_pdf_pages(source, max_pages=PDF_MAX_PAGES, workers=PDF_WORKERS,
+                      timeout=PDF_TIMEOUT):
+    """
+    Text of each PDF page (at most `max_pages`), every page parsed once.
+
+    With a `timeout`, extraction always runs in a worker process that is
+    killed when the deadline passes, so one pathological page cannot
+    hang the caller; workers>0 additionally splits large documents into
+    page ranges over a process pool. timeout=None extracts in-process.
+    """
+    data = _as_bytes(source)
+    if timeout and not workers:
+        return _run_killable(_extract_page_range, (data, 0, max_pages),
+                             timeout)
+
+    reader = _open_pdf(data)
+    n_pages = min(len(reader.pages), max_pages or len(reader.pages))
+    if workers and n_pages >= PDF_PARALLEL_MIN_PAGES:
+        return _extract_parallel(data, n_pages, workers, timeout)
+    if timeout:
+        return _run_killable(_extract_page_range, (data, 0, n_pages), timeout)
+    return _read_pages(reader, 0, n_pages)
+
+
+def _extract_parallel(data, n_pages, workers, timeout):
+    workers = min(workers, n_pages)
+    step = -(-n_pages // workers)
+    ranges = [(data, s, min(s + step, n_pages)) for s in range(0, n_pages, step)]
+
+    pool = spawn_pool(workers)
+    try:
+        chunks = pool.map_async(_extract_page_range, ranges).get(timeout)
+    except multiprocessing.TimeoutError:
+        raise ExtractionTimeout(
+            f"PDF extraction exceeded {timeout}s ({n_pages} pages)"
+        ) from None
+    finally:
+        pool.terminate()
+    return [page for chunk in chunks for page in chunk]
+
+
+def _join_pages(pages):
+    # A newline, so a header opening page 2+ stays at the start of a line
+    return "\n".join(page for page in pages if page)
+
+
+def extract_pdf_text(source, **kwargs):
+    """Full resume text: non-empty pages joined in one step."""
+    return _join_pages(extract_pdf_pages(source, **kwargs))
+
+
+# ------------------------------------------------------
+# PDFMINER.SIX (LAYOUT-AWARE FALLBACK)
+# ------------------------------------------------------
+
+def _pdfminer_pages(args):
+    """Worker: pdfminer layout analysis of up to `max_pages` pages."""
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTTextContainer
+
+    data, max_pages = args
+    try:
+        return ["".join(element.get_text() for element in layout
+                        if isinstance(element, LTTextContainer))
+                for layout in extract_pages(io.BytesIO(data),
+                                            maxpages=max_pages or 0)]
+    except Exception as exc:
+        raise ExtractionError(f"Invalid or corrupted PDF: {exc}") from exc
+
+
+def extract_pdfminer_pages(source, max_pages=PDF_MAX_PAGES, timeout=PDF_TIMEOUT):
+    """
+    Text of each PDF page via pdfminer's layout analysis. Slower than
+    PyPDF2, but recovers multi-column and oddly encoded resumes. With a
+    `timeout` it runs in a killable worker, like extract_pdf_pages.
+    """
+    data = _as_bytes(source)
+    if timeout:
+        return _run_killable(_pdfminer_pages, (data, max_pages), timeout)
+    return _pdfminer_pages((data, max_pages))
+
+
+# ------------------------------------------------------
+# PYTHON-DOCX
+# ------------------------------------------------------
+
+def extract_docx_pages(source, max_pages=None, timeout=None):
+    """
+    DOCX body paragraphs and table cells, in document order. Word files
+    have no fixed pagination, so the whole document is one "page".
+    """
+    import docx
+
+    try:
+        document = docx.Document(io.BytesIO(_as_bytes(source)))
+    except Exception as exc:
+        raise ExtractionError(f"Invalid or corrupted DOCX: {exc}") from exc
+
+    lines = [p.text for p in document.paragraphs if p.text.strip()]
+    for table in document.tables:
+        for row in table.rows:
+            cells = [cell.text.strip() for cell in row.cells if cell.text.strip()]
+            if cells:
+                lines.append(" | ".join(cells))
+    return ["\n".join(lines)]
+
+
+# ------------------------------------------------------
+# REGISTRY
+# ------------------------------------------------------
+
+EXTRACTORS = {
+    "pypdf2": extract_pdf_pages,
+    "pdfminer": extract_pdfminer_pages,
+    "docx": extract_docx_pages,
+}
+
+# File type -> extractor chain, tried in order
+FILE_TYPES = {
+    "pdf": list(PDF_EXTRACTORS),
+    "docx": ["docx"],
+}
+
+ExtractionResult = namedtuple(
+    "ExtractionResult", ["text", "file_type", "backend", "pages", "seconds",
+                         "attempts"]
+)
+
+# Backend -> counters, filled in as documents are extracted
+EXTRACTION_METRICS = {}
+_metrics_lock = threading.Lock()
+
+
+def _record(backend, seconds, pages=0, chars=0, failed=False, fell_back=False):
+    with _metrics_lock:
+        m = EXTRACTION_METRICS.setdefault(backend, {
+            "calls": 0, "failures": 0, "fallbacks": 0,
+            "seconds": 0.0, "pages": 0, "chars": 0,
+        })
+        m["calls"] += 1
+        m["failures"] += int(failed)
+        m["fallbacks"] += int(fell_back)
+        m["seconds"] += seconds
+        m["pages"] += pages
+        m["chars"] += chars
+
+
+def extraction_metrics():
+    """
+    Per-backend totals plus derived yield (chars/page) and throughput
+    (pages/s). `fallbacks` counts calls whose yield sent the document
+    on to the next extractor.
+    """
+    with _metrics_lock:
+        metrics = {name: dict(m) for name, m in EXTRACTION_METRICS.items()}
+    for m in metrics.values():
+        m["chars_per_page"] = m["chars"] / m["pages"] if m["pages"] else 0.0
+        m["pages_per_second"] = m["pages"] / m["seconds"] if m["seconds"] else 0.0
+    return metrics
+
+
+def reset_extraction_metrics():
+    with _metrics_lock:
+        EXTRACTION_METRICS.clear()
+
+
+def detect_file_type(data, filename=None):
+    """"pdf" or "docx", from the extension or else the file signature."""
+    ext = os.path.splitext(filename or "")[1].lower().lstrip(".")
+    if ext in FILE_TYPES:
+        return ext
+    if data[:5] == b"%PDF-":
+        return "pdf"
+    if data[:2] == b"PK":
+        return "docx"                 # OOXML container
+    raise ExtractionError(f"Unsupported file type: {filename or 'unknown'}")
+
+
+def extract_document(source, filename=None, max_pages=PDF_MAX_PAGES,
+                     timeout=PDF_TIMEOUT, min_chars_per_page=PDF_MIN_CHARS_PER_PAGE):
+    """
+    Extract a resume with the extractor chain for its file type.
+
+    The fastest backend runs first. If its text yield falls below
+    `min_chars_per_page` (scanned-looking or mis-encoded output) or it
+    fails, the next backend is tried, and the highest-yield result wins.
+    All attempts share one `timeout` budget.
+    """
+    data = _as_bytes(source)
+    file_type = detect_file_type(data, filename)
+    chain = FILE_TYPES[file_type]
+    deadline = time.monotonic() + timeout if timeout else None
+
+    best, error, attempts = None, None, []
+    for i, name in enumerate(chain):
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        start = time.perf_counter()
+        try:
+            pages = EXTRACTORS[name](data, max_pages=max_pages,
+                                     timeout=_remaining(deadline))
+        except ExtractionError as exc:
+            _record(name, time.perf_counter() - start, failed=True,
+                    fell_back=i + 1 < len(chain))
+            attempts.append(name)
+            error = exc
+            continue
+        seconds = time.perf_counter() - start
+
+        text = _join_pages(pages)
+        chars = len(text.strip())
+        low_yield = chars < min_chars_per_page * max(len(pages), 1)
+        fell_back = low_yield and i + 1 < len(chain)
+        _record(name, seconds, len(pages), chars, fell_back=fell_back)
+        attempts.append(name)
+
+        if best is None or chars > len(best.text.strip()):
+            best = ExtractionResult(text, file_type, name, len(pages),
+                                    seconds, None)
+        if not fell_back:
+            break
+
+    if best is None:
+        raise error or ExtractionTimeout(
+            f"Extraction exceeded {timeout}s before any backend finished"
+        )
+    return best._replace(attempts=tuple(attempts))
+
+
+def extract_text(source, filename=None, **kwargs):
+    """Resume text from a PDF or DOCX upload (see extract_document)."""
+    return extract_document(source, filename, **kwargs).text
@@ -0,0 +1,140 @@
+# ======================================================
+# FUZZY SKILLS - TYPO-TOLERANT SKILL MATCHING
+# Character N-gram Blocking + rapidfuzz on the Shortlist Only
+# ======================================================
+
+import heapq
+import re
+from itertools import chain
+from collections import Counter, defaultdict
+
+from skill_matcher import skill_tokens
+
+
+# List separators, brackets, line breaks and sentence ends: a window
+# never spans one ("neural net, cloud platform" is two phrases)
+_BOUNDARY = re.compile(r"[,;:!?()\[\]{}|•\n]+|\.(?=\s|$)")
+
+
+def _compact(text):
+    """Spacing-insensitive form: "Postgre SQL" and "postgresql" agree."""
+    return "".join(text.split())
+
+
+def _singular(key):
+    return key[:-1] if key.endswith("s") else key
+
+
+def char_ngrams(text, n=3):
+    padded = f"#{text}#"
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+class FuzzySkillMatcher:
+    """
+    Approximate alias lookup for the word n-grams of a text.
+
+    Aliases are indexed by character n-grams. For each distinct 1..max_words
+    token window of the text, only aliases sharing enough n-grams with it
+    (and of similar length) are scored with rapidfuzz, so the cost grows
+    with the text, not with text x taxonomy. N-grams shared by a large
+    share of the taxonomy carry no signal and are left out of the index.
+
+    `generic` terms ("database", "containers") are too common to name a
+    skill: they are neither looked up nor offered as candidates, in
+    singular or plural form.
+    """
+
+    def __init__(self, aliases, threshold=85, n=3, max_words=3, min_chars=5,
+                 min_shared=0.3, max_candidates=20, max_df=0.01, generic=()):
+        from rapidfuzz import fuzz
+
+        self._ratio = fuzz.ratio
+        self.threshold = threshold
+        self.n = n
+        self.max_words = max_words
+        self.min_chars = min_chars
+        self.min_shared = min_shared
+        self.max_candidates = max_candidates
+
+        self._generic = {_singular(_compact(term)) for term in generic}
+        self._keys = []               # alias index -> compact alias
+        self._ids = []                # alias index -> canonical id
+        self._exact = set()
+        for alias, skill_id in aliases.items():
+            key = _compact(alias)
+            if _singular(key) in self._generic:
+                continue
+            if len(key) >= min_chars and key not in self._exact:
+                self._exact.add(key)
+                self._keys.append(key)
+                self._ids.append(skill_id)
+
+        postings = defaultdict(list)
+        for i, key in enumerate(self._keys):
+            for gram in char_ngrams(key, n):
+                postings[gram].append(i)
+        limit = max(50, int(max_df * len(self._keys)))
+        self._postings = {g: p for g, p in postings.items() if len(p) <= limit}
+        self._lengths = [len(k) for k in self._keys]
+        self._max_len = max(self._lengths, default=0)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _windows(self, text, skip=()):
+        """
+        Distinct compact token windows worth a fuzzy lookup, each inside
+        one phrase (see _BOUNDARY). Windows touching a token index in
+        `skip` (already matched exactly) and generic terms are left out.
+        """
+        seen = set()
+        offset = 0                    # token index of the phrase start
+        for phrase in _BOUNDARY.split(text or ""):
+            tokens = skill_tokens(phrase)
+            for size in range(1, self.max_words + 1):
+                for i in range(len(tokens) - size + 1):
+                    if skip and any(offset + j in skip
+                                    for j in range(i, i + size)):
+                        continue
+                    window = "".join(tokens[i:i + size])
+                    if (self.min_chars <= len(window) <= self._max_len + 2
+                            and window not in self._exact
+                            and _singular(window) not in self._generic):
+                        seen.add(window)
+            offset += len(tokens)
+        return seen
+
+    def _shortlist(self, window):
+        grams = char_ngrams(window, self.n)
+        shared = Counter(chain.from_iterable(
+            self._postings.get(gram, ()) for gram in grams
+        ))
+        need = self.min_shared * len(grams)
+        lo, hi = 0.7 * len(window), 1.3 * len(window)
+        lengths = self._lengths
+        shortlist = [i for i, count in shared.items()
+                     if count >= need and lo <= lengths[i] <= hi]
+        if len(shortlist) > self.max_candidates:
+            shortlist = heapq.nlargest(self.max_candidates, shortlist,
+                                       key=shared.__getitem__)
+        return shortlist
+
+    def find(self, text, skip=()):
+        """[(canonical id, matched text, alias, score)], best per window."""
+        matches = []
+        for window in self._windows(text, skip):
+            best, best_score = None, self.threshold
+            for i in self._shortlist(window):
+                score = self._ratio(window, self._keys[i],
+                                    score_cutoff=best_score)
+                if score >= best_score:
+                    best, best_score = i, score
+            if best is not None:
+                matches.append((self._ids[best], window, self._keys[best],
+                                float(best_score)))
+        return matches
+
+    def extract(self, text, skip=()):
+        """Sorted canonical IDs found only approximately in the text."""
+        return sorted({skill_id for skill_id, _, _, _ in self.find(text, skip)})
@@ -0,0 +1,100 @@
+# ======================================================
+# INFERENCE BACKEND - CPU EMBEDDING RUNTIMES
+# PyTorch fp32 | Dynamic int8 | ONNX Runtime
+# ======================================================
+
+import os
+import time
+import warnings
+
+import numpy as np
+
+
+BACKENDS = ("torch", "torch-int8", "onnx")
+
+# Max semantic-score drift (0-100 points) a backend may show against fp32
+PARITY_TOLERANCE = 2.0
+
+
+def load_sentence_model(model_name, backend="torch", onnx_file=None,
+                        strict=False):
+    """
+    Load a SentenceTransformer on the requested CPU backend.
+    Returns (model, backend actually in use).
+
+    torch       full fp32 PyTorch (reference)
+    torch-int8  torch dynamic quantization of every nn.Linear to qint8
+    onnx        ONNX Runtime via sentence-transformers' onnx backend
+                (needs sentence-transformers>=3.2 and optimum[onnxruntime]);
+                `onnx_file` selects e.g. a pre-quantized onnx/model_qint8_*.onnx
+
+    An unavailable ONNX runtime falls back to fp32 PyTorch with a warning
+    (the returned backend is then "torch"), or raises when `strict`.
+    """
+    from sentence_transformers import SentenceTransformer
+
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown inference backend: {backend!r}")
+
+    if backend == "onnx":
+        try:
+            kwargs = {"file_name": onnx_file} if onnx_file else {}
+            return SentenceTransformer(model_name, device="cpu",
+                                       backend="onnx",
+                                       model_kwargs=kwargs), "onnx"
+        except Exception as exc:
+            if strict:
+                raise
+            warnings.warn(f"ONNX backend unavailable ({exc}); using torch")
+            return SentenceTransformer(model_name, device="cpu"), "torch"
+
+    model = SentenceTransformer(model_name, device="cpu")
+    if backend == "torch-int8":
+        import torch
+        from torch.ao.quantization import quantize_dynamic
+        model = quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return model, backend
+
+
+def backend_cache_tag(model_name, backend):
+    """Embedding-cache namespace: quantized vectors must not mix with fp32."""
+    return model_name if backend == "torch" else f"{model_name}@{backend}"
+
+
+# ------------------------------------------------------
+# PARITY & THROUGHPUT
+# ------------------------------------------------------
+
+def rss_mb():
+    """Current resident set size in MB (Linux /proc, else peak RSS)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def semantic_parity(reference, candidate, pairs):
+    """
+    Max absolute difference (in 0-100 score points) between the semantic
+    scores two models give to the same (resume, jd) pairs.
+    """
+    def scores(model):
+        left = model.encode([a for a, _ in pairs], normalize_embeddings=True)
+        right = model.encode([b for _, b in pairs], normalize_embeddings=True)
+        return (np.asarray(left) * np.asarray(right)).sum(axis=1) * 100
+
+    return float(np.abs(scores(reference) - scores(candidate)).max())
+
+
+def encode_throughput(model, texts, batch_size=32, repeat=2):
+    """Best-of-`repeat` texts encoded per second."""
+    model.encode(texts[:batch_size], batch_size=batch_size)  # warm kernels
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model.encode(texts, batch_size=batch_size)
+        best = min(best, time.perf_counter() - start)
+    return len(texts) / best
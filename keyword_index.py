@@ -0,0 +1,397 @@
+# ======================================================
+# KEYWORD INDEX - CORPUS LEVEL TF-IDF / BM25
+# Sparse Document-Term Counts + Incremental Updates
+# ======================================================
+
+import json
+import os
+import re
+from collections import Counter
+
+import numpy as np
+import scipy.sparse as sp
+
+
+# Same token rule as sklearn's TfidfVectorizer default
+_TOKEN = re.compile(r"(?u)\b\w\w+\b")
+
+
+def tokenize(text):
+    return _TOKEN.findall((text or "").lower())
+
+
+class _CountIndex:
+    """
+    Shared storage for keyword indexes: vocabulary, document ids and raw
+    term counts in a CSR matrix, extended incrementally by add_documents.
+
+    Texts are expected to be pre-cleaned (ScoringEngine.clean_text).
+    """
+
+    kind = None
+
+    def __init__(self):
+        self.vocabulary = {}
+        self.doc_ids = []
+        self._counts = sp.csr_matrix((0, 0), dtype=np.float32)
+        self._df = np.zeros(0, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.doc_ids)
+
+    def _invalidate(self):
+        pass
+
+    # ---------------- BUILD ----------------
+
+    def add_documents(self, texts, ids=None):
+        texts = list(texts)
+        if ids is None:
+            ids = range(len(self.doc_ids), len(self.doc_ids) + len(texts))
+        ids = list(ids)
+        if len(ids) != len(texts):
+            raise ValueError("ids and texts must have the same length")
+        if not texts:
+            return self
+
+        indptr, indices, data = [0], [], []
+        for text in texts:
+            for term, count in Counter(tokenize(text)).items():
+                col = self.vocabulary.setdefault(term, len(self.vocabulary))
+                indices.append(col)
+                data.append(count)
+            indptr.append(len(indices))
+
+        n_terms = len(self.vocabulary)
+        new_rows = sp.csr_matrix(
+            (np.asarray(data, dtype=np.float32),
+             np.asarray(indices, dtype=np.int32),
+             np.asarray(indptr, dtype=np.int64)),
+            shape=(len(texts), n_terms)
+        )
+        old = self._counts
+        old.resize((old.shape[0], n_terms))
+        self._counts = sp.vstack([old, new_rows], format="csr")
+
+        df = np.zeros(n_terms, dtype=np.int64)
+        df[:len(self._df)] = self._df
+        df += np.bincount(new_rows.indices, minlength=n_terms)
+        self._df = df
+
+        self.doc_ids.extend(ids)
+        self._invalidate()
+        return self
+
+    def _query_matrix(self, texts):
+        """
+        (CSR counts, n_unknown) for texts that are not indexed. Terms no
+        indexed document contains get columns past the vocabulary, shared
+        across `texts`, so they still count in norms and dot products.
+        """
+        n_vocab = len(self.vocabulary)
+        unknown = {}
+        indptr, indices, data = [0], [], []
+        for text in texts:
+            for term, count in Counter(tokenize(text)).items():
+                col = self.vocabulary.get(term)
+                if col is None:
+                    col = n_vocab + unknown.setdefault(term, len(unknown))
+                indices.append(col)
+                data.append(count)
+            indptr.append(len(indices))
+        counts = sp.csr_matrix(
+            (np.asarray(data, dtype=np.float32),
+             np.asarray(indices, dtype=np.int32),
+             np.asarray(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, n_vocab + len(unknown))
+        )
+        return counts, len(unknown)
+
+    def top_k(self, jd_text, k=10):
+        scores = self.score(jd_text)
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(self.doc_ids[i], float(scores[i])) for i in best]
+
+    # ---------------- PERSISTENCE ----------------
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        sp.save_npz(os.path.join(directory, "counts.npz"), self._counts)
+        np.save(os.path.join(directory, "df.npy"), self._df)
+        terms = [None] * len(self.vocabulary)
+        for term, col in self.vocabulary.items():
+            terms[col] = term
+        with open(os.path.join(directory, "meta.json"), "w",
+                  encoding="utf-8") as f:
+            json.dump({"kind": self.kind, "params": self._params(),
+                       "terms": terms, "doc_ids": self.doc_ids}, f)
+
+    def _params(self):
+        return {}
+
+    @classmethod
+    def load(cls, directory):
+        with open(os.path.join(directory, "meta.json"), "r",
+                  encoding="utf-8") as f:
+            meta = json.load(f)
+        index = cls(**meta.get("params", {}))
+        index._counts = sp.load_npz(
+            os.path.join(directory, "counts.npz")
+        ).tocsr()
+        index._df = np.load(os.path.join(directory, "df.npy"))
+        index.vocabulary = {t: i for i, t in enumerate(meta["terms"])}
+        index.doc_ids = meta["doc_ids"]
+        return index
+
+
+# ------------------------------------------------------
+# TF-IDF
+# ------------------------------------------------------
+
+class TfidfIndex(_CountIndex):
+    """
+    TF-IDF cosine index. IDF and the L2-normalised weighted matrix are
+    derived lazily and invalidated on every add. Scoring a JD against the
+    whole corpus is a single sparse matrix-vector product.
+    """
+
+    kind = "tfidf"
+
+    def __init__(self):
+        super().__init__()
+        self._weighted = None
+        self._idf = None
+
+    def _invalidate(self):
+        self._weighted = None
+        self._idf = None
+
+    # ---------------- WEIGHTS ----------------
+
+    @property
+    def idf(self):
+        """Smoothed IDF, matching TfidfVectorizer(smooth_idf=True)."""
+        if self._idf is None:
+            n = len(self.doc_ids)
+            self._idf = (np.log((1 + n) / (1 + self._df)) + 1).astype(np.float32)
+        return self._idf
+
+    @property
+    def matrix(self):
+        """L2-normalised TF-IDF document-term matrix (CSR)."""
+        if self._weighted is None:
+            weighted = self._counts @ sp.diags(self.idf)
+            self._weighted = _l2_normalize_rows(sp.csr_matrix(weighted))
+        return self._weighted
+
+    @property
+    def unknown_idf(self):
+        """IDF of a term no indexed document contains (df = 0)."""
+        return np.float32(np.log(1 + len(self.doc_ids)) + 1)
+
+    def _weigh_queries(self, texts):
+        """L2-normalised TF-IDF rows for unindexed texts, unknown terms
+        included (columns past the vocabulary)."""
+        counts, n_unknown = self._query_matrix(texts)
+        idf = np.concatenate([self.idf,
+                              np.full(n_unknown, self.unknown_idf, np.float32)])
+        return _l2_normalize_rows(sp.csr_matrix(counts @ sp.diags(idf)))
+
+    def transform(self, text):
+        """
+        Dense L2-normalised TF-IDF vector for a query text, over the
+        vocabulary. Unknown terms are not in the vector but still count
+        in its norm, so a JD requirement no indexed document has still
+        weighs on every score.
+        """
+        vec = self._weigh_queries([text])[:, :len(self.vocabulary)]
+        return np.asarray(vec.todense(), dtype=np.float32).ravel()
+
+    # ---------------- QUERY ----------------
+
+    def score(self, jd_text):
+        """Cosine similarity (0..1) of every indexed document to the JD."""
+        if not self.doc_ids:
+            return np.zeros(0, dtype=np.float32)
+        return self.matrix @ self.transform(jd_text)
+
+    def similarity(self, text_a, text_b):
+        """Cosine of two texts under the corpus IDF."""
+        if not self.doc_ids:
+            return 0.0
+        return float(self.score_texts([text_a], text_b)[0])
+
+    def score_texts(self, texts, jd_text):
+        """Cosine of each (unindexed) text to the JD under the corpus IDF."""
+        texts = list(texts)
+        if not self.doc_ids or not texts:
+            return np.zeros(len(texts), dtype=np.float32)
+        weighted = self._weigh_queries(texts + [jd_text])
+        scores = weighted[:-1] @ weighted[-1].T
+        return np.asarray(scores.todense(), dtype=np.float32).ravel()
+
+
+# ------------------------------------------------------
+# BM25 / BM25+
+# ------------------------------------------------------
+
+class BM25Index(_CountIndex):
+    """
+    Okapi BM25 (BM25+ when delta > 0) over an inverted index.
+
+    Postings are the columns of a CSC term-document matrix holding the
+    precomputed saturated term weight of every (term, doc) pair, so a
+    query only touches the postings of its own terms.
+
+    Scores are divided by the JD's own score as a document under the
+    corpus statistics, so a resume that uses the JD's terms as often
+    as the JD does scores 1. This keeps the 0..1 scale in line with
+    TF-IDF cosine, which the hybrid weights and diagnostics assume.
+    """
+
+    kind = "bm25"
+
+    def __init__(self, k1=1.5, b=0.75, delta=0.0):
+        super().__init__()
+        self.k1 = k1
+        self.b = b
+        self.delta = delta
+        self._postings = None
+        self._avgdl = None
+
+    def _params(self):
+        return {"k1": self.k1, "b": self.b, "delta": self.delta}
+
+    def _invalidate(self):
+        self._postings = None
+        self._avgdl = None
+
+    # ---------------- WEIGHTS ----------------
+
+    def _idf(self, df):
+        n = len(self.doc_ids)
+        return np.log((n - df + 0.5) / (df + 0.5) + 1.0)
+
+    def _saturate(self, tf, doc_len):
+        norm = self.k1 * (1.0 - self.b + self.b * doc_len / (self._avgdl or 1.0))
+        return tf * (self.k1 + 1.0) / (tf + norm) + self.delta
+
+    @property
+    def postings(self):
+        """Inverted index: CSC matrix of saturated term weights."""
+        if self._postings is None:
+            counts = self._counts
+            doc_len = np.asarray(counts.sum(axis=1)).ravel()
+            self._avgdl = float(doc_len.mean()) if len(doc_len) else 0.0
+            rows = np.repeat(np.arange(counts.shape[0]), np.diff(counts.indptr))
+            weights = self._saturate(counts.data, doc_len[rows])
+            self._postings = sp.csr_matrix(
+                (weights.astype(np.float32), counts.indices, counts.indptr),
+                shape=counts.shape
+            ).tocsc()
+        return self._postings
+
+    def _query_terms(self, text):
+        """[(term, column, query tf, idf)] per distinct query term.
+
+        Terms no indexed document contains have column None and the
+        df = 0 IDF: they score no indexed document, but still count in
+        the JD self-score and for unindexed texts that contain them."""
+        terms = []
+        for term, qtf in Counter(tokenize(text)).items():
+            col = self.vocabulary.get(term)
+            df = self._df[col] if col is not None else 0
+            terms.append((term, col, qtf, self._idf(df)))
+        return terms
+
+    def _text_score(self, counts, terms):
+        """BM25 of an unindexed document given as term counts."""
+        doc_len = sum(counts.values())
+        total = 0.0
+        for term, _, qtf, idf in terms:
+            tf = counts.get(term, 0)
+            if tf:
+                total += qtf * idf * self._saturate(tf, doc_len)
+        return total
+
+    def _self_score(self, jd_text, terms):
+        """The JD's BM25 against itself: the normalisation reference."""
+        self.postings  # ensures avgdl is computed
+        return self._text_score(Counter(tokenize(jd_text)), terms)
+
+    # ---------------- QUERY ----------------
+
+    def raw_score(self, jd_text, terms=None):
+        """Unnormalised BM25 score of every indexed document."""
+        postings = self.postings
+        scores = np.zeros(len(self.doc_ids), dtype=np.float64)
+        for _, col, qtf, idf in terms or self._query_terms(jd_text):
+            if col is None:
+                continue
+            start, end = postings.indptr[col], postings.indptr[col + 1]
+            scores[postings.indices[start:end]] += (
+                qtf * idf * postings.data[start:end]
+            )
+        return scores
+
+    def score(self, jd_text):
+        """Normalised BM25 (0..1) of every indexed document to the JD."""
+        if not self.doc_ids:
+            return np.zeros(0, dtype=np.float64)
+        terms = self._query_terms(jd_text)
+        reference = self._self_score(jd_text, terms)
+        if not reference:
+            return np.zeros(len(self.doc_ids), dtype=np.float64)
+        return np.minimum(self.raw_score(jd_text, terms) / reference, 1.0)
+
+    def score_texts(self, texts, jd_text):
+        """Normalised BM25 of each (unindexed) text under corpus stats."""
+        texts = list(texts)
+        if not self.doc_ids or not texts:
+            return np.zeros(len(texts), dtype=np.float64)
+        terms = self._query_terms(jd_text)
+        reference = self._self_score(jd_text, terms)
+        if not reference:
+            return np.zeros(len(texts), dtype=np.float64)
+        raw = np.array([self._text_score(Counter(tokenize(t)), terms)
+                        for t in texts], dtype=np.float64)
+        return np.minimum(raw / reference, 1.0)
+
+    def similarity(self, doc_text, jd_text):
+        """Normalised BM25 of one (unindexed) document under corpus stats."""
+        return float(self.score_texts([doc_text], jd_text)[0]) if self.doc_ids else 0.0
+
+
+# ------------------------------------------------------
+# FACTORY
+# ------------------------------------------------------
+
+KEYWORD_ENGINES = {
+    TfidfIndex.kind: TfidfIndex,
+    BM25Index.kind: BM25Index,
+}
+
+
+def create_keyword_index(kind="tfidf", **params):
+    try:
+        return KEYWORD_ENGINES[kind](**params)
+    except KeyError:
+        raise ValueError(f"Unknown keyword engine: {kind!r}") from None
+
+
+def load_keyword_index(directory):
+    """Load a persisted index, dispatching on the stored kind."""
+    with open(os.path.join(directory, "meta.json"), "r",
+              encoding="utf-8") as f:
+        kind = json.load(f).get("kind", TfidfIndex.kind)
+    return KEYWORD_ENGINES[kind].load(directory)
+
+
+def _l2_normalize_rows(matrix):
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sp.csr_matrix(sp.diags(1.0 / norms) @ matrix)
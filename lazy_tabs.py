@@ -0,0 +1,59 @@
+# ======================================================
+# LAZY TABS - RUN ONLY THE ACTIVE TAB
+# Stateful st.tabs | Per-Tab Payload Memo Keyed on Inputs
+# ======================================================
+
+import streamlit as st
+
+
+_PAYLOADS = "_tab_payloads"
+
+
+class LazyTabs:
+    """
+    st.tabs that tracks the selected tab, so a rerun executes only the
+    open tab's render function; hidden tabs send nothing to the browser.
+
+    Streamlit releases without tab state (no `key` / `on_change` on
+    st.tabs) fall back to rendering every tab, as plain st.tabs does.
+    """
+
+    def __init__(self, labels, key="main_tabs"):
+        self.labels = list(labels)
+        try:
+            self._tabs = st.tabs(self.labels, key=key, on_change="rerun")
+            self.lazy = True
+        except TypeError:
+            self._tabs = st.tabs(self.labels)
+            self.lazy = False
+
+    def __getitem__(self, label):
+        return self._tabs[self.labels.index(label)]
+
+    def is_open(self, label):
+        if not self.lazy:
+            return True
+        state = getattr(self[label], "open", None)
+        return True if state is None else bool(state)
+
+    def render(self, label, fn, *args, **kwargs):
+        """Run `fn` inside the tab, only when it is the open one."""
+        if self.is_open(label):
+            with self[label]:
+                return fn(*args, **kwargs)
+        return None
+
+
+def tab_payload(name, inputs, build):
+    """
+    Session-scoped memo for a tab's rendered payload (figure, HTML):
+    `build()` runs again only when `inputs` differ from the last call,
+    so switching back to a tab reuses what it rendered before.
+    """
+    payloads = st.session_state.setdefault(_PAYLOADS, {})
+    cached = payloads.get(name)
+    if cached is not None and cached[0] == inputs:
+        return cached[1]
+    payload = build()
+    payloads[name] = (inputs, payload)
+    return payload
@@ -0,0 +1,87 @@
+# ======================================================
+# LRU STORE - SHARED IN-MEMORY CACHE TIER
+# Bounded OrderedDict LRU | Hit / Miss Counters | Optional Slow Tier
+# ======================================================
+
+import threading
+from collections import OrderedDict
+
+
+class LRUStore:
+    """
+    Thread-safe bounded LRU with hit / miss counters, used by the
+    embedding, document and analysis caches.
+
+    Subclasses with a slower tier (disk) override _load and _store:
+    a memory miss falls through to _load, and whatever it returns is
+    promoted into memory and counted as a hit (and a disk hit).
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._memory)
+
+    def __contains__(self, key):
+        return key in self._memory
+
+    # ---------------- SLOW TIER (OVERRIDE) ----------------
+
+    def _load(self, key):
+        return None
+
+    def _store(self, key, value):
+        pass
+
+    # ---------------- ACCESS ----------------
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Cached value for `key` (memory, then the slow tier), or None."""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+            value = self._load(key)
+            if value is not None:
+                self._remember(key, value)
+                self.hits += 1
+                self.disk_hits += 1
+                return value
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._remember(key, value)
+            self._store(key, value)
+
+    # ---------------- STATS / LIFECYCLE ----------------
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+        }
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory.clear()
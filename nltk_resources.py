@@ -0,0 +1,154 @@
+# ======================================================
+# NLTK RESOURCES - OFFLINE & LAZY PROVISIONING
+# Local Data Directory | Load on First Use | Startup Timings
+# Provision: python nltk_resources.py   (on a connected machine)
+# ======================================================
+
+import os
+import threading
+import time
+import warnings
+from contextlib import contextmanager
+
+from config import NLTK_DATA_DIR, NLTK_AUTO_DOWNLOAD
+
+
+NLTK_PACKAGES = {
+    "stopwords": "corpora/stopwords",
+    "wordnet": "corpora/wordnet",
+    "omw-1.4": "corpora/omw-1.4",
+}
+
+# Stage name -> seconds, filled in as resources load
+STARTUP_TIMINGS = {}
+
+_path_lock = threading.Lock()
+_path_registered = False
+
+
+@contextmanager
+def timed(stage):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STARTUP_TIMINGS[stage] = time.perf_counter() - start
+
+
+def startup_timings():
+    """Copy of the per-stage startup breakdown recorded so far."""
+    return dict(STARTUP_TIMINGS)
+
+
+def _data_dir():
+    # Relative paths are anchored at the project, not the working dir
+    here = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(here, NLTK_DATA_DIR)
+
+
+def _register_data_dir():
+    global _path_registered
+    with _path_lock:
+        if not _path_registered:
+            import nltk
+            if _data_dir() not in nltk.data.path:
+                nltk.data.path.insert(0, _data_dir())
+            _path_registered = True
+
+
+def ensure_resource(package):
+    """
+    Make sure an NLTK package is available locally.
+
+    Looks in NLTK_DATA_DIR first (then NLTK's default paths). Downloads
+    into NLTK_DATA_DIR only when missing and NLTK_AUTO_DOWNLOAD is on, so
+    provisioned or air-gapped nodes never touch the network.
+    """
+    import nltk
+
+    _register_data_dir()
+    try:
+        nltk.data.find(NLTK_PACKAGES[package])
+        return
+    except LookupError:
+        if not NLTK_AUTO_DOWNLOAD:
+            raise LookupError(
+                f"NLTK resource '{package}' is not provisioned. Run "
+                f"`python nltk_resources.py` to install it into "
+                f"{_data_dir()}, or copy it there from a connected machine."
+            ) from None
+
+    with timed(f"nltk.download.{package}"):
+        nltk.download(package, download_dir=_data_dir(), quiet=True)
+    try:
+        nltk.data.find(NLTK_PACKAGES[package])
+    except LookupError:
+        raise LookupError(
+            f"NLTK resource '{package}' is not provisioned and could not be "
+            f"downloaded into {_data_dir()}. Run `python nltk_resources.py` "
+            f"on a connected machine."
+        ) from None
+
+
+def load_stopwords():
+    with timed("nltk.stopwords"):
+        ensure_resource("stopwords")
+        from nltk.corpus import stopwords
+        return set(stopwords.words("english"))
+
+
+class LazyLemmatizer:
+    """
+    WordNetLemmatizer proxy: WordNet is located and loaded on the first
+    lemmatize() call, not when the engine starts.
+    """
+
+    def __init__(self):
+        self._impl = None
+        self._error = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        return self._impl is not None
+
+    def load(self):
+        with self._lock:
+            if self._impl is None:
+                try:
+                    with timed("nltk.wordnet"):
+                        ensure_resource("wordnet")
+                        from nltk.stem import WordNetLemmatizer
+                        impl = WordNetLemmatizer()
+                        impl.lemmatize("warmup")  # forces the corpus reader
+                        self._impl = impl
+                except LookupError as exc:
+                    self._error = exc
+                    raise
+        return self._impl
+
+    def lemmatize(self, word, pos="n"):
+        if self._impl is None:
+            if self._error is not None:
+                return word          # WordNet unavailable: identity
+            try:
+                self.load()
+            except LookupError as exc:
+                warnings.warn(f"Lemmatization disabled: {exc}")
+                return word
+        return self._impl.lemmatize(word, pos)
+
+
+def provision(packages=None, data_dir=None):
+    """Download NLTK packages into the local data directory."""
+    import nltk
+
+    data_dir = os.path.abspath(data_dir) if data_dir else _data_dir()
+    os.makedirs(data_dir, exist_ok=True)
+    for package in packages or NLTK_PACKAGES:
+        ok = nltk.download(package, download_dir=data_dir, quiet=True)
+        print(f"{package:<10} {'ok' if ok else 'FAILED'} -> {data_dir}")
+
+
+if __name__ == "__main__":
+    provision()
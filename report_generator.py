@@ -20,13 +20,14 @@ from reportlab.lib.units import inch
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_JUSTIFY
+from reportlab.graphics import shapes
 from datetime import datetime
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import Wedge, Circle
+from functools import lru_cache
 import numpy as np
 import io
 
+from config import REPORT_CHART_DPI, REPORT_CHART_FORMAT, REPORT_CHART_CACHE_SIZE
+
 
 # ===============================================================================
 # PROFESSIONAL COLOR PALETTE - MODERN CORPORATE
@@ -384,9 +385,20 @@ class ProfessionalCanvas(canvas.Canvas):
 # ADVANCED RADAR CHART - PROFESSIONAL DESIGN
 # ===============================================================================
 
-def generate_professional_radar_chart(semantic, keyword, skill, quality):
+def generate_professional_radar_chart(semantic, keyword, skill, quality, dpi=None):
     """Generate professional-grade radar chart with modern styling"""
     
+    # Labels print one decimal, so rounded scores give the same image
+    png = _radar_chart_png(round(float(semantic), 1), round(float(keyword), 1),
+                           round(float(skill), 1), round(float(quality), 1),
+                           int(dpi or REPORT_CHART_DPI))
+    return io.BytesIO(png)
+
+
+@lru_cache(maxsize=REPORT_CHART_CACHE_SIZE)
+def _radar_chart_png(semantic, keyword, skill, quality, dpi):
+    import matplotlib.pyplot as plt
+    
     labels = [
         "Semantic\nAlignment",
         "Keyword\nOptimization", 
@@ -465,21 +477,30 @@ def generate_professional_radar_chart(semantic, keyword, skill, quality):
     plt.tight_layout()
     
     buffer = io.BytesIO()
-    plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight', 
+    plt.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight', 
                facecolor='white', edgecolor='none')
     plt.close(fig)
-    buffer.seek(0)
     
-    return buffer
+    return buffer.getvalue()
 
 
 # ===============================================================================
 # SCORE GAUGE CHART
 # ===============================================================================
 
-def generate_score_gauge(score, title="Overall Readiness"):
+def generate_score_gauge(score, title="Overall Readiness", dpi=None):
     """Generate professional gauge chart for overall score"""
     
+    png = _score_gauge_png(round(float(score), 1), title,
+                           int(dpi or REPORT_CHART_DPI))
+    return io.BytesIO(png)
+
+
+@lru_cache(maxsize=REPORT_CHART_CACHE_SIZE)
+def _score_gauge_png(score, title, dpi):
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Wedge, Circle
+    
     fig, ax = plt.subplots(figsize=(5, 3), facecolor='white')
     ax.set_aspect('equal')
     
@@ -516,12 +537,139 @@ def generate_score_gauge(score, title="Overall Readiness"):
     plt.tight_layout()
     
     buffer = io.BytesIO()
-    plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight', 
+    plt.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight', 
                facecolor='white', edgecolor='none')
     plt.close(fig)
-    buffer.seek(0)
     
-    return buffer
+    return buffer.getvalue()
+
+
+# ===============================================================================
+# VECTOR CHARTS - NATIVE REPORTLAB DRAWINGS (NO MATPLOTLIB)
+# ===============================================================================
+
+def _score_colors(score):
+    """(badge, text) colours used by the radar score badges"""
+    if score >= 80:
+        return '#10B981', '#065F46'
+    elif score >= 60:
+        return '#4A90E2', '#1E3A5F'
+    elif score >= 40:
+        return '#F59E0B', '#92400E'
+    return '#EF4444', '#991B1B'
+
+
+def radar_chart_drawing(semantic, keyword, skill, quality, size=5 * inch):
+    """Radar chart as a vector Drawing (a flowable; no rasterization)"""
+    
+    hex_ = colors.HexColor
+    d = shapes.Drawing(size, size, hAlign='CENTER')
+    cx = cy = size / 2
+    r = size * 0.34
+    labels = [("Semantic", "Alignment"), ("Keyword", "Optimization"),
+              ("Skill", "Coverage"), ("Structural", "Quality")]
+    scores = [max(0.0, min(float(v), 100.0))
+              for v in (semantic, keyword, skill, quality)]
+    angles = np.linspace(0, 2 * np.pi, len(labels), endpoint=False)
+    
+    def point(angle, value, radius=r):
+        return (cx + radius * value / 100 * np.cos(angle),
+                cy + radius * value / 100 * np.sin(angle))
+    
+    def polygon(values):
+        return [c for a, v in zip(angles, values) for c in point(a, v)]
+    
+    d.add(shapes.String(cx, size - 16, 'ATS Performance Analysis',
+                        textAnchor='middle', fontName='Helvetica-Bold',
+                        fontSize=12, fillColor=hex_('#0A1128')))
+    
+    # Background, grid and spokes
+    d.add(shapes.Circle(cx, cy, r, fillColor=hex_('#FAFBFC'),
+                        strokeColor=hex_('#374151'), strokeWidth=1.5))
+    for level in (25, 50, 75):
+        d.add(shapes.Circle(cx, cy, r * level / 100, fillColor=None,
+                            strokeColor=hex_('#D1D5DB'), strokeWidth=0.8,
+                            strokeDashArray=[3, 3]))
+    for angle in angles:
+        d.add(shapes.Line(cx, cy, *point(angle, 100), strokeColor=hex_('#D1D5DB'),
+                          strokeWidth=0.8, strokeDashArray=[3, 3]))
+    for level in (25, 50, 75, 100):
+        x, y = point(np.pi / 8, level)
+        d.add(shapes.String(x + 2, y, str(level), fontName='Helvetica-Bold',
+                            fontSize=7, fillColor=hex_('#6B7280')))
+    
+    # Benchmark and candidate polygons
+    d.add(shapes.Polygon(polygon([70] * len(labels)), fillColor=None,
+                         strokeColor=hex_('#10B981'), strokeWidth=1.5,
+                         strokeDashArray=[5, 3]))
+    d.add(shapes.Polygon(polygon(scores), fillColor=hex_('#4A90E2'),
+                         fillOpacity=0.25, strokeColor=hex_('#2E5984'),
+                         strokeWidth=2.5, strokeLineJoin=1))
+    for angle, score in zip(angles, scores):
+        d.add(shapes.Circle(*point(angle, score), 4, fillColor=hex_('#4A90E2'),
+                            strokeColor=colors.white, strokeWidth=1.5))
+    
+    # Axis labels and score badges
+    for angle, (line1, line2), score in zip(angles, labels, scores):
+        x, y = point(angle, 100, r + 26)
+        anchor = ('start' if np.cos(angle) > 0.3 else
+                  'end' if np.cos(angle) < -0.3 else 'middle')
+        for dy, text in ((4, line1), (-7, line2)):
+            d.add(shapes.String(x, y + dy, text, textAnchor=anchor,
+                                fontName='Helvetica-Bold', fontSize=9,
+                                fillColor=hex_('#1E3A5F')))
+        badge, text_color = _score_colors(score)
+        bx, by = point(angle, min(score + 14, 112))
+        d.add(shapes.Rect(bx - 20, by - 7, 40, 14, rx=3, ry=3,
+                          fillColor=colors.white, strokeColor=hex_(badge),
+                          strokeWidth=1.2))
+        d.add(shapes.String(bx, by - 3, f'{score:.1f}%', textAnchor='middle',
+                            fontName='Helvetica-Bold', fontSize=8,
+                            fillColor=hex_(text_color)))
+    
+    # Legend
+    lx, ly = size - 110, size - 34
+    d.add(shapes.Line(lx, ly + 3, lx + 16, ly + 3, strokeColor=hex_('#10B981'),
+                      strokeWidth=1.5, strokeDashArray=[4, 2]))
+    d.add(shapes.String(lx + 20, ly, 'Industry Benchmark', fontName='Helvetica',
+                        fontSize=7.5, fillColor=hex_('#374151')))
+    return d
+
+
+def score_gauge_drawing(score, title="Overall Readiness",
+                        width=4.5 * inch, height=2.7 * inch):
+    """Semicircular gauge as a vector Drawing: 0 at the left, 100 at the right"""
+    
+    hex_ = colors.HexColor
+    score = max(0.0, min(float(score), 100.0))
+    d = shapes.Drawing(width, height, hAlign='CENTER')
+    cx, cy = width / 2, height * 0.38
+    r = min(width * 0.42, height * 0.58)
+    
+    segment_colors = ['#EF4444', '#F59E0B', '#4A90E2', '#10B981']
+    for i, col in enumerate(segment_colors):
+        wedge = shapes.Wedge(cx, cy, r, 180 - 45 * (i + 1), 180 - 45 * i,
+                             fillColor=hex_(col), strokeColor=colors.white,
+                             strokeWidth=2)
+        wedge.radius1 = r * 0.70
+        d.add(wedge)
+    
+    # Needle
+    angle = np.radians(180 - score * 1.8)
+    d.add(shapes.Line(cx, cy, cx + r * 0.85 * np.cos(angle),
+                      cy + r * 0.85 * np.sin(angle),
+                      strokeColor=hex_('#0A1128'), strokeWidth=3,
+                      strokeLineCap=1))
+    d.add(shapes.Circle(cx, cy, r * 0.07, fillColor=hex_('#0A1128'),
+                        strokeColor=None))
+    
+    d.add(shapes.String(cx, cy - r * 0.38, f'{score:.1f}%', textAnchor='middle',
+                        fontName='Helvetica-Bold', fontSize=26,
+                        fillColor=hex_('#0A1128')))
+    d.add(shapes.String(cx, cy - r * 0.38 - 20, title, textAnchor='middle',
+                        fontName='Helvetica', fontSize=11,
+                        fillColor=hex_('#6B7280')))
+    return d
 
 
 # ===============================================================================
@@ -687,12 +835,17 @@ def generate_pdf_report(data):
     Generate ultra-professional PDF report with executive-grade quality
     
     Args:
-        data: Report data dictionary with scores and candidate information
+        data: Report data dictionary with scores and candidate information.
+            Optional "chart_format": "png" (cached matplotlib images) or
+            "vector" (native ReportLab drawings), and "chart_dpi" for png;
+            default to REPORT_CHART_FORMAT / REPORT_CHART_DPI.
     
     Returns:
         bytes: Professional PDF content
     """
     
+    chart_format = data.get("chart_format", REPORT_CHART_FORMAT)
+    chart_dpi = data.get("chart_dpi", REPORT_CHART_DPI)
     buffer = io.BytesIO()
     
     doc = SimpleDocTemplate(
@@ -863,8 +1016,12 @@ def generate_pdf_report(data):
     
     # Overall Score Gauge
     try:
-        gauge_buffer = generate_score_gauge(readiness, "ATS Readiness Score")
-        elements.append(Image(gauge_buffer, width=4.5*inch, height=2.7*inch))
+        if chart_format == "vector":
+            elements.append(score_gauge_drawing(readiness, "ATS Readiness Score"))
+        else:
+            gauge_buffer = generate_score_gauge(readiness, "ATS Readiness Score",
+                                                dpi=chart_dpi)
+            elements.append(Image(gauge_buffer, width=4.5*inch, height=2.7*inch))
     except Exception as e:
         elements.append(Paragraph(f"Score visualization unavailable: {str(e)}", body_text))
     
@@ -990,8 +1147,12 @@ def generate_pdf_report(data):
     elements.append(Paragraph("Multi-Dimensional Performance Radar", subsection_heading))
     
     try:
-        radar_buffer = generate_professional_radar_chart(semantic, keyword, skill, quality)
-        elements.append(Image(radar_buffer, width=5*inch, height=5*inch))
+        if chart_format == "vector":
+            elements.append(radar_chart_drawing(semantic, keyword, skill, quality))
+        else:
+            radar_buffer = generate_professional_radar_chart(semantic, keyword, skill, quality,
+                                                             dpi=chart_dpi)
+            elements.append(Image(radar_buffer, width=5*inch, height=5*inch))
     except Exception as e:
         elements.append(Paragraph(f"Radar visualization unavailable: {str(e)}", body_text))
     
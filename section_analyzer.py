@@ -1,9 +1,11 @@
 # ======================================================
 # SECTION ANALYZER - ADVANCED VERSION
 # Intelligent Resume Section Extraction
+# Single Pass | Line-Anchored Headers | Offset Spans
 # ======================================================
 
 import re
+from collections import namedtuple
 
 
 SECTION_PATTERNS = {
@@ -13,24 +15,68 @@ SECTION_PATTERNS = {
     "projects": r"(projects|academic projects|research|personal projects)"
 }
 
+# Headers that are not reported but still end the section before them
+OTHER_SECTION_PATTERNS = (
+    r"(summary|professional summary|profile|objective|career objective|"
+    r"certifications?|licenses|awards|achievements|honors|publications|"
+    r"languages|interests|hobbies|volunteering|volunteer experience|"
+    r"references|contact|contact information|personal details|"
+    r"courses|training|activities|leadership)"
+)
 
-def extract_sections(text):
+# A trailing qualifier of up to three words: "Skills & Tools",
+# "PROJECTS & RESEARCH", "Education and Certifications"
+_QUALIFIER = (r"(?:[ \t]*(?:&|\band\b)[ \t]*[A-Za-z][\w-]*"
+              r"(?:[ \t]+(?:&[ \t]+)?[A-Za-z][\w-]*){0,2})?")
+
+# A header is a whole line: optional bullet / numbering, the header words
+# and qualifier, then either nothing or ":" followed by inline content
+# ("Skills: SQL")
+_HEADER = re.compile(
+    r"^[ \t]*(?:[-•*▪●#>]+[ \t]*|\d+[.)][ \t]*)?"
+    r"(?:" + "|".join(f"(?P<{name}>{pattern})"
+                      for name, pattern in SECTION_PATTERNS.items())
+    + f"|(?P<_other>{OTHER_SECTION_PATTERNS})"
+    r")" + _QUALIFIER + r"[ \t]*(?::[^\n]*)?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE
+)
+
+SectionSpan = namedtuple("SectionSpan", ["name", "start", "body", "end"])
+
+
+def segment_sections(text):
     """
-    Extract structured resume sections using flexible header detection.
+    One pass over the text: every header line is classified by a single
+    compiled alternation, and each section runs to the next header.
+
+    Returns SectionSpan(name, start, body, end) offsets into `text`
+    (start: header line, body: after the header word, end: next header),
+    so callers slice only what they need. Unreported headers are named
+    "_other".
     """
+    headers = [(m.lastgroup, m.start(), m.end(m.lastgroup))
+               for m in _HEADER.finditer(text or "")]
+    spans = []
+    for i, (name, start, body) in enumerate(headers):
+        end = headers[i + 1][1] if i + 1 < len(headers) else len(text)
+        spans.append(SectionSpan(name, start, body, end))
+    return spans
 
-    if not text:
-        return {key: "" for key in SECTION_PATTERNS}
 
-    sections = {key: "" for key in SECTION_PATTERNS}
-    text_lower = text.lower()
+def extract_sections(text):
+    """
+    Extract structured resume sections using flexible header detection.
 
-    for section_name, pattern in SECTION_PATTERNS.items():
+    Each reported section is its first occurrence, header line included,
+    up to the next recognised header (any section, reported or not).
+    """
 
-        regex = rf"{pattern}.*?(?=\n[A-Z][^\n]+\n|\Z)"
-        match = re.search(regex, text_lower, re.DOTALL)
+    sections = {key: "" for key in SECTION_PATTERNS}
+    if not text:
+        return sections
 
-        if match:
-            sections[section_name] = match.group().strip()
+    for span in segment_sections(text):
+        if span.name in sections and not sections[span.name]:
+            sections[span.name] = text[span.start:span.end].strip()
 
     return sections
@@ -0,0 +1,296 @@
+# ======================================================
+# SEMANTIC INDEX - APPROXIMATE NEAREST NEIGHBOUR
+# IVF + Product Quantization in Pure NumPy (memory-mapped)
+# ======================================================
+
+import json
+import os
+import time
+
+import numpy as np
+
+
+# ------------------------------------------------------
+# HELPERS
+# ------------------------------------------------------
+
+def _nearest(X, C, batch=8192):
+    """Index and squared L2 distance of the nearest row of C for each x."""
+    c_sq = (C * C).sum(axis=1)
+    labels = np.empty(len(X), dtype=np.int64)
+    dists = np.empty(len(X), dtype=np.float32)
+    for start in range(0, len(X), batch):
+        xb = X[start:start + batch]
+        d = c_sq[None, :] - 2.0 * (xb @ C.T)
+        labels[start:start + batch] = d.argmin(axis=1)
+        dists[start:start + batch] = (
+            d[np.arange(len(xb)), labels[start:start + batch]]
+            + (xb * xb).sum(axis=1)
+        )
+    return labels, dists
+
+
+def kmeans(X, k, iters=20, seed=0):
+    """Plain Lloyd's k-means; empty clusters are re-seeded from data."""
+    X = np.asarray(X, dtype=np.float32)
+    rng = np.random.default_rng(seed)
+    k = min(k, len(X))
+    C = X[rng.choice(len(X), k, replace=False)].copy()
+    for _ in range(iters):
+        labels, _ = _nearest(X, C)
+        counts = np.bincount(labels, minlength=k)
+        sums = np.zeros_like(C)
+        order = np.argsort(labels, kind="stable")
+        bounds = np.concatenate([[0], np.cumsum(counts)])
+        sorted_x = X[order]
+        for c in np.flatnonzero(counts):
+            sums[c] = sorted_x[bounds[c]:bounds[c + 1]].sum(axis=0)
+        empty = counts == 0
+        C[~empty] = sums[~empty] / counts[~empty, None]
+        if empty.any():
+            C[empty] = X[rng.choice(len(X), int(empty.sum()), replace=False)]
+    return C
+
+
+def _normalize(X):
+    X = np.asarray(X, dtype=np.float32)
+    norms = np.linalg.norm(X, axis=-1, keepdims=True)
+    return X / np.where(norms == 0, 1.0, norms)
+
+
+# ------------------------------------------------------
+# EXACT BASELINE
+# ------------------------------------------------------
+
+class FlatIndex:
+    """Brute-force cosine search (reference for recall benchmarks)."""
+
+    def __init__(self, vectors, ids=None):
+        self.vectors = _normalize(vectors)
+        self.ids = list(ids) if ids is not None else list(range(len(vectors)))
+
+    def search(self, query, k=10):
+        scores = self.vectors @ _normalize(query)
+        k = min(k, len(scores))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+        return [(self.ids[i], float(scores[i])) for i in best]
+
+
+# ------------------------------------------------------
+# IVF-PQ
+# ------------------------------------------------------
+
+class IVFPQIndex:
+    """
+    Inverted-file index with product-quantized residuals.
+
+    Vectors are L2-normalised, so squared L2 distance ranks exactly like
+    cosine similarity. A coarse k-means picks `n_lists` cells; residuals
+    to the cell centroid are split into `n_subvectors` chunks, each
+    coded as one byte. Search probes the `n_probe` closest cells and
+    scores their codes with per-query lookup tables (ADC). When raw
+    vectors are stored, the best candidates are re-ranked exactly.
+    """
+
+    def __init__(self, n_lists=256, n_subvectors=8, n_probe=16,
+                 rerank=True, rerank_factor=16, seed=0):
+        self.n_lists = n_lists
+        self.n_subvectors = n_subvectors
+        self.n_probe = n_probe
+        self.rerank = rerank
+        self.rerank_factor = rerank_factor
+        self.seed = seed
+
+        self.centroids = None          # (n_lists, d)
+        self.codebooks = None          # (m, ksub, dsub)
+        self.codes = np.zeros((0, n_subvectors), dtype=np.uint8)
+        self.lists = np.zeros(0, dtype=np.int32)
+        self.vectors = None            # (n, d) float32, optional
+        self.ids = []
+        self._offsets = None
+        self._order = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def is_trained(self):
+        return self.centroids is not None
+
+    # ---------------- BUILD ----------------
+
+    def train(self, X):
+        X = _normalize(X)
+        d = X.shape[1]
+        if d % self.n_subvectors:
+            raise ValueError(
+                f"Dimension {d} is not divisible by {self.n_subvectors} subvectors"
+            )
+        self.centroids = kmeans(X, self.n_lists, seed=self.seed)
+        self.n_lists = len(self.centroids)
+
+        labels, _ = _nearest(X, self.centroids)
+        residuals = X - self.centroids[labels]
+        dsub = d // self.n_subvectors
+        ksub = min(256, len(X))
+        self.codebooks = np.stack([
+            kmeans(residuals[:, j * dsub:(j + 1) * dsub], ksub,
+                   seed=self.seed + j + 1)
+            for j in range(self.n_subvectors)
+        ])
+        return self
+
+    def _encode(self, residuals):
+        dsub = self.codebooks.shape[2]
+        codes = np.empty((len(residuals), self.n_subvectors), dtype=np.uint8)
+        for j in range(self.n_subvectors):
+            codes[:, j], _ = _nearest(
+                residuals[:, j * dsub:(j + 1) * dsub], self.codebooks[j]
+            )
+        return codes
+
+    def add(self, X, ids=None):
+        if not self.is_trained:
+            self.train(X)
+        X = _normalize(X)
+        if ids is None:
+            ids = range(len(self.ids), len(self.ids) + len(X))
+        labels, _ = _nearest(X, self.centroids)
+        codes = self._encode(X - self.centroids[labels])
+
+        self.codes = np.concatenate([np.asarray(self.codes), codes])
+        self.lists = np.concatenate([np.asarray(self.lists),
+                                     labels.astype(np.int32)])
+        if self.rerank:
+            base = (np.asarray(self.vectors) if self.vectors is not None
+                    else np.zeros((0, X.shape[1]), dtype=np.float32))
+            self.vectors = np.concatenate([base, X])
+        self.ids.extend(ids)
+        self._build_lists()
+        return self
+
+    def _build_lists(self):
+        self._order = np.argsort(self.lists, kind="stable")
+        counts = np.bincount(self.lists, minlength=self.n_lists)
+        self._offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    # ---------------- SEARCH ----------------
+
+    def search(self, query, k=10, n_probe=None):
+        """Top-k (id, cosine) pairs for one query embedding."""
+        if not self.ids:
+            return []
+        q = _normalize(query)
+        n_probe = min(n_probe or self.n_probe, self.n_lists)
+
+        coarse = ((self.centroids - q) ** 2).sum(axis=1)
+        probe = np.argpartition(coarse, n_probe - 1)[:n_probe]
+
+        dsub = self.codebooks.shape[2]
+        m_idx = np.arange(self.n_subvectors)
+        cand_rows, cand_dists = [], []
+        for cell in probe:
+            rows = self._order[self._offsets[cell]:self._offsets[cell + 1]]
+            if not len(rows):
+                continue
+            residual = (q - self.centroids[cell]).reshape(self.n_subvectors, dsub)
+            lut = ((self.codebooks - residual[:, None, :]) ** 2).sum(axis=2)
+            codes = np.asarray(self.codes[rows])
+            cand_rows.append(rows)
+            cand_dists.append(lut[m_idx, codes].sum(axis=1))
+        if not cand_rows:
+            return []
+        rows = np.concatenate(cand_rows)
+        dists = np.concatenate(cand_dists)
+
+        # PQ distances are coarse: shortlist generously, then re-rank exactly
+        shortlist = k * self.rerank_factor if self.vectors is not None else k
+        shortlist = min(len(rows), shortlist)
+        keep = np.argpartition(dists, shortlist - 1)[:shortlist]
+        rows, dists = rows[keep], dists[keep]
+
+        if self.vectors is not None:
+            rows = np.sort(rows)              # sequential memmap reads
+            scores = np.asarray(self.vectors[rows]) @ q
+        else:
+            scores = 1.0 - dists / 2.0       # unit vectors: |a-b|^2 = 2 - 2cos
+
+        top = np.argsort(-scores, kind="stable")[:k]
+        return [(self.ids[rows[i]], float(scores[i])) for i in top]
+
+    # ---------------- PERSISTENCE ----------------
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "centroids.npy"), self.centroids)
+        np.save(os.path.join(directory, "codebooks.npy"), self.codebooks)
+        np.save(os.path.join(directory, "codes.npy"), np.asarray(self.codes))
+        np.save(os.path.join(directory, "lists.npy"), np.asarray(self.lists))
+        if self.vectors is not None:
+            np.save(os.path.join(directory, "vectors.npy"),
+                    np.asarray(self.vectors))
+        with open(os.path.join(directory, "meta.json"), "w",
+                  encoding="utf-8") as f:
+            json.dump({
+                "n_lists": self.n_lists,
+                "n_subvectors": self.n_subvectors,
+                "n_probe": self.n_probe,
+                "rerank": self.rerank,
+                "rerank_factor": self.rerank_factor,
+                "seed": self.seed,
+                "ids": self.ids,
+            }, f)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """Load an index; codes and vectors are memory-mapped by default."""
+        with open(os.path.join(directory, "meta.json"), "r",
+                  encoding="utf-8") as f:
+            meta = json.load(f)
+        mode = "r" if mmap else None
+        index = cls(meta["n_lists"], meta["n_subvectors"], meta["n_probe"],
+                    meta["rerank"], meta.get("rerank_factor", 16),
+                    meta["seed"])
+        index.centroids = np.load(os.path.join(directory, "centroids.npy"))
+        index.codebooks = np.load(os.path.join(directory, "codebooks.npy"))
+        index.codes = np.load(os.path.join(directory, "codes.npy"),
+                              mmap_mode=mode)
+        index.lists = np.load(os.path.join(directory, "lists.npy"))
+        vectors_path = os.path.join(directory, "vectors.npy")
+        if os.path.exists(vectors_path):
+            index.vectors = np.load(vectors_path, mmap_mode=mode)
+        index.ids = meta["ids"]
+        index._build_lists()
+        return index
+
+
+# ------------------------------------------------------
+# RECALL VS LATENCY
+# ------------------------------------------------------
+
+def recall_latency_table(index, exact, queries, k=10,
+                         probes=(1, 2, 4, 8, 16, 32)):
+    """
+    Recall@k and mean latency of `index` against exact search for each
+    n_probe setting. Returns a list of dict rows.
+    """
+    truth = [{i for i, _ in exact.search(q, k)} for q in queries]
+
+    start = time.perf_counter()
+    for q in queries:
+        exact.search(q, k)
+    exact_ms = (time.perf_counter() - start) / len(queries) * 1000
+
+    rows = []
+    for n_probe in probes:
+        if n_probe > index.n_lists:
+            break
+        start = time.perf_counter()
+        found = [{i for i, _ in index.search(q, k, n_probe=n_probe)}
+                 for q in queries]
+        ms = (time.perf_counter() - start) / len(queries) * 1000
+        recall = np.mean([len(f & t) / len(t) for f, t in zip(found, truth)])
+        rows.append({"n_probe": n_probe, "recall": float(recall),
+                     "ms_per_query": ms, "exact_ms_per_query": exact_ms})
+    return rows
@@ -0,0 +1,157 @@
+# ======================================================
+# SEMANTIC SKILLS - EMBEDDING-BASED SKILL MATCHING
+# Precomputed Skill Matrix | One Batch + One Matmul per Resume
+# ======================================================
+
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+
+
+# Phrase boundaries in resumes: list separators, bullets, brackets, clauses
+_PHRASE_SPLIT = re.compile(r"[\n,;|•·●▪()\[\]/]+|\.\s+|:\s+|\s[-–—]\s")
+_WORDS = re.compile(r"[A-Za-z0-9](?:[A-Za-z0-9+#.\-]*[A-Za-z0-9+#])?")
+
+
+def resume_phrases(text, max_words=6, max_phrases=256):
+    """
+    Short distinct phrases that may name a skill ("Plotly dashboards").
+    Fragments longer than `max_words` are cut into overlapping windows.
+    """
+    phrases = {}
+    stride = max(1, max_words // 2)
+    for fragment in _PHRASE_SPLIT.split(text or ""):
+        words = _WORDS.findall(fragment)
+        if not words:
+            continue
+        if len(words) <= max_words:
+            spans = [words]
+        else:
+            spans = [words[i:i + max_words]
+                     for i in range(0, len(words) - max_words + stride, stride)]
+        for span in spans:
+            phrase = " ".join(span)
+            phrases.setdefault(phrase.lower(), phrase)
+            if len(phrases) >= max_phrases:
+                return list(phrases.values())
+    return list(phrases.values())
+
+
+def _normalize_rows(X):
+    X = np.asarray(X, dtype=np.float32)
+    norms = np.linalg.norm(X, axis=1, keepdims=True)
+    return X / np.where(norms == 0, 1.0, norms)
+
+
+class SkillVectors:
+    """
+    One L2-normalised embedding row per canonical skill: the mean of the
+    embeddings of its ID and all its aliases. Matching a resume against
+    any set of skills is then one matrix product.
+    """
+
+    def __init__(self, ids, matrix):
+        self.ids = list(ids)
+        self.matrix = matrix
+        self._row = {skill_id: i for i, skill_id in enumerate(self.ids)}
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def build(cls, ontology, encode, batch_size=256):
+        """
+        Embed every alias of every skill (in batches via `encode`, which
+        takes a list of texts) and average them per skill.
+        """
+        groups = {}
+        for alias, skill_id in ontology.aliases.items():
+            groups.setdefault(skill_id, []).append(alias)
+        ids = sorted(groups)
+        texts = [alias for skill_id in ids for alias in groups[skill_id]]
+        owner = np.repeat(np.arange(len(ids)),
+                          [len(groups[skill_id]) for skill_id in ids])
+
+        vectors = []
+        for start in range(0, len(texts), batch_size):
+            vectors.append(_normalize_rows(encode(texts[start:start + batch_size])))
+        vectors = np.vstack(vectors) if vectors else np.zeros((0, 0), np.float32)
+
+        matrix = np.zeros((len(ids), vectors.shape[1]), dtype=np.float32)
+        np.add.at(matrix, owner, vectors)
+        return cls(ids, _normalize_rows(matrix))
+
+    # ---------------- PERSISTENCE ----------------
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "matrix.npy"), self.matrix)
+        with open(os.path.join(directory, "ids.json"), "w",
+                  encoding="utf-8") as f:
+            json.dump(self.ids, f)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        with open(os.path.join(directory, "ids.json"), "r",
+                  encoding="utf-8") as f:
+            ids = json.load(f)
+        matrix = np.load(os.path.join(directory, "matrix.npy"),
+                         mmap_mode="r" if mmap else None)
+        return cls(ids, matrix)
+
+    # ---------------- MATCH ----------------
+
+    def match(self, phrase_vectors, phrases, skill_ids, threshold=0.6):
+        """
+        {skill id: (cosine, best phrase)} for each requested skill whose
+        nearest phrase clears `threshold`. `phrase_vectors` must be
+        L2-normalised, one row per phrase.
+        """
+        skill_ids = [s for s in dict.fromkeys(skill_ids) if s in self._row]
+        if not skill_ids or not len(phrases):
+            return {}
+        rows = np.asarray(self.matrix[[self._row[s] for s in skill_ids]])
+        sims = np.asarray(phrase_vectors, dtype=np.float32) @ rows.T
+        best = sims.argmax(axis=0)
+        scores = sims[best, np.arange(len(skill_ids))]
+        return {skill_id: (float(score), phrases[b])
+                for skill_id, b, score in zip(skill_ids, best, scores)
+                if score >= threshold}
+
+
+# ------------------------------------------------------
+# CACHED ARTIFACT
+# ------------------------------------------------------
+
+def skill_vectors_key(ontology, model_tag):
+    """Changes whenever the model or any skill / alias changes."""
+    digest = hashlib.sha256(model_tag.encode("utf-8"))
+    for alias, skill_id in sorted(ontology.aliases.items()):
+        digest.update(f"\0{alias}\t{skill_id}".encode("utf-8"))
+    return digest.hexdigest()[:24]
+
+
+def load_skill_vectors(ontology, model_tag, encode, directory=None):
+    """
+    Skill matrix for this ontology and model, loaded from `directory`
+    when a matching artifact exists, otherwise built and saved there.
+    """
+    path = None
+    if directory:
+        path = os.path.join(directory, skill_vectors_key(ontology, model_tag))
+        if os.path.exists(os.path.join(path, "ids.json")):
+            try:
+                return SkillVectors.load(path)
+            except (OSError, ValueError):
+                pass                  # damaged artifact: rebuild
+
+    vectors = SkillVectors.build(ontology, encode)
+    if path:
+        try:
+            vectors.save(path)
+        except OSError:
+            pass
+    return vectors
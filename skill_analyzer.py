@@ -0,0 +1,70 @@
+# ======================================================
+# SKILL ANALYZER - HEADLESS VERSION
+# Skill Extraction + Match Scoring (no UI dependencies)
+# ======================================================
+
+import os
+import threading
+import warnings
+
+from config import (
+    SKILL_KEYWORDS, SKILL_ONTOLOGY_FILE, SKILL_ONTOLOGY_CACHE,
+    FUZZY_SKILL_MATCHING
+)
+from skill_matcher import get_matcher
+from skill_ontology import SkillOntology, load_ontology
+
+
+_default_ontology = None
+_ontology_lock = threading.Lock()
+
+
+def default_ontology():
+    """
+    The configured skill ontology, compiled (or loaded from its cached
+    artifact) on first use. Falls back to a flat SKILL_KEYWORDS list.
+    """
+    global _default_ontology
+    with _ontology_lock:
+        if _default_ontology is None:
+            here = os.path.dirname(os.path.abspath(__file__))
+            path = os.path.join(here, SKILL_ONTOLOGY_FILE)
+            try:
+                _default_ontology = load_ontology(path, SKILL_ONTOLOGY_CACHE)
+            except Exception as exc:
+                warnings.warn(f"Skill ontology unavailable ({exc}); "
+                              "using SKILL_KEYWORDS")
+                _default_ontology = SkillOntology.from_keywords(SKILL_KEYWORDS)
+        return _default_ontology
+
+
+def extract_skills(text, skills=None, fuzzy=FUZZY_SKILL_MATCHING):
+    """
+    Extract canonical skill IDs from text using word-boundary matching.
+
+    Aliases ("sklearn", "PowerBI") resolve to their canonical skill. All
+    skills are found in one pass by a prebuilt token automaton, so the
+    cost does not grow with the size of the ontology. An explicit
+    `skills` list bypasses the ontology and is matched verbatim.
+    `fuzzy` adds typo-tolerant matches ("Tablaeu" -> tableau).
+    """
+    if not text:
+        return []
+    if skills:
+        return get_matcher(skills).extract(text)
+    return default_ontology().extract(text, fuzzy=fuzzy)
+
+
+def matched_skills(resume_skills, jd_skills):
+    """JD skills covered by the resume, directly or via a sub-skill."""
+    return default_ontology().covered(resume_skills, jd_skills)
+
+
+def skill_match_score(resume_skills, jd_skills):
+    """
+    Percentage of JD skills covered by the resume, clamped to 0-100.
+    """
+    if not jd_skills:
+        return 0.0
+    matched = matched_skills(resume_skills, jd_skills)
+    return float(max(0.0, min((len(matched) / len(set(jd_skills))) * 100, 100.0)))
@@ -0,0 +1,116 @@
+# ======================================================
+# SKILL MATCHER - MULTI-PATTERN AUTOMATON
+# Aho-Corasick over Word Tokens | One Linear Pass per Text
+# ======================================================
+
+import re
+from collections import deque
+from functools import lru_cache
+
+
+# Word tokens; a trailing run of + or # keeps "c++" and "c#" intact
+_TOKEN = re.compile(r"[a-z0-9]+[+#]*")
+
+
+def skill_tokens(text):
+    return _TOKEN.findall((text or "").lower())
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton whose alphabet is word tokens, not characters.
+
+    Every skill is a token sequence, so matches always start and end on
+    word boundaries and multi-word skills ("power bi") need no special
+    casing. Building is O(total skill tokens); matching is one pass over
+    the text's tokens regardless of taxonomy size.
+
+    `labels` optionally maps each pattern to the name reported for it
+    (e.g. several aliases to one canonical skill).
+    """
+
+    def __init__(self, skills, labels=None):
+        self.skills = []               # pattern id -> reported skill name
+        self._vocab = {}               # token -> symbol id
+        self._goto = [{}]              # state -> {symbol: state}
+        self._out = [[]]               # state -> pattern ids ending here
+        self._fail = [0]
+        self._lengths = []             # pattern id -> tokens
+
+        skills = list(skills)
+        for skill, label in zip(skills, labels or skills):
+            self._insert(skill, label)
+        self._link()
+
+    def __len__(self):
+        return len(self.skills)
+
+    # ---------------- BUILD ----------------
+
+    def _insert(self, skill, label):
+        tokens = skill_tokens(skill)
+        if not tokens:
+            return
+        state = 0
+        for token in tokens:
+            symbol = self._vocab.setdefault(token, len(self._vocab))
+            nxt = self._goto[state].get(symbol)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][symbol] = nxt
+                self._goto.append({})
+                self._out.append([])
+                self._fail.append(0)
+            state = nxt
+        if self._out[state]:
+            return                    # same token sequence already added
+        self._out[state].append(len(self.skills))
+        self.skills.append(label)
+        self._lengths.append(len(tokens))
+
+    def _link(self):
+        """Breadth-first failure links; outputs are merged along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for symbol, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and symbol not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(symbol, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    # ---------------- MATCH ----------------
+
+    def find_all(self, text):
+        """[(skill, start token, end token)] for every occurrence."""
+        goto, fail, out = self._goto, self._fail, self._out
+        vocab = self._vocab
+        state, matches = 0, []
+        for i, token in enumerate(skill_tokens(text)):
+            symbol = vocab.get(token)
+            if symbol is None:
+                state = 0
+                continue
+            while state and symbol not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(symbol, 0)
+            for pid in out[state]:
+                matches.append((self.skills[pid], i + 1 - self._lengths[pid], i + 1))
+        return matches
+
+    def extract(self, text):
+        """Sorted distinct skills present in the text."""
+        return sorted({skill for skill, _, _ in self.find_all(text)})
+
+
+@lru_cache(maxsize=8)
+def _cached_matcher(skills):
+    return SkillMatcher(skills)
+
+
+def get_matcher(skills):
+    """Matcher for a skill list, built once per distinct list and reused."""
+    return _cached_matcher(tuple(skills))
@@ -0,0 +1,175 @@
+# ======================================================
+# SKILL ONTOLOGY - CANONICAL SKILLS, ALIASES, HIERARCHY
+# JSON Source -> Compiled Alias Map + Matcher (cached on disk)
+# ======================================================
+
+import hashlib
+import json
+import os
+import pickle
+import warnings
+
+from config import FUZZY_SKILL_THRESHOLD
+from skill_matcher import SkillMatcher, skill_tokens
+
+
+# Bump when the compiled layout changes so stale artifacts are rebuilt
+_COMPILED_VERSION = 3
+
+
+def normalize_alias(text):
+    """Lookup form of a skill name: lower-case word tokens, one space apart."""
+    return " ".join(skill_tokens(text))
+
+
+class SkillOntology:
+    """
+    Canonical skills with aliases, parent skills and categories.
+
+    Canonical IDs are lower-case skill names ("machine learning"), so
+    they read well in the UI and reports. Every alias and every ID is
+    compiled into a normalized-alias -> ID map and one SkillMatcher, so
+    extraction stays a single pass over the text.
+
+    "parents" are sub-skill links (deep learning is machine learning,
+    postgresql is sql) and carry coverage up the hierarchy. "categories"
+    only group a tool with the area it is used in (excel -> data
+    analysis, git -> programming) and never imply that area.
+
+    `generic` terms are common words that must not be read as a skill,
+    not even as a typo of one (see FuzzySkillMatcher).
+    """
+
+    def __init__(self, skills, generic=()):
+        self.generic = tuple(generic)
+        self.parents = {}              # id -> [parent ids]
+        self.categories = {}           # id -> [category ids]
+        self.aliases = {}              # normalized alias -> id
+        for entry in skills:
+            skill_id = normalize_alias(entry["id"])
+            self.parents[skill_id] = [normalize_alias(p)
+                                      for p in entry.get("parents", [])]
+            self.categories[skill_id] = [normalize_alias(c)
+                                         for c in entry.get("categories", [])]
+            for alias in [entry["id"]] + list(entry.get("aliases", [])):
+                self.aliases.setdefault(normalize_alias(alias), skill_id)
+
+        self._ancestors = {s: self._walk_up(s) for s in self.parents}
+        self.matcher = SkillMatcher(list(self.aliases),
+                                    list(self.aliases.values()))
+
+    def __len__(self):
+        return len(self.parents)
+
+    def __contains__(self, skill_id):
+        return skill_id in self.parents
+
+    def _walk_up(self, skill_id):
+        seen, stack = set(), list(self.parents.get(skill_id, []))
+        while stack:
+            parent = stack.pop()
+            if parent not in seen:
+                seen.add(parent)
+                stack.extend(self.parents.get(parent, []))
+        seen.discard(skill_id)
+        return frozenset(seen)
+
+    # ---------------- CONSTRUCTION ----------------
+
+    @classmethod
+    def from_keywords(cls, keywords):
+        """Flat ontology (no aliases, no hierarchy) from a skill list."""
+        return cls([{"id": k} for k in keywords])
+
+    # ---------------- LOOKUP ----------------
+
+    def canonical(self, term):
+        """Canonical ID for a skill name or alias, or None."""
+        return self.aliases.get(normalize_alias(term))
+
+    def ancestors(self, skill_id):
+        return self._ancestors.get(skill_id, frozenset())
+
+    def extract(self, text, fuzzy=False):
+        """
+        Sorted canonical IDs of every skill mentioned in the text. With
+        `fuzzy`, tokens not matched exactly also go through the typo-
+        tolerant matcher ("Tablaeu", "machin learning").
+        """
+        if not fuzzy:
+            return self.matcher.extract(text)
+        matches = self.matcher.find_all(text)
+        found = {skill for skill, _, _ in matches}
+        fuzzy_matcher = self.fuzzy_matcher()
+        if fuzzy_matcher is not None:
+            covered = {i for _, start, end in matches for i in range(start, end)}
+            found.update(fuzzy_matcher.extract(text, covered))
+        return sorted(found)
+
+    def fuzzy_matcher(self):
+        """FuzzySkillMatcher over all aliases, built on first use (or None
+        when rapidfuzz is not installed)."""
+        if getattr(self, "_fuzzy", None) is None:
+            try:
+                from fuzzy_skills import FuzzySkillMatcher
+                self._fuzzy = FuzzySkillMatcher(
+                    self.aliases, threshold=FUZZY_SKILL_THRESHOLD,
+                    generic=self.generic
+                )
+            except ImportError as exc:
+                warnings.warn(f"Fuzzy skill matching disabled ({exc})")
+                self._fuzzy = False
+        return self._fuzzy or None
+
+    def covered(self, resume_skills, jd_skills):
+        """
+        JD skills the resume satisfies, directly or through a more
+        specific skill (a resume listing "deep learning" covers a JD
+        asking for "machine learning"). Categories are not followed: a
+        resume listing only "excel" does not cover "data analysis".
+        """
+        have = set(resume_skills)
+        for skill in resume_skills:
+            have |= self.ancestors(skill)
+        return sorted(set(jd_skills) & have)
+
+
+# ------------------------------------------------------
+# COMPILED ARTIFACT
+# ------------------------------------------------------
+
+def load_ontology(path, cache_path=None):
+    """
+    Ontology from a JSON file, reusing the pickled compiled form in
+    `cache_path` while the source file's SHA-256 is unchanged.
+    """
+    with open(path, "rb") as f:
+        source = f.read()
+    digest = hashlib.sha256(source).hexdigest()
+
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+            if (cached.get("version") == _COMPILED_VERSION
+                    and cached.get("source_sha256") == digest):
+                return cached["ontology"]
+        except Exception:
+            pass                      # unreadable artifact: recompile
+
+    spec = json.loads(source.decode("utf-8"))
+    ontology = SkillOntology(spec["skills"], spec.get("generic_terms", ()))
+
+    if cache_path:
+        try:
+            os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+            tmp = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump({"version": _COMPILED_VERSION,
+                             "source_sha256": digest,
+                             "ontology": ontology}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_path)
+        except OSError:
+            pass
+    return ontology
@@ -2,38 +2,23 @@
 # SKILLS MODULE — Pure light palette
 # ======================================================
 
-import re
 import streamlit as st
 import streamlit.components.v1 as components
-from config import SKILL_KEYWORDS
+from skill_analyzer import extract_skills, matched_skills, skill_match_score
 
 
-def extract_skills(text):
-    if not text:
-        return []
-    text = text.lower()
-    found = []
-    for skill in SKILL_KEYWORDS:
-        pattern = r"\b" + re.escape(skill.lower()) + r"\b"
-        if re.search(pattern, text):
-            found.append(skill)
-    return sorted(list(set(found)))
+def render_skills_page(resume_text, jd_text, matched=None, skill_score=None,
+                       resume_skills=None, jd_skills=None):
 
-
-def skill_match_score(resume_skills, jd_skills):
-    if not jd_skills:
-        return 0.0
-    matched = set(resume_skills) & set(jd_skills)
-    return float(max(0.0, min((len(matched) / len(jd_skills)) * 100, 100.0)))
-
-
-def render_skills_page(resume_text, jd_text):
-
-    resume_skills = extract_skills(resume_text)
-    jd_skills     = extract_skills(jd_text)
-    skill_score   = skill_match_score(resume_skills, jd_skills)
-    matched       = sorted(set(resume_skills) & set(jd_skills))
-    missing       = sorted(set(jd_skills) - set(resume_skills))
+    if resume_skills is None:
+        resume_skills = extract_skills(resume_text)
+    if jd_skills is None:
+        jd_skills     = extract_skills(jd_text)
+    if matched is None:
+        matched   = matched_skills(resume_skills, jd_skills)
+    if skill_score is None:
+        skill_score = skill_match_score(resume_skills, jd_skills)
+    missing       = sorted(set(jd_skills) - set(matched))
 
     if skill_score >= 80:
         sc, guidance, gc, gbg, gborder = "#16a34a", "Strong skill alignment. Resume demonstrates relevant capability coverage.", "#16a34a", "rgba(22,163,74,0.07)", "#86efac"
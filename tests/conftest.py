@@ -0,0 +1,38 @@
+import os
+import sys
+
+# Modules live flat in the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """Relative cache directories (.ats_cache/...) land in a temp dir."""
+    monkeypatch.chdir(tmp_path)
+
+
+class _PluralLemmatizer:
+    """WordNet stand-in: strips a plural "s" (statistics -> statistic)."""
+
+    def lemmatize(self, word):
+        return word[:-1] if word.endswith("s") else word
+
+
+@pytest.fixture
+def engine():
+    """Exact-mode engine with the real cleaning pipeline (NLTK data when
+    it is installed, else a TextNormalizer that mangles the same way)."""
+    from ats_engine import ScoringEngine
+    from text_normalizer import TextNormalizer
+
+    engine = ScoringEngine(skill_mode="exact")
+    try:
+        engine.clean_text("warm up")
+    except Exception:
+        engine._stop_words = {"and", "in", "with", "the", "for", "of"}
+        engine._lemmatizer = _PluralLemmatizer()
+        engine._normalizer = TextNormalizer(engine._stop_words,
+                                            engine._lemmatizer)
+    return engine
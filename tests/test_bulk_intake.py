@@ -0,0 +1,28 @@
+import pytest
+
+from bulk_intake import extract_members
+from test_extraction import HANGING_PDF, RESUME_PDF
+
+
+def _members(**files):
+    return [(name, len(data), (lambda data=data: data))
+            for name, data in files.items()]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_a_hanging_member_times_out_alone(workers):
+    members = _members(**{"a.pdf": RESUME_PDF, "hang.pdf": HANGING_PDF,
+                          "b.pdf": RESUME_PDF})
+    results = {name: (entry, error) for name, entry, error
+               in extract_members(members, workers=workers, timeout=3)}
+
+    assert "Python Engineer" in results["a.pdf"][0]["text"]
+    assert "Python Engineer" in results["b.pdf"][0]["text"]
+    entry, error = results["hang.pdf"]
+    assert entry is None and "exceeded" in error
+
+
+def test_untimed_members_extract_in_the_process_pool():
+    members = _members(**{"a.pdf": RESUME_PDF})
+    [(name, entry, error)] = extract_members(members, workers=1, timeout=None)
+    assert error is None and "Python Engineer" in entry["text"]
@@ -0,0 +1,53 @@
+import os
+import time
+
+import config
+import document_cache
+from document_cache import DocumentCache, document_key
+
+
+def _entry(text):
+    return {"text": text, "sections": {}, "file_type": "pdf",
+            "backend": "pypdf2"}
+
+
+def test_disk_tier_is_opt_in():
+    assert config.DOCUMENT_CACHE_DIR is None
+    cache = DocumentCache(max_entries=4)
+    cache.put(document_key(b"resume"), _entry("text"))
+    assert cache.stats()["disk_entries"] == 0
+
+
+def test_key_changes_with_format_version(monkeypatch):
+    key = document_key(b"resume")
+    monkeypatch.setattr(document_cache, "DOCUMENT_CACHE_VERSION",
+                        document_cache.DOCUMENT_CACHE_VERSION + 1)
+    assert document_key(b"resume") != key
+
+
+def test_stale_format_entries_are_not_served(tmp_path, monkeypatch):
+    cache = DocumentCache(max_entries=4, directory=str(tmp_path))
+    cache.put(document_key(b"resume"), _entry("old sections"))
+
+    monkeypatch.setattr(document_cache, "DOCUMENT_CACHE_VERSION",
+                        document_cache.DOCUMENT_CACHE_VERSION + 1)
+    fresh = DocumentCache(max_entries=4, directory=str(tmp_path))
+    assert fresh.get(document_key(b"resume")) is None
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    cache = DocumentCache(max_entries=1, directory=str(tmp_path),
+                          max_disk_entries=10)
+    keys = [document_key(f"resume {i}".encode()) for i in range(10)]
+    for i, key in enumerate(keys):
+        cache.put(key, _entry(str(i)))
+        os.utime(cache._path(key), (time.time() - 100 + i,) * 2)
+
+    cache.clear_memory()
+    assert cache.get(keys[0])["text"] == "0"   # a disk hit refreshes recency
+
+    cache.put(document_key(b"one more"), _entry("new"))
+    remaining = DocumentCache(directory=str(tmp_path))
+    assert remaining.stats()["disk_entries"] == 9
+    assert remaining.get(keys[0]) is not None
+    assert remaining.get(keys[1]) is None
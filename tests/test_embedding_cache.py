@@ -0,0 +1,129 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from embedding_cache import DiskEmbeddingStore, EmbeddingCache
+
+
+def _vector(i, dim=8):
+    return np.full(dim, i, dtype=np.float32)
+
+
+def _write_rows(args):
+    directory, worker, n = args
+    store = DiskEmbeddingStore(directory)
+    for i in range(n):
+        key = f"w{worker}-{i}"
+        store.put_many([key], [_vector(worker * 1000 + i)])
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    store = DiskEmbeddingStore(str(tmp_path))
+    store.put_many(["a", "b"], np.stack([_vector(1), _vector(2)]))
+    reopened = DiskEmbeddingStore(str(tmp_path))
+    assert len(reopened) == 2
+    np.testing.assert_array_equal(reopened.get("b"), _vector(2))
+
+
+def test_writers_in_separate_processes_do_not_collide(tmp_path):
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(4) as pool:
+        pool.map(_write_rows, [(str(tmp_path), w, 25) for w in range(4)])
+
+    store = DiskEmbeddingStore(str(tmp_path))
+    assert len(store) == 100
+    for w in range(4):
+        for i in range(25):
+            np.testing.assert_array_equal(store.get(f"w{w}-{i}"),
+                                          _vector(w * 1000 + i))
+
+
+def test_disk_tier_is_bounded(tmp_path):
+    store = DiskEmbeddingStore(str(tmp_path), max_rows=10)
+    for i in range(35):
+        store.put_many([f"k{i}"], [_vector(i)])
+        assert len(store) <= 10
+    # The newest rows survive compaction, with their own vectors
+    np.testing.assert_array_equal(store.get("k34"), _vector(34))
+    assert store.get("k0") is None
+    reopened = DiskEmbeddingStore(str(tmp_path), max_rows=10)
+    assert set(reopened._index) == set(store._index)
+    np.testing.assert_array_equal(reopened.get("k33"), _vector(33))
+
+
+def test_stale_reader_picks_up_other_writers(tmp_path):
+    reader = DiskEmbeddingStore(str(tmp_path), max_rows=4)
+    writer = DiskEmbeddingStore(str(tmp_path), max_rows=4)
+    for i in range(9):
+        writer.put_many([f"k{i}"], [_vector(i)])
+    reader.put_many(["mine"], [_vector(99)])
+    np.testing.assert_array_equal(reader.get("mine"), _vector(99))
+    np.testing.assert_array_equal(reader.get("k8"), _vector(8))
+
+
+def test_cache_encodes_only_misses(tmp_path):
+    calls = []
+
+    class Model:
+        def get_sentence_embedding_dimension(self):
+            return 8
+
+        def encode(self, texts, batch_size=32):
+            calls.append(list(texts))
+            return np.stack([_vector(len(t)) for t in texts])
+
+    cache = EmbeddingCache("m", max_entries=2, directory=str(tmp_path))
+    first = cache.encode(Model(), ["a", "bb", "ccc"])
+    cache.clear_memory()
+    again = cache.encode(Model(), ["a", "bb", "ccc"])
+    np.testing.assert_array_equal(first, again)
+    assert len(calls) == 1
+    assert cache.stats()["disk_hits"] == 3
+
+
+class _Model:
+    def __init__(self, dim):
+        self.dim = dim
+
+    def get_sentence_embedding_dimension(self):
+        return self.dim
+
+    def encode(self, texts, batch_size=32):
+        return np.stack([_vector(len(t), self.dim) for t in texts])
+
+
+def test_directory_of_another_width_is_never_read(tmp_path):
+    old = EmbeddingCache("m", directory=str(tmp_path))
+    old.encode(_Model(8), ["a", "bb"])
+
+    cache = EmbeddingCache("m", directory=str(tmp_path))
+    vectors = cache.encode(_Model(4), ["a", "bb"])
+    assert vectors.shape == (2, 4)
+    assert cache.stats()["disk_hits"] == 0
+    # Both widths keep their own store
+    assert EmbeddingCache("m", directory=str(tmp_path)).encode(
+        _Model(8), ["a"]).shape == (1, 8)
+
+
+def test_disk_write_failure_falls_back_to_memory(tmp_path, monkeypatch):
+    cache = EmbeddingCache("m", directory=str(tmp_path))
+    cache._set_dim(4)
+
+    def broken(keys, vectors):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cache._disk, "put_many", broken)
+    with pytest.warns(UserWarning, match="disk full"):
+        first = cache.encode(_Model(4), ["a", "bb"])
+    again = cache.encode(_Model(4), ["a", "bb"])
+    np.testing.assert_array_equal(first, again)
+    assert cache.stats()["hits"] == 2
+
+
+def test_mismatched_vectors_are_not_cached(tmp_path):
+    cache = EmbeddingCache("m", directory=str(tmp_path))
+    cache.put_many(["a"], [_vector(1, 4)])
+    with pytest.raises(ValueError):
+        cache.put_many(["b"], [_vector(2, 8)])
+    assert cache.get("b") is None
@@ -0,0 +1,69 @@
+import io
+import time
+
+import pytest
+
+from extraction import (
+    ExtractionTimeout, extract_document, extract_pdf_pages,
+    extract_pdfminer_pages
+)
+
+
+def _pdf(content):
+    """One-page PDF whose page content stream is `content`."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+              % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+RESUME_PDF = _pdf(b"BT /F1 12 Tf 72 720 Td (Jane Doe - Python Engineer) Tj ET")
+# Millions of text operators: PyPDF2 spends tens of seconds on this page
+HANGING_PDF = _pdf(b"BT /F1 12 Tf 72 720 Td " + b"(x) Tj " * 3_000_000 + b"ET")
+
+
+def test_worker_and_in_process_extraction_agree():
+    in_process = extract_pdf_pages(RESUME_PDF, timeout=None)
+    in_worker = extract_pdf_pages(RESUME_PDF, timeout=30)
+    assert in_process == in_worker
+    assert "Python Engineer" in in_worker[0]
+
+
+def test_hanging_page_is_killed_at_the_deadline():
+    start = time.monotonic()
+    with pytest.raises(ExtractionTimeout):
+        extract_pdf_pages(HANGING_PDF, timeout=1)
+    assert time.monotonic() - start < 10
+
+    # The stuck worker is gone; the next document extracts normally
+    assert "Python Engineer" in extract_pdf_pages(RESUME_PDF, timeout=30)[0]
+
+
+def test_hanging_page_bounds_the_whole_extractor_chain():
+    start = time.monotonic()
+    with pytest.raises(ExtractionTimeout):
+        extract_document(HANGING_PDF, "resume.pdf", timeout=1)
+    assert time.monotonic() - start < 10
+
+
+def test_pdfminer_runs_in_a_worker_under_timeout():
+    pytest.importorskip("pdfminer")
+    pages = extract_pdfminer_pages(RESUME_PDF, timeout=30)
+    assert "Python Engineer" in pages[0]
@@ -0,0 +1,45 @@
+import os
+
+import pytest
+
+pytest.importorskip("rapidfuzz")
+
+from skill_ontology import load_ontology
+
+
+@pytest.fixture(scope="module")
+def ontology():
+    here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return load_ontology(os.path.join(here, "skill_ontology.json"))
+
+
+def test_typos_match(ontology):
+    assert ontology.extract("Built Tablaeu reports", fuzzy=True) == ["tableau"]
+    assert "machine learning" in ontology.extract("machin learning",
+                                                  fuzzy=True)
+
+
+def test_windows_stop_at_punctuation_and_sentence_ends(ontology):
+    windows = ontology.fuzzy_matcher()._windows(
+        "Tuned a neural net, cloud platform. Managed teams"
+    )
+    assert "netcloudplatform" not in windows
+    assert "platformmanaged" not in windows
+    assert "cloudplatform" in windows
+
+
+def test_skip_indices_count_tokens_across_phrases(ontology):
+    # "tablaeu" is token 2 of the whole text, but 0 of its phrase
+    matcher = ontology.fuzzy_matcher()
+    assert "tablaeu" in matcher._windows("Python, SQL; tablaeu")
+    assert "tablaeu" not in matcher._windows("Python, SQL; tablaeu", skip={2})
+    assert "tablaeu" in matcher._windows("Python, SQL; tablaeu", skip={0})
+
+
+@pytest.mark.parametrize("text", [
+    "Designed the database schema",
+    "Shipped each container to staging",
+    "Weekly dashbord reviews",
+])
+def test_generic_words_are_not_fuzzy_skills(ontology, text):
+    assert ontology.extract(text, fuzzy=True) == []
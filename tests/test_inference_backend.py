@@ -0,0 +1,87 @@
+import warnings
+
+import pytest
+
+import ats_engine
+from ats_engine import ScoringEngine
+from config import MODEL_NAME, ONNX_MODEL_FILE
+from inference_backend import (
+    PARITY_TOLERANCE, backend_cache_tag, load_sentence_model, semantic_parity
+)
+
+
+PAIRS = [
+    ("Python developer building pandas data pipelines on AWS",
+     "Data engineer: Python, pandas, SQL, Airflow"),
+    ("Tableau dashboards and Excel reporting for finance stakeholders",
+     "Data analyst with BI dashboard experience"),
+    ("Kubernetes, Terraform and CI/CD for cloud infrastructure",
+     "DevOps engineer, infrastructure as code"),
+    ("Led a team of five nurses in a busy emergency department",
+     "Senior machine learning engineer, PyTorch"),
+]
+
+
+@pytest.fixture(scope="module")
+def reference_model():
+    pytest.importorskip("sentence_transformers")
+    try:
+        model, _ = load_sentence_model(MODEL_NAME, "torch")
+    except Exception as exc:
+        pytest.skip(f"{MODEL_NAME} unavailable: {exc}")
+    return model
+
+
+@pytest.mark.parametrize("backend", ["torch-int8", "onnx"])
+def test_backend_semantic_parity(reference_model, backend):
+    try:
+        model, used = load_sentence_model(MODEL_NAME, backend, ONNX_MODEL_FILE,
+                                          strict=True)
+    except Exception as exc:
+        pytest.skip(f"{backend} backend unavailable: {exc}")
+    assert used == backend
+    assert semantic_parity(reference_model, model, PAIRS) <= PARITY_TOLERANCE
+
+
+def test_onnx_fallback_reports_torch(monkeypatch):
+    st = pytest.importorskip("sentence_transformers")
+
+    class FakeSentenceTransformer:
+        def __init__(self, name, device=None, backend="torch", model_kwargs=None):
+            if backend == "onnx":
+                raise ImportError("optimum is not installed")
+            self.backend = backend
+
+    monkeypatch.setattr(st, "SentenceTransformer", FakeSentenceTransformer)
+    with pytest.warns(UserWarning, match="ONNX backend unavailable"):
+        model, used = load_sentence_model("m", "onnx")
+    assert used == "torch" and model.backend == "torch"
+    with pytest.raises(ImportError):
+        load_sentence_model("m", "onnx", strict=True)
+
+
+def test_engine_retags_embedding_cache_on_fallback(monkeypatch):
+    monkeypatch.setattr(ats_engine, "load_sentence_model",
+                        lambda name, backend, onnx_file: (object(), "torch"))
+    engine = ScoringEngine(model_name="m", backend="onnx")
+    assert engine.embedding_cache.model_name == backend_cache_tag("m", "onnx")
+    onnx_version = engine.version
+
+    engine.model
+    assert engine.active_backend == "torch"
+    assert engine.embedding_cache.model_name == backend_cache_tag("m", "torch")
+    assert engine.version != onnx_version
+
+
+def test_engine_keeps_caller_cache_but_warns(monkeypatch):
+    from embedding_cache import EmbeddingCache
+
+    monkeypatch.setattr(ats_engine, "load_sentence_model",
+                        lambda name, backend, onnx_file: (object(), "torch"))
+    cache = EmbeddingCache(backend_cache_tag("m", "onnx"))
+    engine = ScoringEngine(model_name="m", backend="onnx", embedding_cache=cache)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        engine.model
+    assert engine.embedding_cache is cache
+    assert any("embedding cache is tagged" in str(w.message) for w in caught)
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from ats_engine import ScoringEngine
+from keyword_index import BM25Index, TfidfIndex, tokenize
+
+
+RESUMES = [
+    "python developer pandas numpy data pipeline airflow etl warehouse sql "
+    "postgres built ingestion job reduced latency python scripts testing",
+    "java backend engineer spring microservice kafka rest api postgres "
+    "docker kubernetes design service scale team",
+    "data analyst sql tableau dashboard excel reporting stakeholder kpi "
+    "analysis python pandas weekly report automation",
+    "machine learning engineer python pytorch model deployment feature "
+    "engineering experiment tracking sql data pipeline aws sagemaker",
+    "frontend developer javascript react css design system accessibility "
+    "typescript testing component library",
+    "devops engineer kubernetes docker terraform aws monitoring prometheus "
+    "pipeline automation linux",
+    "data engineer spark python sql aws glue redshift airflow pipeline data "
+    "lake etl batch streaming kafka",
+    "business analyst requirement gathering stakeholder process excel "
+    "powerpoint documentation workshop agile",
+]
+JDS = [
+    "python data engineer pandas sql pipeline aws airflow etl",
+    "data analyst sql tableau excel dashboard reporting stakeholder",
+    "devops engineer kubernetes docker terraform aws",
+]
+
+
+@pytest.mark.parametrize("jd", JDS)
+def test_bm25_and_tfidf_scales_are_comparable(jd):
+    tfidf = TfidfIndex().add_documents(RESUMES).score(jd)
+    bm25 = BM25Index().add_documents(RESUMES).score(jd)
+
+    assert np.argmax(bm25) == np.argmax(tfidf)
+    # Same ballpark for the best match: no collapse towards zero
+    assert 0.7 <= bm25.max() / tfidf.max() <= 1.5
+    assert abs(bm25.mean() - tfidf.mean()) < 0.15
+    assert bm25.min() >= 0.0 and bm25.max() <= 1.0
+
+
+@pytest.mark.parametrize("kind", [TfidfIndex, BM25Index])
+def test_jd_scores_full_marks_against_itself(kind):
+    index = kind().add_documents(RESUMES)
+    for jd in JDS:
+        assert index.similarity(jd, jd) == pytest.approx(1.0, abs=1e-5)
+
+
+def test_bm25_single_pair_without_corpus_falls_back_to_tfidf():
+    bm25 = ScoringEngine(keyword_engine="bm25")
+    tfidf = ScoringEngine(keyword_engine="tfidf")
+    resume, jd = RESUMES[0], JDS[0]
+    assert bm25.keyword_scores(jd, [resume])[0] == pytest.approx(
+        tfidf.keyword_scores(jd, [resume])[0]
+    )
+
+
+def test_bm25_matches_reference_scores():
+    rank_bm25 = pytest.importorskip("rank_bm25")
+
+    index = BM25Index().add_documents(RESUMES)
+    reference = rank_bm25.BM25Okapi([tokenize(t) for t in RESUMES])
+    reference.idf = {term: index._idf(index._df[col])
+                     for term, col in index.vocabulary.items()}
+    for jd in JDS:
+        np.testing.assert_allclose(index.raw_score(jd),
+                                   reference.get_scores(tokenize(jd)),
+                                   rtol=1e-5)
+
+
+def test_tfidf_score_texts_matches_vectorizer_with_unknown_terms():
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    # "rust" and "graphql" are in no indexed document
+    jd = "python data engineer rust pipeline graphql"
+    texts = ["python rust pipeline", "python pipeline " + "foo bar baz " * 5,
+             "java spring"]
+
+    # Fit on the corpus only, over a vocabulary that also holds the new
+    # terms: their df is 0, exactly the index's unknown-term IDF
+    vocabulary = sorted(set(tokenize(" ".join(RESUMES + texts + [jd]))))
+    vectorizer = TfidfVectorizer(vocabulary=vocabulary).fit(RESUMES)
+    expected = cosine_similarity(vectorizer.transform(texts),
+                                 vectorizer.transform([jd])).ravel()
+
+    index = TfidfIndex().add_documents(RESUMES)
+    np.testing.assert_allclose(index.score_texts(texts, jd), expected,
+                               rtol=1e-5)
+    np.testing.assert_allclose(
+        index.score(jd),
+        cosine_similarity(vectorizer.transform(RESUMES),
+                          vectorizer.transform([jd])).ravel(),
+        rtol=1e-5, atol=1e-7,
+    )
+
+
+@pytest.mark.parametrize("kind", [TfidfIndex, BM25Index])
+def test_unknown_terms_count(kind):
+    index = kind().add_documents(RESUMES)
+    jd = "python pandas rust"
+    # A JD requirement absent from the corpus still earns credit...
+    assert (index.similarity("python pandas rust", jd)
+            > index.similarity("python pandas", jd))
+    # ...and padding with unknown words is not free
+    assert (index.similarity("python pandas " + "foo bar baz qux " * 3, jd)
+            < index.similarity("python pandas", jd))
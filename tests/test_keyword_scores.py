@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from ats_engine import ScoringEngine
+
+
+CORPUS = [
+    "python developer pandas numpy data pipeline airflow",
+    "java backend engineer spring microservice kafka",
+    "data analyst sql tableau dashboard excel reporting",
+    "machine learning engineer python pytorch model deployment",
+    "frontend developer javascript react css design system",
+    "devops engineer kubernetes docker terraform aws",
+]
+JD = "python data engineer pandas sql pipeline aws"
+RESUME = "senior python engineer building pandas data pipeline sql aws"
+OTHER = "java developer spring kafka"
+
+
+@pytest.mark.parametrize("engine_kind", ["tfidf", "bm25"])
+def test_corpus_index_scores_do_not_depend_on_batch(engine_kind):
+    engine = ScoringEngine(keyword_engine=engine_kind)
+    engine.keyword_index = engine.new_keyword_index().add_documents(CORPUS)
+
+    alone = engine.keyword_scores(JD, [RESUME])[0]
+    in_batch = engine.keyword_scores(JD, [RESUME, OTHER])[0]
+    assert alone == pytest.approx(in_batch)
+    assert alone > engine.keyword_scores(JD, [OTHER])[0]
+
+
+def test_tfidf_corpus_scores_match_pairwise_similarity():
+    engine = ScoringEngine(keyword_engine="tfidf")
+    engine.keyword_index = engine.new_keyword_index().add_documents(CORPUS)
+    scores = engine.keyword_scores(JD, [RESUME, OTHER])
+    expected = [engine.keyword_index.similarity(t, JD) * 100
+                for t in (RESUME, OTHER)]
+    np.testing.assert_allclose(scores, expected, rtol=1e-5)
@@ -0,0 +1,74 @@
+import threading
+
+from lru_store import LRUStore
+
+
+class _DictTier(LRUStore):
+    """LRUStore over a plain dict standing in for a disk tier."""
+
+    def __init__(self, max_entries):
+        super().__init__(max_entries)
+        self.slow = {}
+
+    def _load(self, key):
+        return self.slow.get(key)
+
+    def _store(self, key, value):
+        self.slow[key] = value
+
+
+def test_evicts_least_recently_used():
+    store = LRUStore(max_entries=2)
+    store.put("a", 1)
+    store.put("b", 2)
+    assert store.get("a") == 1          # "a" is now the most recent
+    store.put("c", 3)
+    assert "b" not in store
+    assert store.get("a") == 1 and store.get("c") == 3
+    assert len(store) == 2
+
+
+def test_counts_hits_and_misses():
+    store = LRUStore(max_entries=4)
+    store.put("a", 1)
+    store.get("a")
+    store.get("missing")
+    stats = store.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["hit_rate"] == 0.5
+    assert stats["memory_entries"] == 1
+
+
+def test_slow_tier_promotes_on_hit():
+    store = _DictTier(max_entries=1)
+    store.put("a", 1)
+    store.put("b", 2)                   # evicts "a" from memory only
+    assert "a" not in store
+    assert store.get("a") == 1
+    assert "a" in store
+    assert store.stats()["disk_hits"] == 1
+
+
+def test_clear_memory_keeps_slow_tier():
+    store = _DictTier(max_entries=4)
+    store.put("a", 1)
+    store.clear_memory()
+    assert len(store) == 0
+    assert store.get("a") == 1
+
+
+def test_concurrent_puts_stay_bounded():
+    store = LRUStore(max_entries=50)
+
+    def work(offset):
+        for i in range(500):
+            store.put(offset + i, i)
+            store.get(offset + i // 2)
+
+    threads = [threading.Thread(target=work, args=(n * 1000,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(store) == 50
+    assert store.hits + store.misses == 2000
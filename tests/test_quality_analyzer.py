@@ -0,0 +1,19 @@
+import pytest
+
+from quality_analyzer import analyze_quality, char_counts
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "Led a team of 5, cut costs 30%",
+    "  Résumé — naïve ٣ digits\n\tend ",
+    "broken \ud800 surrogate 42%",          # lone surrogate from a bad PDF
+])
+def test_char_counts_match_python(text):
+    assert char_counts(text) == (len(text.split()),
+                                 sum(c.isdigit() for c in text),
+                                 text.count("%"))
+
+
+def test_analyze_quality_accepts_lone_surrogates():
+    assert analyze_quality("Python \udc80 engineer")["word_count"] == 3
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from analysis_result import compute_analysis
+
+
+JD = "Python data engineer: pandas, SQL, Airflow pipelines on AWS"
+RESUMES = {
+    "ada": "Python data engineer building pandas and SQL pipelines in "
+           "Airflow on AWS",
+    "bob": "Java backend developer, Spring and Kafka",
+    "cy": "Data analyst: SQL reports and pandas notebooks",
+    "dee": "",
+}
+
+
+def _overlap(jd_text, texts):
+    """Deterministic stand-in for embedding similarity: word overlap."""
+    jd = set(jd_text.lower().split())
+    return np.array([len(jd & set(t.lower().split())) / len(jd)
+                     for t in texts])
+
+
+@pytest.fixture
+def ranker(engine, monkeypatch):
+    monkeypatch.setattr(engine, "semantic_similarities", _overlap)
+    return engine
+
+
+def test_ranking_is_ordered_by_final_score(ranker):
+    table = ranker.rank_resumes(JD, RESUMES)
+    assert list(table["rank"]) == [1, 2, 3, 4]
+    assert list(table["final"]) == sorted(table["final"], reverse=True)
+    assert table["candidate"].iloc[0] == "ada"
+    assert set(table["candidate"]) == set(RESUMES)
+
+
+def test_top_k_keeps_the_best(ranker):
+    full = ranker.rank_resumes(JD, RESUMES)
+    top = ranker.rank_resumes(JD, RESUMES, top_k=2)
+    assert list(top["candidate"]) == list(full["candidate"][:2])
+    assert list(top["rank"]) == [1, 2]
+
+
+def test_empty_resume_scores_zero_and_ranks_last(ranker):
+    table = ranker.rank_resumes(JD, RESUMES)
+    last = table.iloc[-1]
+    assert last["candidate"] == "dee"
+    assert last[["semantic", "keyword", "skill", "final"]].tolist() == [0] * 4
+
+
+def test_list_input_uses_positional_ids(ranker):
+    table = ranker.rank_resumes(JD, list(RESUMES.values()))
+    assert sorted(table["candidate"]) == [0, 1, 2, 3]
+    assert table["candidate"].iloc[0] == 0
+
+
+def test_no_resumes_or_no_jd_gives_an_empty_table(ranker):
+    for table in (ranker.rank_resumes(JD, []), ranker.rank_resumes("", RESUMES)):
+        assert table.empty
+        assert list(table.columns) == ["rank", "candidate", "semantic",
+                                       "keyword", "skill", "quality", "final"]
+
+
+def test_skill_column_matches_single_analysis_in_semantic_mode(ranker,
+                                                                monkeypatch):
+    # Semantic mode: "charts" describes data visualization without naming it
+    ranker.skill_mode = "semantic"
+    monkeypatch.setattr(
+        ranker, "semantic_skill_matches",
+        lambda text, missing: {s: (0.9, "charts") for s in missing
+                               if s == "data visualization"
+                               and "charts" in text.lower()}
+    )
+    jd = "Python and data visualization"
+    resume = "Python scripts and interactive charts"
+
+    single = compute_analysis(ranker, resume, jd).skill_score
+    batch = ranker.rank_resumes(jd, {"a": resume})["skill"].iloc[0]
+    assert single == batch == 100.0
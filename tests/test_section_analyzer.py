@@ -0,0 +1,30 @@
+import pytest
+
+from extraction import _join_pages
+from section_analyzer import extract_sections
+
+
+@pytest.mark.parametrize("header, name", [
+    ("Skills & Tools", "skills"),
+    ("PROJECTS & RESEARCH", "projects"),
+    ("Education and Certifications", "education"),
+    ("- Work Experience & Internships:", "experience"),
+])
+def test_headers_with_qualifiers(header, name):
+    text = f"Jane Doe\n{header}\nPython, SQL\nAwards\nDean's list"
+    sections = extract_sections(text)
+    assert sections[name] == f"{header}\nPython, SQL"
+
+
+def test_qualifier_does_not_turn_sentences_into_headers():
+    text = ("Skills\nPython\n"
+            "Experience and ownership of the data platform at Acme Corp\n")
+    assert "Acme" in extract_sections(text)["skills"]
+
+
+def test_header_opening_a_later_page_is_found():
+    text = _join_pages(["Jane Doe\nExperience\nAcme, 2020-2023",
+                        "Skills & Tools\nPython, SQL"])
+    sections = extract_sections(text)
+    assert sections["experience"] == "Experience\nAcme, 2020-2023"
+    assert sections["skills"] == "Skills & Tools\nPython, SQL"
@@ -0,0 +1,100 @@
+import os
+
+import numpy as np
+import pytest
+
+from semantic_index import FlatIndex, IVFPQIndex, recall_latency_table
+
+
+def _clustered(n, d=32, clusters=20, seed=0):
+    """Unit vectors around a few centres, like sentence embeddings."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(clusters, d))
+    X = centres[rng.integers(clusters, size=n)] + 0.3 * rng.normal(size=(n, d))
+    return (X / np.linalg.norm(X, axis=1, keepdims=True)).astype(np.float32)
+
+
+@pytest.fixture(scope="module")
+def data():
+    X = _clustered(2000)
+    queries = _clustered(50, seed=1)
+    return X, queries, FlatIndex(X)
+
+
+@pytest.fixture(scope="module")
+def index(data):
+    return IVFPQIndex(n_lists=32, n_subvectors=8, n_probe=8).add(data[0])
+
+
+def _recall(index, exact, queries, k=10, **kwargs):
+    hits = [len({i for i, _ in index.search(q, k, **kwargs)}
+                & {i for i, _ in exact.search(q, k)}) / k for q in queries]
+    return float(np.mean(hits))
+
+
+def test_recall_at_10_against_exact_search(index, data):
+    _, queries, exact = data
+    assert _recall(index, exact, queries) >= 0.9
+    # Probing every cell leaves only the re-rank shortlist as a limit
+    assert _recall(index, exact, queries, n_probe=index.n_lists) >= 0.98
+
+
+def test_recall_grows_with_probes(index, data):
+    _, queries, exact = data
+    rows = recall_latency_table(index, exact, queries, probes=(1, 4, 32))
+    recalls = [row["recall"] for row in rows]
+    assert recalls == sorted(recalls)
+    assert recalls[-1] >= 0.98
+
+
+def test_reranked_scores_are_exact_cosines(index, data):
+    X, queries, _ = data
+    for i, score in index.search(queries[0], 5):
+        assert score == pytest.approx(float(X[i] @ queries[0]), abs=1e-5)
+
+
+def test_pq_only_index_still_finds_neighbours(data):
+    X, queries, exact = data
+    pq = IVFPQIndex(n_lists=32, n_subvectors=8, n_probe=8, rerank=False).add(X)
+    assert pq.vectors is None
+    assert _recall(pq, exact, queries) >= 0.5
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load_round_trip(index, data, tmp_path, mmap):
+    _, queries, _ = data
+    index.save(str(tmp_path))
+    loaded = IVFPQIndex.load(str(tmp_path), mmap=mmap)
+
+    assert len(loaded) == len(index)
+    assert loaded.ids == index.ids
+    for q in queries[:10]:
+        assert loaded.search(q, 10) == index.search(q, 10)
+
+
+def test_loaded_index_accepts_new_vectors(data, tmp_path):
+    X, _, _ = data
+    ids = [f"cand-{i}" for i in range(len(X))]
+    IVFPQIndex(n_lists=16, n_subvectors=8).add(X[:1500], ids[:1500]).save(
+        str(tmp_path))
+    loaded = IVFPQIndex.load(str(tmp_path))
+    loaded.add(X[1500:], ids[1500:])
+
+    assert len(loaded) == len(X)
+    assert loaded.search(X[1900], 1)[0][0] == "cand-1900"
+
+
+def test_pq_only_round_trip_has_no_vectors_file(data, tmp_path):
+    X, queries, _ = data
+    pq = IVFPQIndex(n_lists=16, n_subvectors=8, rerank=False).add(X)
+    pq.save(str(tmp_path))
+    assert not os.path.exists(tmp_path / "vectors.npy")
+    loaded = IVFPQIndex.load(str(tmp_path))
+    assert loaded.vectors is None
+    assert loaded.search(queries[0], 10) == pq.search(queries[0], 10)
+
+
+def test_empty_and_invalid_indexes():
+    assert IVFPQIndex().search(np.ones(8, dtype=np.float32)) == []
+    with pytest.raises(ValueError):
+        IVFPQIndex(n_subvectors=5).train(_clustered(100, d=32))
@@ -0,0 +1,69 @@
+import pytest
+
+from benchmarks import _legacy_extract_skills, synthetic_corpus, synthetic_taxonomy
+from skill_matcher import SkillMatcher
+
+
+SKILLS = [
+    "c", "c++", "c#", "r", "go", "java", "javascript", "node.js", "sql",
+    "power bi", "machine learning", "deep learning", "scikit-learn",
+    "ci/cd", "objective-c", "data analysis",
+]
+
+
+@pytest.mark.parametrize("text", [
+    # Word boundaries: a skill inside a longer word is not a match
+    "javascript developer",
+    "research at google, golang rewrite",
+    "rust, ruby and r",
+    "java and javascript",
+    "my python3 scripts",
+    # Multi-word skills
+    "machine learning and deep learning models",
+    "built power bi dashboards. machine learning.",
+    "learning machine",
+    # Punctuation inside a skill
+    "node.js, scikit-learn; ci/cd pipelines",
+    "objective-c for ios",
+    "sql (postgres), go!",
+])
+def test_matches_the_regex_matcher(text):
+    assert SkillMatcher(SKILLS).extract(text) == _legacy_extract_skills(text, SKILLS)
+
+
+# Where the regex loop was wrong, the automaton deliberately differs:
+# "\bc++\b" needs a word character after the "+", and "\bc\b" matches
+# the "c" of "c++"; separators between words were matched literally
+@pytest.mark.parametrize("text, regex, expected", [
+    ("c++ and c# services", ["c"], ["c#", "c++"]),
+    ("wrote c++.", ["c"], ["c++"]),
+    ("c++11 templates", ["c", "c++"], ["c++"]),
+    ("power   bi", [], ["power bi"]),
+    ("machine-learning", [], ["machine learning"]),
+    ("node js", [], ["node.js"]),
+])
+def test_fixes_regex_boundary_bugs(text, regex, expected):
+    assert _legacy_extract_skills(text, SKILLS) == regex
+    assert SkillMatcher(SKILLS).extract(text) == expected
+
+
+def test_punctuation_tokens_are_not_split():
+    matcher = SkillMatcher(SKILLS)
+    assert matcher.extract("c+ and c## only") == []
+    assert matcher.find_all("i know c++ well") == [("c++", 2, 3)]
+
+
+def test_matches_the_regex_matcher_on_a_large_taxonomy():
+    skills = synthetic_taxonomy(2000)
+    corpus = [text.lower() for text in synthetic_corpus(10)]
+    matcher = SkillMatcher(skills)
+    for text in corpus:
+        assert matcher.extract(text) == _legacy_extract_skills(text, skills)
+
+
+def test_labels_and_overlapping_patterns():
+    matcher = SkillMatcher(["node js", "nodejs", "js"],
+                           labels=["javascript", "javascript", "js"])
+    assert matcher.find_all("nodejs and node js") == [
+        ("javascript", 0, 1), ("javascript", 2, 4), ("js", 3, 4),
+    ]
@@ -0,0 +1,52 @@
+import pytest
+
+from analysis_result import compute_analysis
+from cohort_skills import build_skill_matrix
+
+
+RESUME = ("Experienced in NLP with sklearn. Built Node.js services, "
+          "T-SQL reports and CV models. R programming for statistics, "
+          "pandas for data wrangling, pivot tables in Excel.")
+
+
+def test_short_and_lemmatized_aliases_match_through_compute_analysis(engine):
+    analysis = compute_analysis(engine, RESUME, "NLP engineer, T-SQL")
+    skills = set(analysis.resume_skills)
+
+    # Cleaning drops or mangles these tokens; matching must not see that
+    assert "r" not in analysis.resume_clean.split()
+    assert {"natural language processing", "scikit learn", "javascript",
+            "sql", "computer vision", "r language", "statistics", "pandas",
+            "excel"} <= skills
+    assert analysis.matched == ("natural language processing", "sql")
+    assert analysis.skill_score == 100.0
+
+
+def test_skill_matrix_uses_raw_text(engine):
+    jd_skills = engine.extract_skills("Python and NLP; pandas and T-SQL")
+    matrix = build_skill_matrix(engine, {"a": "NLP with pandas and T-SQL in "
+                                              "Python", "b": "Java, Spring"})
+    assert list(matrix.candidate_coverage(jd_skills)) == [1.0, 0.0]
+
+
+@pytest.mark.parametrize("text", [
+    "coding", "cloud", "database", "torch", "analytics", "visualization",
+    "containers", "dashboards", "spreadsheets", "version control", "github",
+    "ML", "JS",
+])
+def test_generic_words_are_not_skills(engine, text):
+    assert engine.extract_skills(f"Strong {text} background") == []
+
+
+def test_tools_do_not_cover_their_category(engine):
+    resume = engine.extract_skills("Excel wizard: VLOOKUP and pivot tables")
+    assert engine.matched_skills(resume, ["data science", "data analysis",
+                                          "excel"]) == ["excel"]
+    assert engine.matched_skills(engine.extract_skills("Git"),
+                                 ["programming"]) == []
+
+
+def test_sub_skills_still_cover_their_parents(engine):
+    resume = engine.extract_skills("PostgreSQL and deep learning")
+    assert engine.matched_skills(resume, ["sql", "machine learning"]) == [
+        "machine learning", "sql"]
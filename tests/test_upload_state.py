@@ -0,0 +1,31 @@
+from streamlit.testing.v1 import AppTest
+
+
+def _app():
+    import streamlit as st
+    from upload import render_upload_page
+
+    # Stands in for LazyTabs: the upload page runs only while it is open
+    if st.radio("Tab", ["Upload", "Other"], key="tab") == "Upload":
+        render_upload_page(None, None)
+
+
+def test_upload_inputs_survive_a_tab_switch():
+    at = AppTest.from_function(_app).run()
+    at.text_area(key="jd_input").input("Senior Python engineer").run()
+
+    at.radio(key="tab").set_value("Other").run()
+    assert "jd_input" not in at.session_state     # widget state dropped
+    at.radio(key="tab").set_value("Upload").run()
+
+    assert at.text_area(key="jd_input").value == "Senior Python engineer"
+
+
+def test_saved_upload_is_offered_again():
+    at = AppTest.from_function(_app)
+    at.session_state["upload_inputs"] = {
+        "jd_text": "", "bulk_folder": "", "bulk_archive": None,
+        "resume": ("jane.pdf", b"%PDF-"),
+    }
+    at.run()
+    assert any("jane.pdf" in c.value for c in at.caption)
@@ -0,0 +1,27 @@
+import pytest
+
+import ats_engine
+from ats_engine import ScoringEngine
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = ScoringEngine()
+    monkeypatch.setattr(engine, "_load_model", lambda: None)
+    return engine
+
+
+def test_warmup_leaves_wordnet_lazy(engine, monkeypatch):
+    monkeypatch.setattr(ats_engine, "load_stopwords", lambda: {"the"})
+    engine.warmup()
+    assert engine.stop_words == {"the"}
+    assert not engine.lemmatizer.loaded
+
+
+def test_warmup_warns_when_stopwords_are_missing(engine, monkeypatch):
+    def missing():
+        raise LookupError("stopwords not provisioned")
+
+    monkeypatch.setattr(ats_engine, "load_stopwords", missing)
+    with pytest.warns(UserWarning, match="stopwords"):
+        engine.warmup()
@@ -0,0 +1,54 @@
+# ======================================================
+# TEXT NORMALIZER - MEMOIZED PIPELINE
+# Compiled Tokenizer + Bounded Lemma Memo + Batch API
+# ======================================================
+
+import re
+from functools import lru_cache
+
+
+# Runs of ASCII letters: identical tokens to the legacy
+# re.sub(r"[^a-zA-Z\s]", " ", text).lower().split()
+_TOKEN = re.compile(r"[A-Za-z]+")
+
+
+class TextNormalizer:
+    """
+    Stopword filtering + lemmatization with a bounded memo table.
+
+    Resume vocabularies are Zipfian, so after a few documents almost
+    every token is answered from the memo instead of WordNet.
+    """
+
+    def __init__(self, stop_words, lemmatizer, memo_size=50000):
+        self.stop_words = stop_words
+        self.lemmatizer = lemmatizer
+        self._normalize_token = lru_cache(maxsize=memo_size)(
+            self._normalize_token_uncached
+        )
+
+    def _normalize_token_uncached(self, token):
+        word = token.lower()
+        if len(word) <= 2 or word in self.stop_words:
+            return ""
+        try:
+            return self.lemmatizer.lemmatize(word)
+        except Exception:
+            return word
+
+    def clean(self, text):
+        if not text:
+            return ""
+        lemmas = map(self._normalize_token, _TOKEN.findall(text))
+        return " ".join(filter(None, lemmas))
+
+    def clean_batch(self, texts):
+        """Normalize many documents, sharing one memo table."""
+        clean = self.clean
+        return [clean(t) for t in texts]
+
+    def memo_info(self):
+        return self._normalize_token.cache_info()
+
+    def clear_memo(self):
+        self._normalize_token.cache_clear()
@@ -2,13 +2,51 @@
 # UPLOAD PAGE - ATS ANALYSIS MODULE
 # ======================================================
 
+import io
+
 import streamlit as st
-import PyPDF2
 
-from ats_engine import compute_scores
+from analytics import (
+    cohort_gap_chart, cohort_cooccurrence_chart, cohort_coverage_chart
+)
+from bulk_intake import zip_members, folder_members, run_bulk_intake
+from config import BULK_INTAKE_ROOT
+from extraction import ExtractionTimeout
+
+
+# LazyTabs skips this page while another tab is open, and Streamlit then
+# drops the state of its widgets. Their values are mirrored here and
+# restored on return, as app.py does for the recruiter sliders.
+_INPUTS = "upload_inputs"
+
+
+def _saved_inputs():
+    return st.session_state.setdefault(_INPUTS, {
+        "jd_text": "", "bulk_folder": "", "resume": None, "bulk_archive": None,
+    })
+
+
+def _remember_upload(key):
+    upload = st.session_state.get(key)
+    _saved_inputs()[key] = ((upload.name, upload.getvalue())
+                            if upload is not None else None)
+
 
+def _kept_upload(label, key, **kwargs):
+    """
+    st.file_uploader whose last upload outlives the widget: returns
+    (filename, bytes) or None. Only a user change (upload or removal)
+    replaces the saved file.
+    """
+    saved = _saved_inputs()
+    upload = st.file_uploader(label, key=key, on_change=_remember_upload,
+                              args=(key,), **kwargs)
+    if upload is None and saved[key] is not None:
+        st.caption(f"Using {saved[key][0]} (uploaded earlier)")
+    return saved[key]
 
-def render_upload_page():
+
+def render_upload_page(engine, documents):
 
     # ── Deep CSS overrides — target every Streamlit internal layer ──
     st.markdown("""
@@ -223,22 +261,28 @@ def render_upload_page():
     <div class="uh">
         <div class="uh-tag">Step 01 &mdash; Input</div>
         <div class="uh-title">Resume Upload &amp; <em>ATS</em> Analysis</div>
-        <div class="uh-sub">Upload your resume PDF and paste the target job description to begin the intelligence analysis.</div>
+        <div class="uh-sub">Upload your resume (PDF or DOCX) and paste the target job description to begin the intelligence analysis.</div>
     </div>
     </body></html>
     """, height=170, scrolling=False)
 
+    saved = _saved_inputs()
     col1, col2 = st.columns(2)
 
     with col1:
-        resume_file = st.file_uploader("Upload Resume (PDF)", type=["pdf"])
+        resume_file = _kept_upload(
+            "Upload Resume (PDF / DOCX)", "resume", type=["pdf", "docx"]
+        )
 
     with col2:
         jd_text = st.text_area(
             "Paste Job Description",
+            value=saved["jd_text"],
             height=220,
-            placeholder="Paste the full job description here…"
+            placeholder="Paste the full job description here…",
+            key="jd_input"
         )
+        saved["jd_text"] = jd_text
 
     st.markdown("<div style='height:0.5rem'></div>", unsafe_allow_html=True)
 
@@ -247,19 +291,20 @@ def render_upload_page():
         if resume_file and jd_text.strip():
 
             try:
-                reader = PyPDF2.PdfReader(resume_file)
+                name, data = resume_file
+                document = documents.extract(data, name)
+            except ExtractionTimeout:
+                st.error("Resume extraction timed out. Try a smaller or text-based file.")
+                st.stop()
             except Exception:
-                st.error("Invalid or corrupted PDF file.")
+                st.error("Invalid or corrupted resume file.")
                 st.stop()
 
-            text = ""
-            for page in reader.pages:
-                if page.extract_text():
-                    text += page.extract_text() + " "
-
-            semantic, keyword, final = compute_scores(text, jd_text)
+            text = document["text"]
+            semantic, keyword, final = engine.compute_scores(text, jd_text)
 
             st.session_state.resume_text = text
+            st.session_state.resume_sections = document["sections"]
             st.session_state.jd_text = jd_text
             st.session_state.scores = (semantic, keyword, final)
             st.session_state.initialized = True
@@ -267,4 +312,84 @@ def render_upload_page():
             st.success("Analysis Completed Successfully ✔")
 
         else:
-            st.error("Both resume and job description are required.")
\ No newline at end of file
+            st.error("Both resume and job description are required.")
+
+    render_bulk_intake(engine, documents, jd_text)
+
+
+def render_bulk_intake(engine, documents, jd_text):
+    """ZIP / folder intake: extract every resume, rank them all at once."""
+
+    saved = _saved_inputs()
+    with st.expander("Bulk Intake — ZIP Archive or Server Folder"):
+        archive = _kept_upload("Upload Resumes (ZIP of PDF / DOCX)",
+                               "bulk_archive", type=["zip"])
+        folder = ""
+        if BULK_INTAKE_ROOT:
+            folder = st.text_input(f"Or Server Folder (under {BULK_INTAKE_ROOT})",
+                                   value=saved["bulk_folder"], key="bulk_folder")
+            saved["bulk_folder"] = folder
+
+        if st.button("Rank All Candidates", key="bulk_run"):
+
+            if not jd_text.strip():
+                st.error("Paste the job description above first.")
+                st.stop()
+
+            try:
+                if archive is not None:
+                    members = zip_members(io.BytesIO(archive[1]))
+                elif folder.strip():
+                    members = folder_members(folder.strip())
+                else:
+                    st.error("Upload a ZIP archive or enter a folder.")
+                    st.stop()
+            except Exception as exc:
+                st.error(f"Could not open the resume source: {exc}")
+                st.stop()
+
+            if not members:
+                st.error("No PDF or DOCX resumes found.")
+                st.stop()
+
+            progress = st.progress(0.0, text=f"Processed 0 / {len(members)}")
+
+            def on_progress(done, total):
+                progress.progress(done / total, text=f"Processed {done} / {total}")
+
+            ranking, failures, cohort = run_bulk_intake(
+                engine, jd_text, members, documents, on_progress=on_progress
+            )
+            st.session_state.bulk_ranking = ranking
+            st.session_state.bulk_failures = failures
+            st.session_state.bulk_cohort = cohort
+            st.session_state.bulk_jd_skills = engine.extract_skills(jd_text)
+
+        if st.session_state.get("bulk_ranking") is not None:
+            ranking = st.session_state.bulk_ranking
+            st.success(f"Ranked {len(ranking)} candidates ✔")
+            st.dataframe(ranking, use_container_width=True, hide_index=True)
+            failures = st.session_state.get("bulk_failures") or []
+            if failures:
+                st.warning(f"{len(failures)} file(s) could not be scored:\n\n"
+                           + "\n".join(f"- {name}: {reason}"
+                                        for name, reason in failures))
+            render_cohort_charts(st.session_state.get("bulk_cohort"),
+                                 st.session_state.get("bulk_jd_skills") or [])
+
+
+def render_cohort_charts(cohort, jd_skills):
+    """Cohort-wide JD skill gaps, coverage spread and co-occurrence."""
+    if cohort is None or not len(cohort) or not jd_skills:
+        return
+    st.plotly_chart(cohort_gap_chart(cohort.gap_table(jd_skills)),
+                    use_container_width=True)
+    c1, c2 = st.columns(2)
+    with c1:
+        st.plotly_chart(cohort_coverage_chart(cohort.candidate_coverage(jd_skills)),
+                        use_container_width=True)
+    with c2:
+        skills, counts = cohort.co_occurrence(jd_skills)
+        if skills:
+            st.plotly_chart(cohort_cooccurrence_chart(skills, counts),
+                            use_container_width=True)